@@ -0,0 +1,36 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+构造耗时基准 - 主窗口、导航栏、内容管理器和各页面的冷启动构造
+"""
+
+import pytest
+
+from src.page_registry import page_registry
+
+
+def _delete_frame(frame):
+    frame.watchdog.stop()
+    frame.deleteLater()
+
+
+def bench_main_frame(bench):
+    from src.main_frame import MainFrame
+    bench(MainFrame, teardown=_delete_frame)
+
+
+def bench_navigation_sidebar(bench):
+    from src.navigation.navigation import NavigationSidebar
+    bench(NavigationSidebar, teardown=lambda sidebar: sidebar.deleteLater())
+
+
+def bench_content_manager(bench, logger):
+    from src.content.content_manager import ContentManager
+    bench(lambda: ContentManager(logger), teardown=lambda manager: manager.deleteLater())
+
+
+@pytest.mark.parametrize("page_id", ["home", "account", "settings", "about"])
+def bench_page_build(bench, logger, page_id):
+    bench(lambda: page_registry.create_page(page_id, logger),
+          teardown=lambda page: page.deleteLater())
@@ -0,0 +1,47 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+翻译目录基准 - 冷启动时打开目录并查找一个页面的文本，以及缓存后的重复查找
+"""
+
+import json
+import os
+
+from src.i18n.catalog import Catalog, LOCALES_DIR
+
+LOCALE = "en"
+
+
+def _home_keys():
+    with open(os.path.join(LOCALES_DIR, f"{LOCALE}.json"), encoding="utf-8") as f:
+        return [key for key in json.load(f) if key.startswith(("home.", "nav.", "common."))]
+
+
+def bench_catalog_cold_lookup(bench, qapp):
+    path = os.path.join(LOCALES_DIR, f"{LOCALE}.cat")
+    keys = _home_keys()
+
+    def run():
+        catalog = Catalog(path)
+        texts = [catalog.get(key) for key in keys]
+        catalog.close()
+        return texts
+
+    bench(run, rounds=50)
+    assert None not in run()
+
+
+def bench_catalog_cached_lookup(bench, qapp):
+    catalog = Catalog(os.path.join(LOCALES_DIR, f"{LOCALE}.cat"))
+    keys = _home_keys()
+
+    def run():
+        for _ in range(100):
+            for key in keys:
+                catalog.get(key)
+
+    try:
+        bench(run, rounds=20)
+    finally:
+        catalog.close()
@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+交互耗时基准 - 主窗口中的主题切换和页面导航
+"""
+
+import itertools
+
+import pytest
+
+from src.theme_manager import theme_manager
+
+
+@pytest.fixture(scope="module")
+def window(qapp):
+    """显示中的完整主窗口，所有页面都已创建"""
+    from src.main_app import create_main_window
+    main_window, sidebar, content_manager = create_main_window()
+    main_window.show()
+    for page_id in sidebar._nav_buttons:
+        sidebar.nav_button(page_id).click()
+        qapp.processEvents()
+    sidebar.nav_button("home").click()
+    qapp.processEvents()
+    yield main_window, sidebar, content_manager
+    main_window.close()
+    main_window.deleteLater()
+    qapp.processEvents()
+
+
+def bench_theme_switch_round_trip(bench, qapp, window):
+    def round_trip():
+        theme_manager.switch_theme()
+        qapp.processEvents()
+        theme_manager.switch_theme()
+        qapp.processEvents()
+
+    bench(round_trip, rounds=10)
+
+
+def bench_navigation_switch(bench, qapp, window):
+    main_window, sidebar, content_manager = window
+    targets = itertools.cycle(list(sidebar._nav_buttons))
+
+    def switch():
+        sidebar.nav_button(next(targets)).click()
+        qapp.processEvents()
+
+    bench(switch, rounds=20)
@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+日志显示组件基准 - 大量写入和大量日志下的主题切换
+
+与主窗口的基准分开，避免主窗口的重绘计入耗时。
+"""
+
+from src.theme_manager import theme_manager
+
+LOG_RECORDS = 10000
+LEVELS = ("DEBUG", "INFO", "INFO", "INFO", "WARNING", "ERROR")
+
+
+def bench_log_widget_ingest(bench, qapp, logger):
+    from src.log_widget import LogWidget
+    messages = [(LEVELS[i % len(LEVELS)], f"2025-01-01 00:00:00 - 第{i}条日志消息，用于测试日志组件的写入性能")
+                for i in range(LOG_RECORDS)]
+
+    def setup():
+        widget = LogWidget(logger)
+        widget.level_combo.setCurrentText("DEBUG")
+        widget.resize(800, 600)
+        widget.show()
+        return widget
+
+    def ingest(widget):
+        for level, message in messages:
+            widget.on_new_log(level, message)
+        qapp.processEvents()
+        return widget
+
+    bench(ingest, setup=setup, teardown=lambda widget: widget.deleteLater(), rounds=3, warmup=1)
+
+
+def bench_log_widget_theme_switch(bench, qapp, logger):
+    from src.log_widget import LogWidget
+    widget = LogWidget(logger)
+    widget.level_combo.setCurrentText("DEBUG")
+    widget.resize(800, 600)
+    widget.show()
+    for i in range(LOG_RECORDS):
+        level = LEVELS[i % len(LEVELS)]
+        widget.on_new_log(level, f"{level} - 第{i}条日志消息")
+    qapp.processEvents()
+
+    def round_trip():
+        theme_manager.switch_theme()
+        qapp.processEvents()
+        theme_manager.switch_theme()
+        qapp.processEvents()
+
+    try:
+        bench(round_trip, rounds=10)
+    finally:
+        widget.deleteLater()
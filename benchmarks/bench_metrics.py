@@ -0,0 +1,51 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+指标导出基准 - 热路径上的分片计数和直方图记录，以及抓取时的输出耗时
+
+记录时另一个线程持续抓取，确认抓取不会拖慢记录线程。
+"""
+
+import threading
+
+from src.perf.prometheus import MetricsRegistry
+
+OBSERVATIONS = 100000
+
+
+def bench_metrics_hot_path(bench, qapp):
+    registry = MetricsRegistry()
+    counter = registry.counter("bench_total", "基准计数", ("level",))
+    histogram = registry.histogram("bench_seconds", "基准耗时", ("page",))
+    stop = threading.Event()
+
+    def scrape():
+        while not stop.is_set():
+            registry.render()
+            stop.wait(0.005)
+
+    scraper = threading.Thread(target=scrape, daemon=True)
+    scraper.start()
+
+    def run():
+        for number in range(OBSERVATIONS):
+            counter.inc("INFO")
+            histogram.observe(number * 1e-6, "home")
+
+    try:
+        bench(run, rounds=5)
+    finally:
+        stop.set()
+        scraper.join()
+    assert "bench_seconds_count" in registry.render()
+
+
+def bench_metrics_render(bench, qapp):
+    registry = MetricsRegistry()
+    histogram = registry.histogram("bench_seconds", "基准耗时", ("page", "kind"))
+    for page in range(20):
+        for kind in ("built", "reused"):
+            histogram.observe(0.01, f"page_{page}", kind)
+
+    bench(registry.render, rounds=20)
@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+会话回放基准 - 全速回放一段合成的使用会话
+
+会话依次访问各页面、在主页点击按钮和刷新、切换主题，并穿插日志突发，
+与录制的真实会话使用相同的回放器。
+"""
+
+import pytest
+
+from src.perf.session import SessionPlayer, EVENT_NAVIGATE, EVENT_THEME, EVENT_CLICK, EVENT_LOGS
+
+
+def synthetic_session(pages):
+    """生成合成会话的操作列表"""
+    events = []
+    for cycle in range(4):
+        for page_id in pages:
+            events.append({"type": EVENT_NAVIGATE, "page": page_id})
+        events.append({"type": EVENT_NAVIGATE, "page": "home"})
+        events.append({"type": EVENT_CLICK, "page": "home", "button": "action_button_0", "index": 0})
+        events.append({"type": EVENT_CLICK, "page": "home", "button": "refresh_system_info_button", "index": 0})
+        events.append({"type": EVENT_LOGS, "levels": {"INFO": 150, "WARNING": 30}})
+        events.append({"type": EVENT_THEME, "theme": "dark" if cycle % 2 == 0 else "light"})
+    for time_index, event in enumerate(events):
+        event["t"] = time_index * 0.05
+    return events
+
+
+@pytest.fixture(scope="module")
+def window(qapp):
+    """显示中的完整主窗口"""
+    from src.main_app import create_main_window
+    main_window, sidebar, content_manager = create_main_window()
+    main_window.show()
+    qapp.processEvents()
+    yield main_window, sidebar, content_manager
+    main_window.close()
+    main_window.deleteLater()
+    qapp.processEvents()
+
+
+def bench_session_replay_fast(bench, window):
+    main_window, sidebar, content_manager = window
+    events = synthetic_session([page_id for page_id in sidebar._nav_buttons if page_id != "home"])
+    player = SessionPlayer(main_window, sidebar, content_manager, profile_paint=False)
+
+    def replay():
+        result = player.play(events, speed=0)
+        assert result.skipped == 0
+        return result
+
+    bench(replay, rounds=5)
@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+共享日志文件基准 - 多个进程同时高速写入同一个日志文件
+
+每轮结束后检查文件中的每一行都是完整的记录，且每个进程的记录没有缺失或重复。
+"""
+
+import os
+import re
+import multiprocessing
+
+PROCESSES = 6
+RECORDS = 3000
+# 记录长度在几十字节到几十KB之间变化，超过页大小和管道缓冲区
+PAYLOAD_SIZES = (40, 300, 4000, 9000, 30000)
+
+LINE_PATTERN = re.compile(r"^\S+ \S+ - INFO - p(\d+) #(\d+) (x*) end$")
+
+
+def _write_records(path: str, process: int):
+    """子进程：通过共享文件输出端写入记录"""
+    import logging
+    from src.log_sinks import SharedFileSink
+
+    sink = SharedFileSink("shared", path, block_timeout=None)
+    logger = logging.getLogger(f"bench_shared_{process}")
+    logger.propagate = False
+    logger.addHandler(sink)
+    logger.setLevel(logging.INFO)
+    for number in range(RECORDS):
+        payload = "x" * PAYLOAD_SIZES[(number + process) % len(PAYLOAD_SIZES)]
+        logger.info("p%d #%d %s end", process, number, payload)
+    sink.close(timeout=None)
+
+
+def _check_file(path: str):
+    """检查没有交错或截断的行"""
+    seen = {process: set() for process in range(PROCESSES)}
+    with open(path, "r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            match = LINE_PATTERN.match(line.rstrip("\n"))
+            assert match, f"第{line_number}行不完整: {line[:80]!r}"
+            process, number, payload = int(match.group(1)), int(match.group(2)), match.group(3)
+            assert len(payload) == PAYLOAD_SIZES[(number + process) % len(PAYLOAD_SIZES)], \
+                f"第{line_number}行长度不正确"
+            assert number not in seen[process], f"第{line_number}行重复"
+            seen[process].add(number)
+    for process, numbers in seen.items():
+        assert len(numbers) == RECORDS, f"进程{process}缺少{RECORDS - len(numbers)}条记录"
+
+
+def bench_shared_file_concurrent_append(bench, tmp_path):
+    context = multiprocessing.get_context("spawn")
+    paths = iter(str(tmp_path / f"shared_{index}.log") for index in range(1000))
+
+    def run(path):
+        workers = [context.Process(target=_write_records, args=(path, process)) for process in range(PROCESSES)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+            assert worker.exitcode == 0
+        return path
+
+    def check(path):
+        _check_file(path)
+        os.remove(path)
+
+    bench(run, setup=lambda: next(paths), teardown=check, rounds=3, warmup=1)
@@ -0,0 +1,242 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+基准测试配置 - 无界面运行环境、计时工具和基线对比
+
+运行::
+
+    python -m pytest benchmarks                          # 有基线时与基线对比
+    python -m pytest benchmarks --bench-save-baseline    # 保存为新基线
+    python -m pytest benchmarks --bench-compare          # 必须与基线对比，缺少基线时失败
+    python -m pytest benchmarks --bench-max-regression 0.5
+"""
+
+import os
+import sys
+import gc
+import json
+import time
+import platform
+import tempfile
+import statistics
+
+# 必须在导入Qt之前设置
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+# 探测缓存等数据写入临时目录，不影响本机的数据目录
+os.environ.setdefault("CURSOR_PRO_MAX_HOME", tempfile.mkdtemp(prefix="cursor_pro_max_bench_"))
+# 主窗口的日志和归档写入当前目录下的logs，同样放到临时目录中
+os.chdir(os.environ["CURSOR_PRO_MAX_HOME"])
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import pytest
+from PySide6.QtCore import QCoreApplication, QEvent
+from PySide6.QtWidgets import QApplication
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(BENCH_DIR, "baseline.json")
+DEFAULT_OUTPUT = os.path.join(BENCH_DIR, "results", "latest.json")
+
+
+def pytest_addoption(parser):
+    """基准测试命令行参数"""
+    group = parser.getgroup("bench", "GUI基准测试")
+    group.addoption("--bench-rounds", type=int, default=None,
+                    help="每项测试的计时次数（覆盖测试中的默认值）")
+    group.addoption("--bench-warmup", type=int, default=None,
+                    help="每项测试的预热次数（覆盖测试中的默认值）")
+    group.addoption("--bench-baseline", default=DEFAULT_BASELINE,
+                    help="基线文件路径")
+    group.addoption("--bench-save-baseline", action="store_true",
+                    help="将本次结果保存为基线，不做对比")
+    group.addoption("--bench-compare", action="store_true",
+                    help="必须与基线对比：基线文件不存在时报错，基线中没有的测试失败")
+    group.addoption("--bench-max-regression", type=float, default=0.25,
+                    help="允许的中位数变慢比例，默认0.25即25%%")
+    group.addoption("--bench-min-delta-ms", type=float, default=0.5,
+                    help="变慢的绝对值小于该值（毫秒）时不算回退，避免亚毫秒级的噪声")
+    group.addoption("--bench-output", default=DEFAULT_OUTPUT,
+                    help="结果文件路径")
+
+
+def settle():
+    """处理挂起的事件和延迟删除"""
+    app = QCoreApplication.instance()
+    app.processEvents()
+    QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+    app.processEvents()
+
+
+def summarize(samples_ns):
+    """计算中位数和离散程度，单位毫秒"""
+    samples = sorted(ns / 1e6 for ns in samples_ns)
+    if len(samples) >= 2:
+        q1, _, q3 = statistics.quantiles(samples, n=4)
+        stdev = statistics.stdev(samples)
+    else:
+        q1 = q3 = samples[0]
+        stdev = 0.0
+    return {
+        "rounds": len(samples),
+        "median_ms": statistics.median(samples),
+        "mean_ms": statistics.fmean(samples),
+        "min_ms": samples[0],
+        "max_ms": samples[-1],
+        "stdev_ms": stdev,
+        "iqr_ms": q3 - q1,
+    }
+
+
+class BenchmarkSession:
+    """整个测试会话的结果和基线"""
+
+    def __init__(self, config):
+        self.config = config
+        self.results = {}
+        self.baseline = {}
+        self.required = config.getoption("--bench-compare")
+        path = config.getoption("--bench-baseline")
+        if self.required and config.getoption("--bench-save-baseline"):
+            raise pytest.UsageError("--bench-compare 不能与 --bench-save-baseline 同时使用")
+        if self.required and not os.path.exists(path):
+            raise pytest.UsageError(f"没有找到基线文件: {path}，先用 --bench-save-baseline 在本机生成")
+        if not config.getoption("--bench-save-baseline") and os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                self.baseline = json.load(f).get("benchmarks", {})
+
+    def compare(self, name, stats):
+        """与基线对比，返回回退说明，没有回退时返回None"""
+        base = self.baseline.get(name)
+        if base is None:
+            if self.required:
+                return f"{name} 没有基线，先用 --bench-save-baseline 更新基线"
+            return None
+        stats["baseline_median_ms"] = base["median_ms"]
+        stats["change"] = stats["median_ms"] / base["median_ms"] - 1 if base["median_ms"] else 0.0
+        delta = stats["median_ms"] - base["median_ms"]
+        if (stats["change"] > self.config.getoption("--bench-max-regression")
+                and delta > self.config.getoption("--bench-min-delta-ms")):
+            return (f"{name} 变慢 {stats['change']:.0%}: 中位数 {stats['median_ms']:.2f}ms，"
+                    f"基线 {base['median_ms']:.2f}ms")
+        return None
+
+    def document(self):
+        """结果文件内容"""
+        return {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "machine": {
+                "platform": platform.platform(),
+                "python": platform.python_version(),
+                "processor": platform.processor() or platform.machine(),
+            },
+            "benchmarks": self.results,
+        }
+
+    def write(self):
+        """写入结果文件，需要时同时写入基线"""
+        if not self.results:
+            return
+        paths = [self.config.getoption("--bench-output")]
+        if self.config.getoption("--bench-save-baseline"):
+            paths.append(self.config.getoption("--bench-baseline"))
+        document = self.document()
+        for path in paths:
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(document, f, ensure_ascii=False, indent=2)
+
+
+class Benchmark:
+    """
+    单项测试的计时器
+
+    每轮依次执行 setup()、计时执行 fn(setup的返回值)、teardown(fn的返回值)，
+    只有 fn 计入耗时。预热轮次的结果被丢弃。
+    """
+
+    def __init__(self, session: BenchmarkSession, name: str):
+        self.session = session
+        self.name = name
+        self.stats = None
+
+    def __call__(self, fn, setup=None, teardown=None, rounds=10, warmup=2):
+        config = self.session.config
+        rounds = config.getoption("--bench-rounds") or rounds
+        if config.getoption("--bench-warmup") is not None:
+            warmup = config.getoption("--bench-warmup")
+
+        samples = []
+        for index in range(warmup + rounds):
+            arg = setup() if setup is not None else None
+            settle()
+            gc.collect()
+            gc.disable()
+            try:
+                start = time.perf_counter_ns()
+                result = fn(arg) if setup is not None else fn()
+                elapsed = time.perf_counter_ns() - start
+            finally:
+                gc.enable()
+            if teardown is not None:
+                teardown(result)
+            settle()
+            if index >= warmup:
+                samples.append(elapsed)
+
+        self.stats = summarize(samples)
+        self.session.results[self.name] = self.stats
+        regression = self.session.compare(self.name, self.stats)
+        if regression:
+            pytest.fail(regression, pytrace=False)
+        return self.stats
+
+
+def pytest_configure(config):
+    config._bench_session = BenchmarkSession(config)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    bench_session = getattr(session.config, "_bench_session", None)
+    if bench_session is not None:
+        bench_session.write()
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """在结尾输出结果表"""
+    results = config._bench_session.results
+    if not results:
+        return
+    terminalreporter.section("基准测试结果")
+    terminalreporter.write_line(f"{'中位数(ms)':>11} {'IQR(ms)':>9} {'最小(ms)':>9} {'最大(ms)':>9} "
+                                f"{'次数':>5} {'基线变化':>8}  测试")
+    for name, stats in results.items():
+        change = f"{stats['change']:+.0%}" if "change" in stats else "-"
+        terminalreporter.write_line(
+            f"{stats['median_ms']:>11.3f} {stats['iqr_ms']:>9.3f} {stats['min_ms']:>9.3f} "
+            f"{stats['max_ms']:>9.3f} {stats['rounds']:>5} {change:>8}  {name}")
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """全局QApplication"""
+    app = QApplication.instance() or QApplication([])
+    app.setStyle("Fusion")
+    yield app
+    from src.jobs import job_manager
+    job_manager.shutdown()
+
+
+@pytest.fixture
+def bench(request, qapp):
+    """计时器，结果以测试名为键保存"""
+    return Benchmark(request.config._bench_session, request.node.name)
+
+
+@pytest.fixture(scope="session")
+def logger(qapp):
+    """不输出到控制台和文件的日志器，保留GUI信号"""
+    from src.logger import Logger
+    return Logger(name="Benchmark", console=False, file=False, gui=True, level="debug")
@@ -0,0 +1,28 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+应用路径模块 - 提供应用程序数据目录
+"""
+
+import os
+
+# 设置该环境变量可以指定数据目录
+ENV_VAR = "CURSOR_PRO_MAX_HOME"
+
+
+def app_data_dir() -> str:
+    """
+    应用程序数据目录，不存在时自动创建
+
+    Returns:
+        目录路径，默认为 ~/.cursor_pro_max
+    """
+    path = os.environ.get(ENV_VAR) or os.path.join(os.path.expanduser("~"), ".cursor_pro_max")
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def app_data_path(filename: str) -> str:
+    """数据目录中的文件路径"""
+    return os.path.join(app_data_dir(), filename)
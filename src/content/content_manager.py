@@ -0,0 +1,183 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+内容管理模块 - 按需创建并切换页面，超出预算时回收最久未使用的隐藏页面
+"""
+
+from collections import OrderedDict
+from typing import Dict, Optional, Set, Tuple
+
+from PySide6.QtWidgets import QStackedWidget, QWidget
+from PySide6.QtCore import Slot
+
+from src.logger import Logger
+from src.page_registry import page_registry
+from src.settings import settings, LAST_PAGE
+from src.i18n.catalog import tr
+from src.perf.nav_latency import navigation_timer
+from src.perf.tracer import tracer
+from src.content.page_state import estimate_page_cost, capture_state, restore_state
+
+
+class ContentManager(QStackedWidget):
+    """内容管理器"""
+
+    # 默认预算：近似内存字节数和部件数量
+    DEFAULT_MEMORY_BUDGET = 64 * 1024 * 1024
+    DEFAULT_WIDGET_BUDGET = 5000
+
+    # 常驻页面：主页持有日志显示组件和日志存储，回收会丢失界面中的日志和导出数据
+    PINNED_PAGES = ("home",)
+
+    def __init__(self, logger: Logger, initial_page: str = "home",
+                 memory_budget: int = DEFAULT_MEMORY_BUDGET,
+                 widget_budget: int = DEFAULT_WIDGET_BUDGET, parent=None):
+        """
+        初始化内容管理器
+
+        Args:
+            logger: 日志管理器，内容管理器使用其中的 nav 组件日志器，各页面使用以页面标识命名的组件日志器
+            initial_page: 初始页面标识
+            memory_budget: 已创建页面的近似内存预算（字节），0表示不限制
+            widget_budget: 已创建页面的部件数量预算，0表示不限制
+            parent: 父窗口
+        """
+        super().__init__(parent)
+        self.logger = logger.child("nav")
+        self._root_logger = logger.root
+        self.memory_budget = memory_budget
+        self.widget_budget = widget_budget
+
+        # 已创建的页面，按最近使用顺序排列（末尾为最近使用）
+        self._pages: "OrderedDict[str, QWidget]" = OrderedDict()
+        # 页面占用估算，页面标识 -> (近似字节数, 部件数量)
+        self._page_costs: Dict[str, Tuple[int, int]] = {}
+        # 已回收页面的状态快照
+        self._snapshots: Dict[str, bytes] = {}
+        # 不允许回收的页面
+        self._pinned: Set[str] = set(self.PINNED_PAGES)
+        self._current_page: Optional[str] = None
+
+        # 记录每次导航的耗时
+        navigation_timer.navigation_measured.connect(self._on_navigation_measured)
+
+        # 只创建初始页面，其余页面在首次打开时创建
+        self.set_current_page(initial_page)
+
+    @property
+    def current_page(self) -> Optional[str]:
+        """当前页面标识"""
+        return self._current_page
+
+    def page(self, page_id: str) -> Optional[QWidget]:
+        """获取已创建的页面，未创建或已回收时返回None"""
+        return self._pages.get(page_id)
+
+    def pin_page(self, page_id: str, pinned: bool = True):
+        """设置页面是否常驻（不参与回收）"""
+        if pinned:
+            self._pinned.add(page_id)
+        else:
+            self._pinned.discard(page_id)
+
+    def set_budget(self, memory_budget: Optional[int] = None, widget_budget: Optional[int] = None):
+        """调整预算并立即检查是否需要回收"""
+        if memory_budget is not None:
+            self.memory_budget = memory_budget
+        if widget_budget is not None:
+            self.widget_budget = widget_budget
+        self._enforce_budget()
+
+    def usage(self) -> Tuple[int, int]:
+        """返回已创建页面的近似总内存和总部件数量"""
+        memory = sum(cost[0] for cost in self._page_costs.values())
+        widgets = sum(cost[1] for cost in self._page_costs.values())
+        return memory, widgets
+
+    def _ensure_page(self, page_id: str) -> Optional[QWidget]:
+        """获取页面，必要时通过注册表创建"""
+        widget = self._pages.get(page_id)
+        if widget is not None:
+            return widget
+
+        info = page_registry.get(page_id)
+        if info is None:
+            self.logger.warning("未知页面: %s", page_id)
+            return None
+
+        with self.logger.span("build_page", page=page_id):
+            widget = info.load_factory()(self._root_logger.child(page_id))
+        self._pages[page_id] = widget
+        self.addWidget(widget)
+
+        # 恢复回收前的状态
+        snapshot = self._snapshots.pop(page_id, None)
+        if snapshot is not None:
+            restore_state(widget, snapshot)
+            self.logger.debug("页面 %s 已从快照重建", page_id)
+
+        self._page_costs[page_id] = estimate_page_cost(widget)
+        return widget
+
+    @Slot(str)
+    @tracer.span(category="nav")
+    def set_current_page(self, page_name):
+        """设置当前页面"""
+        built = page_name not in self._pages
+        widget = self._ensure_page(page_name)
+        if widget is None:
+            return
+
+        # 离开的页面在隐藏时重新估算，因为其内容可能在显示期间增长
+        previous = self._current_page
+        if previous is not None and previous != page_name and previous in self._pages:
+            self._page_costs[previous] = estimate_page_cost(self._pages[previous])
+
+        already_current = self.currentWidget() is widget and self.isVisible()
+        navigation_timer.page_shown(page_name, widget, built, already_current)
+
+        self.setCurrentWidget(widget)
+        self._current_page = page_name
+        self._pages.move_to_end(page_name)
+        self.logger.info("切换到页面: %s", tr(page_registry.get(page_name).label))
+        # 下次启动时打开该页面
+        settings.set(LAST_PAGE, page_name)
+
+        self._enforce_budget()
+
+    def _on_navigation_measured(self, page_id, latency_ms, built):
+        """记录导航耗时"""
+        self.logger.debug("页面 %s 切换耗时 %.1fms (%s)", page_id, latency_ms, "新建" if built else "复用")
+
+    def _over_budget(self) -> bool:
+        """是否超出预算"""
+        memory, widgets = self.usage()
+        if self.memory_budget and memory > self.memory_budget:
+            return True
+        if self.widget_budget and widgets > self.widget_budget:
+            return True
+        return False
+
+    def _enforce_budget(self):
+        """按最近最少使用顺序回收隐藏页面，直到回到预算内"""
+        if not self._over_budget():
+            return
+
+        for page_id in list(self._pages):
+            if page_id == self._current_page or page_id in self._pinned:
+                continue
+            self._evict_page(page_id)
+            if not self._over_budget():
+                break
+
+    def _evict_page(self, page_id: str):
+        """回收页面，保留状态快照以便透明重建"""
+        widget = self._pages.pop(page_id)
+        memory, widgets = self._page_costs.pop(page_id, (0, 0))
+        self._snapshots[page_id] = capture_state(widget)
+
+        self.removeWidget(widget)
+        widget.deleteLater()
+
+        self.logger.debug("回收页面 %s: 约%dKB, %d个部件", page_id, memory // 1024, widgets)
@@ -0,0 +1,266 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+诊断页面模块 - 实时显示运行时性能指标
+"""
+
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel, QPushButton
+from PySide6.QtCore import Qt, QTimer, QPointF
+from PySide6.QtGui import QPainter, QPen, QColor, QPolygonF
+
+from src.logger import Logger
+from src.jobs import job_manager
+from src.theme_manager import theme_manager
+from src.i18n.catalog import tr
+from src.perf.metrics import metrics_sampler, RingBuffer, HEAP_BYTES
+from src.perf.nav_latency import navigation_timer
+from src.perf.signal_profiler import signal_profiler
+from src.perf.tracer import tracer, export_trace
+
+
+def _format_rate(value):
+    return f"{value:.1f}/s"
+
+
+def _format_bytes(value):
+    return f"{value / (1024 * 1024):.1f} MB"
+
+
+def _format_heap(value):
+    # 按采样时的单位显示，未开启tracemalloc时为内存块数量
+    if metrics_sampler.heap_unit == HEAP_BYTES:
+        return _format_bytes(value)
+    return tr("diagnostics.blocks", count=int(value))
+
+
+def _format_count(value):
+    return f"{int(value)}"
+
+
+def _format_ms(value):
+    return f"{value:.1f} ms"
+
+
+# 显示的指标：(指标名称, 标题的消息标识, 格式化函数)
+METRICS = (
+    ("log_rate.DEBUG", "diagnostics.metric.log_debug", _format_rate),
+    ("log_rate.INFO", "diagnostics.metric.log_info", _format_rate),
+    ("log_rate.WARNING", "diagnostics.metric.log_warning", _format_rate),
+    ("log_rate.ERROR", "diagnostics.metric.log_error", _format_rate),
+    ("gui_log_queue", "diagnostics.metric.gui_log_queue", _format_count),
+    ("rss", "diagnostics.metric.rss", _format_bytes),
+    ("python_heap", "diagnostics.metric.python_heap", _format_heap),
+    ("qobjects", "diagnostics.metric.qobjects", _format_count),
+    ("event_loop_lag", "diagnostics.metric.event_loop_lag", _format_ms),
+    ("theme_switch", "diagnostics.metric.theme_switch", _format_ms),
+    ("navigation", "diagnostics.metric.navigation", _format_ms),
+)
+
+
+class Sparkline(QWidget):
+    """迷你折线图，直接用QPainter绘制环形缓冲区中的数据"""
+
+    def __init__(self, ring: RingBuffer, parent=None):
+        super().__init__(parent)
+        self.ring = ring
+        self.color = QColor(theme_manager.get_theme_colors()['accent_color'])
+        self.setFixedHeight(24)
+        self.setMinimumWidth(120)
+
+    def paintEvent(self, event):
+        """绘制折线"""
+        values = self.ring.values()
+        if len(values) < 2:
+            return
+
+        low = min(values)
+        span = (max(values) - low) or 1.0
+        width = self.width() - 2
+        height = self.height() - 2
+        step = width / (self.ring.capacity - 1)
+        # 数据靠右对齐，最新的采样点在最右侧
+        offset = width - step * (len(values) - 1)
+
+        polygon = QPolygonF([
+            QPointF(1 + offset + i * step, 1 + height - (value - low) / span * height)
+            for i, value in enumerate(values)
+        ])
+
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(QPen(self.color, 1.5))
+        painter.drawPolyline(polygon)
+        painter.end()
+
+
+class DiagnosticsPage(QWidget):
+    """诊断页面"""
+
+    # 刷新间隔（毫秒）
+    REFRESH_INTERVAL = 1000
+
+    def __init__(self, logger: Logger, parent=None):
+        super().__init__(parent)
+        self.logger = logger
+        self._value_labels = {}
+        self._sparklines = []
+
+        # 只在页面可见时采样
+        self._timer = QTimer(self)
+        self._timer.setInterval(self.REFRESH_INTERVAL)
+        self._timer.timeout.connect(self._refresh)
+
+        self._setup_ui()
+
+        signal_profiler.connect(theme_manager.theme_changed, self._on_theme_changed,
+                                "ThemeManager.theme_changed")
+
+        self.logger.info("诊断页面已加载")
+
+    def _setup_ui(self):
+        """设置UI"""
+        colors = theme_manager.get_theme_colors()
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(20, 20, 20, 20)
+        layout.setSpacing(12)
+
+        # 标题
+        title = QLabel(tr("diagnostics.title"))
+        title.setStyleSheet("font-size: 18px; font-weight: bold;")
+        layout.addWidget(title)
+
+        # 指标表格
+        self.metrics_panel = QWidget()
+        self.metrics_panel.setObjectName("metrics_panel")
+        grid = QGridLayout(self.metrics_panel)
+        grid.setContentsMargins(12, 12, 12, 12)
+        grid.setHorizontalSpacing(16)
+        grid.setVerticalSpacing(6)
+        grid.setColumnStretch(2, 1)
+
+        for row, (key, name, _) in enumerate(METRICS):
+            name_label = QLabel(tr(name))
+            value_label = QLabel("-")
+            value_label.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+            value_label.setMinimumWidth(90)
+            sparkline = Sparkline(metrics_sampler.buffer(key))
+
+            grid.addWidget(name_label, row, 0)
+            grid.addWidget(value_label, row, 1)
+            grid.addWidget(sparkline, row, 2)
+
+            self._value_labels[key] = value_label
+            self._sparklines.append(sparkline)
+
+        layout.addWidget(self.metrics_panel)
+
+        # 各页面导航耗时
+        self.navigation_label = QLabel()
+        self.navigation_label.setTextFormat(Qt.TextFormat.PlainText)
+        layout.addWidget(self.navigation_label)
+
+        # 跟踪
+        trace_layout = QHBoxLayout()
+        self.trace_button = QPushButton()
+        self.trace_button.setObjectName("trace_button")
+        self.trace_button.setCheckable(True)
+        self.trace_button.setChecked(tracer.enabled)
+        self.trace_button.toggled.connect(self._on_trace_toggled)
+        self.export_trace_button = QPushButton(tr("diagnostics.export_trace"))
+        self.export_trace_button.setObjectName("export_trace_button")
+        self.export_trace_button.clicked.connect(self._on_export_trace)
+        self.trace_label = QLabel()
+        trace_layout.addWidget(self.trace_button)
+        trace_layout.addWidget(self.export_trace_button)
+        trace_layout.addWidget(self.trace_label, 1)
+        layout.addLayout(trace_layout)
+        self._update_trace_status()
+
+        layout.addStretch(1)
+
+        self._apply_theme(colors)
+
+    def _apply_theme(self, colors):
+        """应用主题颜色"""
+        self.metrics_panel.setStyleSheet(f"""
+            #metrics_panel {{
+                background-color: {colors['card_bg']};
+                border-radius: 4px;
+            }}
+        """)
+        accent = QColor(colors['accent_color'])
+        for sparkline in self._sparklines:
+            sparkline.color = accent
+            sparkline.update()
+
+    def _on_theme_changed(self, theme_name):
+        """主题变更处理函数"""
+        self._apply_theme(theme_manager.get_theme_colors())
+
+    def showEvent(self, event):
+        """页面显示时开始采样"""
+        super().showEvent(event)
+        metrics_sampler.restart()
+        self._refresh()
+        self._timer.start()
+
+    def hideEvent(self, event):
+        """页面隐藏时停止采样"""
+        super().hideEvent(event)
+        self._timer.stop()
+
+    def _update_trace_status(self):
+        """更新跟踪按钮和区间数量"""
+        self.trace_button.setText(tr("diagnostics.trace_stop") if tracer.enabled else tr("diagnostics.trace_start"))
+        if tracer.dropped:
+            self.trace_label.setText(tr("diagnostics.trace_status_dropped", count=len(tracer), dropped=tracer.dropped))
+        else:
+            self.trace_label.setText(tr("diagnostics.trace_status", count=len(tracer)))
+
+    def _on_trace_toggled(self, checked):
+        """开始或停止跟踪"""
+        tracer.enable(checked)
+        self._update_trace_status()
+
+    def _on_export_trace(self):
+        """在后台导出跟踪数据到日志目录"""
+        events, thread_names = tracer.snapshot()
+        if not events:
+            self.logger.warning("没有可导出的跟踪数据")
+            return
+        job_manager.submit("diagnostics.export_trace", export_trace,
+                           self.logger.log_dir, events, thread_names,
+                           on_result=self._on_trace_exported,
+                           on_error=self._on_trace_export_error)
+
+    def _on_trace_exported(self, path):
+        """导出完成"""
+        self.logger.info("已导出跟踪数据: %s", path)
+
+    def _on_trace_export_error(self, message):
+        """导出出错"""
+        self.logger.error("跟踪数据导出失败: %s", message)
+
+    def _refresh(self):
+        """采样并刷新显示"""
+        watchdog = getattr(self.window(), "watchdog", None)
+        values = metrics_sampler.sample(self.logger, watchdog)
+
+        for key, _, formatter in METRICS:
+            if key in values:
+                self._value_labels[key].setText(formatter(values[key]))
+        for sparkline in self._sparklines:
+            sparkline.update()
+
+        lines = []
+        for page_id, kinds in navigation_timer.stats().items():
+            summary = kinds["all"]
+            lines.append(tr("diagnostics.navigation_line", page=page_id, count=summary["count"],
+                            p50=summary["p50"], p95=summary["p95"], p99=summary["p99"]))
+        if lines:
+            self.navigation_label.setText(tr("diagnostics.navigation_title") + "\n" + "\n".join(lines))
+        else:
+            self.navigation_label.setText(tr("diagnostics.navigation_empty"))
+        self._update_trace_status()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+页面状态模块 - 估算页面占用并保存/恢复页面的轻量状态快照
+"""
+
+import json
+from typing import Dict, Tuple
+
+from PySide6.QtWidgets import (
+    QWidget, QAbstractScrollArea, QAbstractButton, QAbstractSlider, QScrollBar,
+    QComboBox, QLineEdit, QTextEdit, QPlainTextEdit, QSpinBox, QDoubleSpinBox
+)
+from PySide6.QtCore import QTimer
+
+# 每个部件的近似内存开销（字节），包括C++私有数据和样式表缓存
+WIDGET_COST = 2048
+
+# 可编辑文本框快照的最大长度，超出部分不保存
+MAX_TEXT_LENGTH = 64 * 1024
+
+
+def estimate_page_cost(page: QWidget) -> Tuple[int, int]:
+    """
+    估算页面的内存占用和部件数量
+
+    Args:
+        page: 页面部件
+
+    Returns:
+        (近似字节数, 部件数量)
+    """
+    widgets = page.findChildren(QWidget)
+    widget_count = len(widgets) + 1
+    memory = widget_count * WIDGET_COST
+
+    # 文本文档按字符数估算（UTF-16存储）
+    for widget in widgets:
+        if isinstance(widget, (QTextEdit, QPlainTextEdit)):
+            memory += widget.document().characterCount() * 2
+
+    return memory, widget_count
+
+
+def _widget_keys(page: QWidget):
+    """生成页面内部件的稳定键，优先使用objectName，否则使用同类序号"""
+    counters: Dict[str, int] = {}
+    for widget in page.findChildren(QWidget):
+        class_name = type(widget).__name__
+        index = counters.get(class_name, 0)
+        counters[class_name] = index + 1
+        name = widget.objectName()
+        yield (f"{class_name}:{name}" if name else f"{class_name}#{index}"), widget
+
+
+def capture_state(page: QWidget) -> bytes:
+    """
+    采集页面状态快照（滚动位置、输入内容等）
+
+    页面可以实现 save_state() 返回可JSON序列化的对象来替代默认采集。
+
+    Returns:
+        序列化后的快照
+    """
+    if hasattr(page, "save_state"):
+        return json.dumps({"custom": page.save_state()}, separators=(",", ":")).encode("utf-8")
+
+    state = {}
+    for key, widget in _widget_keys(page):
+        if isinstance(widget, QAbstractScrollArea):
+            v_value = widget.verticalScrollBar().value()
+            h_value = widget.horizontalScrollBar().value()
+            if v_value or h_value:
+                state[key + "@scroll"] = [v_value, h_value]
+
+        if isinstance(widget, QLineEdit):
+            if widget.text():
+                state[key] = widget.text()
+        elif isinstance(widget, (QTextEdit, QPlainTextEdit)):
+            if not widget.isReadOnly():
+                text = widget.toPlainText()
+                if text and len(text) <= MAX_TEXT_LENGTH:
+                    state[key] = text
+        elif isinstance(widget, QAbstractButton):
+            if widget.isCheckable():
+                state[key] = widget.isChecked()
+        elif isinstance(widget, QComboBox):
+            state[key] = widget.currentIndex()
+        elif isinstance(widget, (QAbstractSlider, QSpinBox, QDoubleSpinBox)):
+            # 滚动区域自带的滚动条已经在上面单独处理
+            if not isinstance(widget, QScrollBar):
+                state[key] = widget.value()
+
+    return json.dumps(state, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def restore_state(page: QWidget, snapshot: bytes):
+    """
+    将快照恢复到重新创建的页面
+
+    滚动位置要等布局完成后才有效，因此延迟到下一次事件循环恢复。
+    """
+    state = json.loads(snapshot.decode("utf-8"))
+
+    if "custom" in state and hasattr(page, "restore_state"):
+        page.restore_state(state["custom"])
+        return
+
+    scroll_values = []
+    for key, widget in _widget_keys(page):
+        scroll = state.get(key + "@scroll")
+        if scroll is not None and isinstance(widget, QAbstractScrollArea):
+            scroll_values.append((widget, scroll))
+
+        if key not in state:
+            continue
+        value = state[key]
+        if isinstance(widget, QLineEdit):
+            widget.setText(value)
+        elif isinstance(widget, (QTextEdit, QPlainTextEdit)):
+            widget.setPlainText(value)
+        elif isinstance(widget, QAbstractButton):
+            widget.setChecked(value)
+        elif isinstance(widget, QComboBox):
+            widget.setCurrentIndex(value)
+        elif isinstance(widget, (QAbstractSlider, QSpinBox, QDoubleSpinBox)):
+            widget.setValue(value)
+
+    if scroll_values:
+        def apply_scroll():
+            for widget, (v_value, h_value) in scroll_values:
+                widget.verticalScrollBar().setValue(v_value)
+                widget.horizontalScrollBar().setValue(h_value)
+        QTimer.singleShot(0, page, apply_scroll)
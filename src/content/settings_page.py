@@ -0,0 +1,201 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+设置页面模块 - 修改主题、日志级别等持久化设置
+"""
+
+from PySide6.QtWidgets import (
+    QWidget, QVBoxLayout, QFormLayout, QHBoxLayout, QLabel, QComboBox, QCheckBox, QPushButton, QLineEdit
+)
+
+from src.logger import Logger, parse_component_levels
+from src.settings import (
+    settings, THEME, LOG_LEVEL, LOG_AUTO_SCROLL, LOG_COMPONENT_LEVELS, LOG_DURABILITY, LOG_ARCHIVE, UI_LOCALE
+)
+from src.theme_manager import theme_manager
+from src.i18n.catalog import translator, tr
+from src.perf.signal_profiler import signal_profiler
+
+# 主题的显示名称（消息标识）
+THEME_LABELS = {"light": "settings.theme.light", "dark": "settings.theme.dark"}
+
+# 日志文件持久性模式的显示名称（消息标识）
+DURABILITY_LABELS = {
+    "fast": "settings.durability.fast",
+    "safe": "settings.durability.safe",
+    "durable": "settings.durability.durable",
+}
+
+# "恢复默认设置"影响的设置项，窗口位置和上次的页面不在此列
+RESETTABLE = (THEME, LOG_LEVEL, LOG_AUTO_SCROLL, LOG_COMPONENT_LEVELS, LOG_DURABILITY, LOG_ARCHIVE, UI_LOCALE)
+
+
+class SettingsPage(QWidget):
+    """设置页面，控件的值始终与设置存储一致"""
+
+    def __init__(self, logger: Logger, parent=None):
+        super().__init__(parent)
+        self.logger = logger
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(20, 20, 20, 20)
+
+        # 标题
+        title = QLabel(tr("settings.title"))
+        title.setStyleSheet("font-size: 18px; font-weight: bold;")
+        layout.addWidget(title)
+
+        form = QFormLayout()
+        form.setContentsMargins(0, 10, 0, 10)
+        form.setSpacing(12)
+
+        # 主题
+        self.theme_combo = QComboBox()
+        for name in settings.definitions()[THEME].choices:
+            self.theme_combo.addItem(tr(THEME_LABELS.get(name, name)), name)
+        self.theme_combo.setFixedWidth(160)
+        form.addRow(tr("settings.theme"), self.theme_combo)
+
+        # 日志级别
+        self.level_combo = QComboBox()
+        self.level_combo.addItems(settings.definitions()[LOG_LEVEL].choices)
+        self.level_combo.setFixedWidth(160)
+        form.addRow(tr("settings.log_level"), self.level_combo)
+
+        # 组件日志级别
+        self.component_levels_edit = QLineEdit()
+        self.component_levels_edit.setPlaceholderText(tr("settings.component_levels_placeholder"))
+        self.component_levels_edit.setToolTip(tr("settings.component_levels_tip"))
+        self.component_levels_edit.setFixedWidth(320)
+        form.addRow(tr("settings.component_levels"), self.component_levels_edit)
+
+        # 日志文件持久性
+        self.durability_combo = QComboBox()
+        for name in settings.definitions()[LOG_DURABILITY].choices:
+            self.durability_combo.addItem(tr(DURABILITY_LABELS.get(name, name)), name)
+        self.durability_combo.setToolTip(tr("settings.durability_tip"))
+        self.durability_combo.setFixedWidth(220)
+        form.addRow(tr("settings.durability"), self.durability_combo)
+
+        # 自动滚动
+        self.auto_scroll_check = QCheckBox(tr("settings.auto_scroll"))
+        self.auto_scroll_check.setObjectName("auto_scroll_check")
+        form.addRow(tr("settings.log_display"), self.auto_scroll_check)
+
+        # 日志归档
+        self.archive_check = QCheckBox(tr("settings.archive_check"))
+        self.archive_check.setObjectName("archive_check")
+        self.archive_check.setToolTip(tr("settings.archive_tip"))
+        form.addRow(tr("settings.archive"), self.archive_check)
+
+        # 界面语言，显示名称取自各语言目录
+        self.locale_combo = QComboBox()
+        for name in settings.definitions()[UI_LOCALE].choices:
+            catalog = translator.catalog(name)
+            self.locale_combo.addItem((catalog and catalog.get("locale.name")) or name, name)
+        self.locale_combo.setToolTip(tr("settings.restart_tip"))
+        self.locale_combo.setFixedWidth(160)
+        form.addRow(tr("settings.locale"), self.locale_combo)
+
+        layout.addLayout(form)
+
+        # 恢复默认
+        button_layout = QHBoxLayout()
+        reset_button = QPushButton(tr("settings.reset"))
+        reset_button.setObjectName("reset_button")
+        reset_button.clicked.connect(self._on_reset)
+        button_layout.addWidget(reset_button)
+        button_layout.addStretch(1)
+        layout.addLayout(button_layout)
+
+        # 设置文件位置
+        path_label = QLabel(tr("settings.file", path=settings.path))
+        path_label.setStyleSheet("font-size: 12px; color: gray;")
+        layout.addWidget(path_label)
+
+        # 占位空间
+        layout.addStretch(1)
+
+        self._sync_from_settings()
+        self.theme_combo.currentIndexChanged.connect(self._on_theme_selected)
+        self.level_combo.currentTextChanged.connect(self._on_level_selected)
+        self.auto_scroll_check.toggled.connect(self._on_auto_scroll_toggled)
+        self.component_levels_edit.editingFinished.connect(self._on_component_levels_edited)
+        self.durability_combo.currentIndexChanged.connect(self._on_durability_selected)
+        self.locale_combo.currentIndexChanged.connect(self._on_locale_selected)
+        self.archive_check.toggled.connect(self._on_archive_toggled)
+
+        # 其他地方修改设置时同步控件
+        signal_profiler.connect(settings.value_changed, self._on_setting_changed,
+                                "SettingsStore.value_changed")
+
+        self.logger.info("设置页面已加载")
+
+    def _sync_from_settings(self):
+        """按当前设置更新控件，不触发控件的信号"""
+        widgets = (self.theme_combo, self.level_combo, self.auto_scroll_check, self.component_levels_edit,
+                   self.durability_combo, self.archive_check, self.locale_combo)
+        for widget in widgets:
+            widget.blockSignals(True)
+        self.theme_combo.setCurrentIndex(self.theme_combo.findData(settings.get(THEME)))
+        self.level_combo.setCurrentText(settings.get(LOG_LEVEL))
+        self.auto_scroll_check.setChecked(settings.get(LOG_AUTO_SCROLL))
+        self.component_levels_edit.setText(settings.get(LOG_COMPONENT_LEVELS))
+        self.durability_combo.setCurrentIndex(self.durability_combo.findData(settings.get(LOG_DURABILITY)))
+        self.archive_check.setChecked(settings.get(LOG_ARCHIVE))
+        self.locale_combo.setCurrentIndex(self.locale_combo.findData(settings.get(UI_LOCALE)))
+        for widget in widgets:
+            widget.blockSignals(False)
+
+    def _on_setting_changed(self, key, value):
+        """设置变更时同步控件"""
+        if key in RESETTABLE:
+            self._sync_from_settings()
+
+    def _on_theme_selected(self, index):
+        """切换主题，主题变更后由主窗口保存到设置"""
+        theme_manager.set_theme(self.theme_combo.itemData(index))
+
+    def _on_level_selected(self, level):
+        """修改日志级别"""
+        settings.set(LOG_LEVEL, level)
+
+    def _on_durability_selected(self, index):
+        """修改日志文件的持久性模式"""
+        settings.set(LOG_DURABILITY, self.durability_combo.itemData(index))
+
+    def _on_archive_toggled(self, checked):
+        """开启或关闭日志归档，重启后生效"""
+        settings.set(LOG_ARCHIVE, checked)
+
+    def _on_locale_selected(self, index):
+        """修改界面语言，重启后生效"""
+        settings.set(UI_LOCALE, self.locale_combo.itemData(index))
+
+    def _on_auto_scroll_toggled(self, checked):
+        """修改自动滚动"""
+        settings.set(LOG_AUTO_SCROLL, checked)
+
+    def _on_component_levels_edited(self):
+        """修改组件日志级别，保存规范化后的文本"""
+        levels = parse_component_levels(self.component_levels_edit.text())
+        text = ", ".join(f"{component}={level}" for component, level in levels.items())
+        self.component_levels_edit.setText(text)
+        settings.set(LOG_COMPONENT_LEVELS, text)
+
+    def _on_reset(self):
+        """恢复默认设置"""
+        default_theme = settings.definitions()[THEME].default
+        if theme_manager.current_theme != default_theme:
+            theme_manager.set_theme(default_theme)
+        for key in RESETTABLE:
+            settings.reset(key)
+        self.logger.info("已恢复默认设置")
+
+    def save_state(self):
+        """控件的值来自设置，回收时不需要保存快照"""
+        return {}
+
+    def restore_state(self, state):
+        """控件已在创建时按设置初始化"""
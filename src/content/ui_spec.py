@@ -0,0 +1,237 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+界面描述模块 - 把声明式的界面描述编译为构建指令，按主题缓存样式表
+
+界面描述是嵌套的字典，每个节点的 "type" 决定创建的部件或布局::
+
+    {"type": "panel", "panel": "card", "layout": "vbox", "children": [
+        {"type": "label", "text": "home.system_info", "role": "card_title"},
+        {"type": "label", "text": "home.usage", "args": {"used": 26, "total": 150}},
+        {"type": "button", "text": "common.refresh", "role": "refresh", "size": (50, 24),
+         "on_click": "_on_refresh"},
+        {"type": "stretch"},
+    ]}
+
+标签、按钮的 "text" 是消息标识，构建时通过 tr() 翻译为当前语言，
+"args" 为文本中占位符的值；不是消息标识的文本原样显示。
+
+描述只编译一次，之后每次构建页面只是按顺序执行指令。部件不单独设置样式表，
+而是通过 "role"/"panel" 属性匹配页面级样式表中的规则；样式表按主题渲染一次后缓存，
+切换主题时只需为页面设置一次样式表，不需要遍历子部件。
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QProgressBar
+
+from src.theme_manager import theme_manager
+from src.i18n.catalog import tr
+
+# 构建指令
+OP_BEGIN_LAYOUT = 0   # 创建布局并加入当前布局，成为当前布局
+OP_BEGIN_PANEL = 1    # 创建面板部件及其布局，成为当前布局
+OP_END = 2            # 回到上一层布局
+OP_WIDGET = 3         # 创建部件并加入当前布局
+OP_STRETCH = 4        # 加入伸展空间
+OP_CUSTOM = 5         # 调用所属对象的方法，由其向当前布局添加内容
+
+Instruction = Tuple
+
+
+def _make_layout(kind: str, margins, spacing):
+    layout = QHBoxLayout() if kind == "hbox" else QVBoxLayout()
+    layout.setContentsMargins(*margins)
+    if spacing is not None:
+        layout.setSpacing(spacing)
+    return layout
+
+
+def _make_label(owner, node):
+    label = QLabel(tr(node["text"], **node.get("args", {})))
+    if node.get("word_wrap"):
+        label.setWordWrap(True)
+    return label
+
+
+def _make_button(owner, node):
+    button = QPushButton(tr(node["text"], **node.get("args", {})))
+    handler = node.get("on_click")
+    if handler is not None:
+        if isinstance(handler, tuple):
+            method, *args = handler
+            callback = getattr(owner, method)
+            button.clicked.connect(lambda checked=False: callback(*args))
+        else:
+            button.clicked.connect(getattr(owner, handler))
+    return button
+
+
+def _make_progress(owner, node):
+    bar = QProgressBar()
+    bar.setRange(*node.get("range", (0, 100)))
+    bar.setValue(node.get("value", 0))
+    bar.setTextVisible(node.get("text_visible", False))
+    return bar
+
+
+# 部件类型 -> 工厂函数 factory(所属对象, 节点)
+WIDGET_FACTORIES: Dict[str, Callable[[Any, dict], QWidget]] = {
+    "label": _make_label,
+    "button": _make_button,
+    "progress": _make_progress,
+}
+
+
+def register_widget_type(type_name: str, factory: Callable[[Any, dict], QWidget]):
+    """注册自定义部件类型，工厂函数的参数为 (所属对象, 节点)"""
+    WIDGET_FACTORIES[type_name] = factory
+
+
+def _margins(node, default=(0, 0, 0, 0)):
+    margins = node.get("margins", default)
+    return (margins,) * 4 if isinstance(margins, int) else tuple(margins)
+
+
+class CompiledSpec:
+    """编译后的界面描述"""
+
+    __slots__ = ("root_layout", "instructions")
+
+    def __init__(self, root_layout: Optional[Tuple], instructions: List[Instruction]):
+        self.root_layout = root_layout
+        self.instructions = instructions
+
+    def build(self, owner, root: QWidget):
+        """
+        在 root 上创建布局并构建所有部件
+
+        Args:
+            owner: 所属对象，"id" 对应的部件保存为它的属性，"on_click"、"build" 是它的方法名
+            root: 根部件
+        """
+        kind, margins, spacing = self.root_layout
+        layout = _make_layout(kind, margins, spacing)
+        root.setLayout(layout)
+        self.build_into(owner, layout)
+
+    def build_into(self, owner, layout):
+        """在已有的布局中构建所有部件"""
+        stack = []
+        for instruction in self.instructions:
+            op = instruction[0]
+            if op == OP_WIDGET:
+                _, factory, node, widget_id, properties, size, stretch, alignment = instruction
+                widget = factory(owner, node)
+                for name, value in properties:
+                    widget.setProperty(name, value)
+                if size is not None:
+                    width, height = size
+                    if width and height:
+                        widget.setFixedSize(width, height)
+                    elif height:
+                        widget.setFixedHeight(height)
+                    elif width:
+                        widget.setFixedWidth(width)
+                if widget_id:
+                    widget.setObjectName(widget_id)
+                    setattr(owner, widget_id, widget)
+                if alignment is not None:
+                    layout.addWidget(widget, stretch, alignment)
+                else:
+                    layout.addWidget(widget, stretch)
+            elif op == OP_BEGIN_LAYOUT:
+                _, kind, margins, spacing, stretch = instruction
+                child = _make_layout(kind, margins, spacing)
+                layout.addLayout(child, stretch)
+                stack.append(layout)
+                layout = child
+            elif op == OP_BEGIN_PANEL:
+                _, kind, margins, spacing, widget_id, properties, stretch = instruction
+                panel = QWidget()
+                for name, value in properties:
+                    panel.setProperty(name, value)
+                if widget_id:
+                    panel.setObjectName(widget_id)
+                    setattr(owner, widget_id, panel)
+                layout.addWidget(panel, stretch)
+                stack.append(layout)
+                layout = _make_layout(kind, margins, spacing)
+                panel.setLayout(layout)
+            elif op == OP_END:
+                layout = stack.pop()
+            elif op == OP_STRETCH:
+                layout.addStretch(instruction[1])
+            elif op == OP_CUSTOM:
+                getattr(owner, instruction[1])(layout)
+
+
+def _compile_children(children, instructions: List[Instruction]):
+    for node in children:
+        node_type = node.get("type", "label")
+        stretch = node.get("stretch", 0)
+        if node_type in ("vbox", "hbox"):
+            instructions.append((OP_BEGIN_LAYOUT, node_type, _margins(node), node.get("spacing"), stretch))
+            _compile_children(node.get("children", ()), instructions)
+            instructions.append((OP_END,))
+        elif node_type == "panel":
+            properties = (("panel", node["panel"]),) if "panel" in node else ()
+            instructions.append((OP_BEGIN_PANEL, node.get("layout", "vbox"), _margins(node),
+                                 node.get("spacing"), node.get("id"), properties, stretch))
+            _compile_children(node.get("children", ()), instructions)
+            instructions.append((OP_END,))
+        elif node_type == "stretch":
+            instructions.append((OP_STRETCH, node.get("factor", 0)))
+        elif node_type == "custom":
+            instructions.append((OP_CUSTOM, node["build"]))
+        else:
+            factory = WIDGET_FACTORIES.get(node_type)
+            if factory is None:
+                raise ValueError(f"未知的界面节点类型: {node_type}")
+            properties = (("role", node["role"]),) if "role" in node else ()
+            alignment = {"right": Qt.AlignRight, "left": Qt.AlignLeft,
+                         "center": Qt.AlignCenter}.get(node.get("align"))
+            instructions.append((OP_WIDGET, factory, node, node.get("id"), properties,
+                                 node.get("size"), stretch, alignment))
+
+
+def compile_spec(spec: dict) -> CompiledSpec:
+    """
+    编译界面描述
+
+    Args:
+        spec: 根节点，包含 layout（vbox 或 hbox）、margins、spacing 和 children
+
+    Returns:
+        编译结果，可以多次构建
+    """
+    instructions: List[Instruction] = []
+    _compile_children(spec.get("children", ()), instructions)
+    return CompiledSpec((spec.get("layout", "vbox"), _margins(spec), spec.get("spacing")), instructions)
+
+
+class ThemeStyleSheet:
+    """
+    按主题渲染并缓存的样式表
+
+    模板中的 {名称} 替换为主题颜色，derive(颜色, 主题名) 可以补充计算得到的值。
+    """
+
+    def __init__(self, template: str, derive: Optional[Callable[[dict, str], dict]] = None):
+        self.template = template
+        self.derive = derive
+        self._cache: Dict[str, str] = {}
+
+    def render(self, theme_name: Optional[str] = None) -> str:
+        """渲染指定主题（默认为当前主题）的样式表"""
+        if theme_name is None:
+            theme_name = theme_manager.current_theme
+        text = self._cache.get(theme_name)
+        if text is None:
+            colors = dict(theme_manager.THEMES.get(theme_name, theme_manager.THEMES["light"]))
+            if self.derive is not None:
+                colors.update(self.derive(colors, theme_name))
+            text = self._cache[theme_name] = self.template.format(**colors)
+        return text
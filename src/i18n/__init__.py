@@ -0,0 +1,3 @@
+"""
+界面文本翻译模块
+"""
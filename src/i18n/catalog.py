@@ -0,0 +1,286 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+翻译目录模块 - 界面文本的紧凑二进制目录，按语言在首次使用时映射到内存
+
+界面文本通过消息标识引用::
+
+    tr("nav.home")
+    tr("home.account_status", email=email, sign_up_type=sign_up_type)
+
+每种语言的源文件是 locales/语言.json（{消息标识: 文本}），编译为同目录下的 语言.cat::
+
+    文件头    "CPMC", 格式版本(u16), 保留(u16), 条目数(u32), 字符串区偏移(u32),
+              源文件大小(u64), 源文件修改时间(u64, 纳秒)
+    索引      条目数 × (标识哈希 u32, 标识偏移 u32, 文本偏移 u32, 标识长度 u16, 文本长度 u16)，按哈希排序
+    字符串区  UTF-8 编码的标识和文本，按消息标识排序，同一页面（标识前缀相同）的文本相邻
+
+目录在该语言第一次 tr() 时才打开，以只读方式映射到内存；查找时二分搜索索引，
+只读取和解码用到的文本，解码结果缓存在字典中。未使用的语言不会被打开，
+不占用启动时间和内存。当前语言缺少的文本回退到源语言（简体中文），仍然缺少时显示消息标识。
+
+修改源文件后运行 python -m src.i18n.catalog 重新编译。加载时只用 os.stat 比较源文件的
+大小和修改时间与目录中记录的是否一致，不读取源文件；不一致时（包括检出代码后修改时间变化）
+编译一次到数据目录，之后的启动直接使用。
+"""
+
+import os
+import sys
+import json
+import mmap
+import zlib
+import struct
+import argparse
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from src.app_paths import app_data_path
+
+MAGIC = b"CPMC"
+FORMAT_VERSION = 2
+HEADER = struct.Struct("<4sHHIIQQ")
+ENTRY = struct.Struct("<IIIHH")
+
+# 源文件和编译结果所在目录
+LOCALES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "locales")
+
+# 源语言，其他语言缺少的文本回退到该语言
+SOURCE_LOCALE = "zh_CN"
+
+
+def compile_catalog(messages: Dict[str, str], source_stat: Tuple[int, int] = (0, 0)) -> bytes:
+    """
+    编译翻译目录
+
+    Args:
+        messages: {消息标识: 文本}
+        source_stat: 源文件的 (大小, 修改时间纳秒)，用于判断编译结果是否过期
+
+    Returns:
+        目录文件内容
+    """
+    pool = bytearray()
+    entries = []
+    for key in sorted(messages):
+        key_bytes = key.encode("utf-8")
+        value_bytes = messages[key].encode("utf-8")
+        if len(key_bytes) > 0xFFFF or len(value_bytes) > 0xFFFF:
+            raise ValueError(f"消息过长: {key}")
+        key_offset = len(pool)
+        pool += key_bytes
+        value_offset = len(pool)
+        pool += value_bytes
+        entries.append((zlib.crc32(key_bytes), key_offset, value_offset, len(key_bytes), len(value_bytes)))
+    # 哈希相同的条目相邻，查找时依次比较标识
+    entries.sort(key=lambda entry: entry[0])
+
+    pool_offset = HEADER.size + ENTRY.size * len(entries)
+    data = bytearray(HEADER.pack(MAGIC, FORMAT_VERSION, 0, len(entries), pool_offset, *source_stat))
+    for entry in entries:
+        data += ENTRY.pack(*entry)
+    data += pool
+    return bytes(data)
+
+
+def compile_file(source: str, target: str) -> int:
+    """
+    把源文件编译为目录文件
+
+    Returns:
+        消息数量
+    """
+    stat = _stat(source)
+    with open(source, "r", encoding="utf-8") as f:
+        messages = json.load(f)
+    data = compile_catalog(messages, stat)
+    # 先写临时文件再替换，其他进程不会映射到写了一半的文件
+    temp_path = f"{target}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(data)
+    os.replace(temp_path, target)
+    return len(messages)
+
+
+def _stat(path: str) -> Tuple[int, int]:
+    """文件的 (大小, 修改时间纳秒)"""
+    stat = os.stat(path)
+    return stat.st_size, stat.st_mtime_ns
+
+
+def _source_stat(path: str) -> Optional[Tuple[int, int]]:
+    """目录文件中记录的源文件 (大小, 修改时间纳秒)，文件不存在或无效时返回None"""
+    try:
+        with open(path, "rb") as f:
+            magic, version, _, _, _, size, mtime_ns = HEADER.unpack(f.read(HEADER.size))
+    except (OSError, struct.error):
+        return None
+    if magic != MAGIC or version != FORMAT_VERSION:
+        return None
+    return size, mtime_ns
+
+
+class Catalog:
+    """映射到内存的翻译目录"""
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: 目录文件路径
+
+        Raises:
+            ValueError: 不是有效的目录文件
+        """
+        self.path = path
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _, self.count, self._pool, *self.source_stat = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self._map.close()
+            raise ValueError(f"不是有效的翻译目录: {path}")
+        # 消息标识 -> 文本，未找到的标识为None
+        self._cache: Dict[str, Optional[str]] = {}
+
+    def __len__(self):
+        return self.count
+
+    def get(self, key: str) -> Optional[str]:
+        """查找文本，不存在时返回None"""
+        try:
+            return self._cache[key]
+        except KeyError:
+            value = self._cache[key] = self._lookup(key)
+            return value
+
+    def _lookup(self, key: str) -> Optional[str]:
+        """二分搜索索引，只读取匹配条目的标识和文本"""
+        key_bytes = key.encode("utf-8")
+        target = zlib.crc32(key_bytes)
+        data = self._map
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            if ENTRY.unpack_from(data, HEADER.size + middle * ENTRY.size)[0] < target:
+                low = middle + 1
+            else:
+                high = middle
+        for index in range(low, self.count):
+            key_hash, key_offset, value_offset, key_length, value_length = \
+                ENTRY.unpack_from(data, HEADER.size + index * ENTRY.size)
+            if key_hash != target:
+                break
+            start = self._pool + key_offset
+            if data[start:start + key_length] == key_bytes:
+                start = self._pool + value_offset
+                return data[start:start + value_length].decode("utf-8")
+        return None
+
+    def close(self):
+        """取消内存映射"""
+        self._map.close()
+
+
+class Translator:
+    """按语言加载翻译目录并查找界面文本"""
+
+    def __init__(self, locale: str = SOURCE_LOCALE, locales_dir: str = LOCALES_DIR):
+        """
+        Args:
+            locale: 当前语言
+            locales_dir: 源文件和目录文件所在目录
+        """
+        self.locale = locale
+        self.locales_dir = locales_dir
+        self._catalogs: Dict[str, Optional[Catalog]] = {}
+        self._lock = threading.Lock()
+
+    def set_locale(self, locale: str):
+        """切换语言，只影响之后创建的界面"""
+        self.locale = locale
+
+    def available_locales(self) -> List[str]:
+        """可用的语言，只列出文件名，不打开目录"""
+        names = set()
+        if os.path.isdir(self.locales_dir):
+            for filename in os.listdir(self.locales_dir):
+                name, extension = os.path.splitext(filename)
+                if extension in (".json", ".cat"):
+                    names.add(name)
+        return sorted(names)
+
+    def catalog(self, locale: str) -> Optional[Catalog]:
+        """获取语言的目录，第一次调用时打开，不存在时返回None"""
+        try:
+            return self._catalogs[locale]
+        except KeyError:
+            pass
+        with self._lock:
+            if locale not in self._catalogs:
+                self._catalogs[locale] = self._open(locale)
+        return self._catalogs[locale]
+
+    def _open(self, locale: str) -> Optional[Catalog]:
+        """打开目录文件，与源文件不一致时编译到数据目录，只有编译时才读取源文件"""
+        source = os.path.join(self.locales_dir, f"{locale}.json")
+        compiled = os.path.join(self.locales_dir, f"{locale}.cat")
+        try:
+            stat = _stat(source)
+        except OSError:
+            # 只有编译结果（例如打包时没有带源文件）
+            return Catalog(compiled) if os.path.exists(compiled) else None
+        if _source_stat(compiled) != stat:
+            compiled = app_data_path(f"i18n_{locale}.cat")
+            if _source_stat(compiled) != stat:
+                compile_file(source, compiled)
+        return Catalog(compiled)
+
+    def translate(self, key: str, **fields) -> str:
+        """
+        查找界面文本
+
+        Args:
+            key: 消息标识
+            fields: 文本中 {名称} 占位符的值
+
+        Returns:
+            当前语言的文本，缺少时依次回退到源语言和消息标识本身
+        """
+        catalog = self.catalog(self.locale)
+        text = catalog.get(key) if catalog is not None else None
+        if text is None and self.locale != SOURCE_LOCALE:
+            fallback = self.catalog(SOURCE_LOCALE)
+            text = fallback.get(key) if fallback is not None else None
+        if text is None:
+            text = key
+        return text.format(**fields) if fields else text
+
+
+# 创建全局实例
+translator = Translator()
+
+
+def tr(key: str, **fields) -> str:
+    """查找当前语言的界面文本，见 Translator.translate"""
+    return translator.translate(key, **fields)
+
+
+def main(argv=None) -> int:
+    """命令行入口：编译 locales 目录中的源文件"""
+    parser = argparse.ArgumentParser(prog="python -m src.i18n.catalog", description="编译界面文本翻译目录")
+    parser.add_argument("locales", nargs="*", help="要编译的语言，默认为全部")
+    args = parser.parse_args(argv)
+
+    locales = args.locales or [name[:-5] for name in sorted(os.listdir(LOCALES_DIR)) if name.endswith(".json")]
+    for locale in locales:
+        source = os.path.join(LOCALES_DIR, f"{locale}.json")
+        if not os.path.exists(source):
+            print(f"没有找到源文件: {source}", file=sys.stderr)
+            return 1
+        target = os.path.join(LOCALES_DIR, f"{locale}.cat")
+        count = compile_file(source, target)
+        print(f"{locale}: {count} 条消息 -> {target} ({os.path.getsize(target)} 字节)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
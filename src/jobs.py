@@ -0,0 +1,214 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+后台任务模块 - 基于QThreadPool执行耗时操作，避免阻塞GUI线程
+"""
+
+import time
+import traceback
+from functools import partial
+from typing import Callable, Dict, Optional
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+from src.perf.tracer import tracer
+
+
+class CancelledError(Exception):
+    """任务被取消"""
+
+
+class CancellationToken:
+    """取消令牌，由任务函数定期检查"""
+
+    __slots__ = ("_cancelled",)
+
+    def __init__(self):
+        self._cancelled = False
+
+    def cancel(self):
+        """请求取消"""
+        self._cancelled = True
+
+    @property
+    def cancelled(self) -> bool:
+        """是否已请求取消"""
+        return self._cancelled
+
+    def raise_if_cancelled(self):
+        """已请求取消时抛出CancelledError"""
+        if self._cancelled:
+            raise CancelledError()
+
+
+class JobSignals(QObject):
+    """任务信号，在工作线程中发出，在GUI线程中接收"""
+
+    progress = Signal(object)   # 进度值，类型由任务决定
+    result = Signal(object)     # 任务结果
+    error = Signal(str)         # 错误信息（包含调用栈）
+    cancelled = Signal()        # 任务被取消
+    finished = Signal()         # 任务结束（无论成功、失败还是取消）
+
+
+class Job(QRunnable):
+    """
+    后台任务
+
+    任务函数的签名为 fn(token, progress, *args, **kwargs)：
+    token 为取消令牌，progress 为报告进度的回调函数。
+    进度更新会被节流，两次发送之间至少间隔 progress_interval 秒，
+    被跳过的最新进度会在任务结束前补发。
+    """
+
+    def __init__(self, key: str, fn: Callable, args=(), kwargs=None,
+                 progress_interval: float = 0.1, signals_parent: Optional[QObject] = None):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.key = key
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs or {}
+        self.progress_interval = progress_interval
+        self.token = CancellationToken()
+        # 信号对象归属于GUI线程中的父对象，避免在工作线程中被析构
+        self.signals = JobSignals(signals_parent)
+
+        self._last_progress_time = 0.0
+        self._pending_progress = None
+        self._has_pending_progress = False
+
+    def cancel(self):
+        """请求取消任务"""
+        self.token.cancel()
+
+    def _report_progress(self, value):
+        """报告进度（在工作线程中调用）"""
+        now = time.monotonic()
+        if now - self._last_progress_time >= self.progress_interval:
+            self._last_progress_time = now
+            self._has_pending_progress = False
+            self.signals.progress.emit(value)
+        else:
+            self._pending_progress = value
+            self._has_pending_progress = True
+
+    def run(self):
+        """在工作线程中执行任务"""
+        try:
+            self.token.raise_if_cancelled()
+            with tracer.span(self.key, "jobs"):
+                value = self.fn(self.token, self._report_progress, *self.args, **self.kwargs)
+            self.token.raise_if_cancelled()
+        except CancelledError:
+            self.signals.cancelled.emit()
+        except Exception:
+            self.signals.error.emit(traceback.format_exc())
+        else:
+            if self._has_pending_progress:
+                self.signals.progress.emit(self._pending_progress)
+            self.signals.result.emit(value)
+        finally:
+            self.signals.finished.emit()
+
+
+class JobManager(QObject):
+    """
+    任务管理器
+
+    相同键的任务在执行期间只会运行一个，重复提交会合并到正在执行的任务上。
+    """
+
+    # 任务结束：任务键
+    job_finished = Signal(str)
+
+    def __init__(self, pool: Optional[QThreadPool] = None):
+        super().__init__()
+        self._pool = pool
+        self._jobs: Dict[str, Job] = {}
+
+    @property
+    def pool(self) -> QThreadPool:
+        """线程池，默认使用全局线程池"""
+        if self._pool is None:
+            self._pool = QThreadPool.globalInstance()
+        return self._pool
+
+    def submit(self, key: str, fn: Callable, *args,
+               on_result: Optional[Callable] = None,
+               on_progress: Optional[Callable] = None,
+               on_error: Optional[Callable] = None,
+               on_finished: Optional[Callable] = None,
+               progress_interval: float = 0.1, **kwargs) -> Job:
+        """
+        提交任务，必须在GUI线程中调用
+
+        Args:
+            key: 任务键，相同键的任务执行期间重复提交会被合并
+            fn: 任务函数 fn(token, progress, *args, **kwargs)
+            *args: 任务函数的位置参数
+            on_result: 结果回调
+            on_progress: 进度回调
+            on_error: 错误回调
+            on_finished: 结束回调
+            progress_interval: 进度更新的最小间隔（秒）
+            **kwargs: 任务函数的关键字参数
+
+        Returns:
+            新提交或正在执行的任务
+        """
+        job = self._jobs.get(key)
+        created = job is None
+        if created:
+            job = Job(key, fn, args, kwargs, progress_interval, signals_parent=self)
+
+        # 合并的提交也能收到结果
+        if on_result is not None:
+            job.signals.result.connect(on_result)
+        if on_progress is not None:
+            job.signals.progress.connect(on_progress)
+        if on_error is not None:
+            job.signals.error.connect(on_error)
+        if on_finished is not None:
+            job.signals.finished.connect(on_finished)
+
+        if created:
+            self._jobs[key] = job
+            job.signals.finished.connect(partial(self._on_job_finished, key, job.token))
+            self.pool.start(job)
+        return job
+
+    def is_running(self, key: str) -> bool:
+        """任务是否正在执行"""
+        return key in self._jobs
+
+    def cancel(self, key: str) -> bool:
+        """取消任务"""
+        job = self._jobs.get(key)
+        if job is None:
+            return False
+        job.cancel()
+        return True
+
+    def cancel_all(self):
+        """取消所有任务"""
+        for job in self._jobs.values():
+            job.cancel()
+
+    def shutdown(self, timeout_ms: int = 1000) -> bool:
+        """取消所有任务并等待线程池结束"""
+        self.cancel_all()
+        return self.pool.waitForDone(timeout_ms)
+
+    def _on_job_finished(self, key: str, token: CancellationToken):
+        """任务结束后从执行列表中移除"""
+        job = self._jobs.get(key)
+        if job is not None and job.token is token:
+            del self._jobs[key]
+            job.signals.deleteLater()
+        self.job_finished.emit(key)
+
+
+# 创建全局实例
+job_manager = JobManager()
@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+本地账号模块 - 从Cursor的本地存储读取账号状态
+"""
+
+import os
+import sys
+import sqlite3
+from typing import Dict, Optional
+
+# state.vscdb 中与账号相关的键
+ACCOUNT_KEYS = {
+    "email": "cursorAuth/cachedEmail",
+    "sign_up_type": "cursorAuth/cachedSignUpType",
+    "membership": "cursorAuth/stripeMembershipType",
+}
+
+
+def default_state_db_path() -> str:
+    """Cursor本地存储数据库的默认路径"""
+    if sys.platform == "win32":
+        base = os.environ.get("APPDATA", os.path.expanduser("~"))
+        return os.path.join(base, "Cursor", "User", "globalStorage", "state.vscdb")
+    if sys.platform == "darwin":
+        return os.path.expanduser("~/Library/Application Support/Cursor/User/globalStorage/state.vscdb")
+    return os.path.expanduser("~/.config/Cursor/User/globalStorage/state.vscdb")
+
+
+def read_account_status(db_path: Optional[str] = None) -> Optional[Dict[str, str]]:
+    """
+    读取本地账号状态
+
+    Args:
+        db_path: 数据库路径，默认为Cursor的本地存储
+
+    Returns:
+        包含 email、sign_up_type、membership 的字典，找不到数据库时返回None
+    """
+    db_path = db_path or default_state_db_path()
+    if not os.path.exists(db_path):
+        return None
+
+    # 以只读方式打开，避免与正在运行的Cursor争用写锁
+    uri = "file:" + db_path.replace("\\", "/") + "?mode=ro"
+    result = {}
+    with sqlite3.connect(uri, uri=True, timeout=1.0) as conn:
+        for name, key in ACCOUNT_KEYS.items():
+            row = conn.execute("SELECT value FROM ItemTable WHERE key = ?", (key,)).fetchone()
+            result[name] = row[0] if row else ""
+    return result
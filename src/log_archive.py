@@ -0,0 +1,341 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+日志归档模块 - 将日志记录保存到本地SQLite数据库，支持按级别、时间和关键字快速查询
+
+数据库使用WAL模式，消息文本建立FTS5全文索引（trigram分词，支持中文子串匹配）。
+SQLite不支持FTS5或trigram时退化为LIKE查询。
+"""
+
+import os
+import re
+import glob
+import time
+import sqlite3
+import logging
+import threading
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from src.log_sinks import LogSink, BLOCK
+
+# 记录：(时间戳, 级别数值, 级别名称, 消息, 来源)
+ArchiveRow = Tuple[float, int, str, str, str]
+
+# 归档输出端实时写入的记录的来源，导入的记录以日志文件名为来源
+LIVE_SOURCE = "live"
+
+# trigram分词的最短可匹配长度
+_MIN_FTS_QUERY = 3
+
+# 日志文件中一条记录的开头：时间 - 级别 - 消息
+_LINE_PATTERN = re.compile(r"^(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}) - ([A-Z]+) - (.*)$")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    id INTEGER PRIMARY KEY,
+    time REAL NOT NULL,
+    level INTEGER NOT NULL,
+    level_name TEXT NOT NULL,
+    message TEXT NOT NULL,
+    source TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS records_time ON records(time);
+CREATE INDEX IF NOT EXISTS records_level_time ON records(level, time);
+CREATE TABLE IF NOT EXISTS imported_files (
+    path TEXT PRIMARY KEY,
+    offset INTEGER NOT NULL,
+    mtime REAL NOT NULL
+);
+"""
+
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS records_fts USING fts5(
+    message, content='records', content_rowid='id', tokenize='{tokenizer}'
+);
+CREATE TRIGGER IF NOT EXISTS records_fts_insert AFTER INSERT ON records BEGIN
+    INSERT INTO records_fts(rowid, message) VALUES (new.id, new.message);
+END;
+CREATE TRIGGER IF NOT EXISTS records_fts_delete AFTER DELETE ON records BEGIN
+    INSERT INTO records_fts(records_fts, rowid, message) VALUES ('delete', old.id, old.message);
+END;
+"""
+
+
+class LogArchive:
+    """
+    日志归档数据库
+
+    每个线程使用独立的连接，写入由输出端线程或导入任务进行，查询可以在任意线程中进行。
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+        self.fts_tokenizer = None
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._create_schema()
+
+    def _connect(self) -> sqlite3.Connection:
+        """当前线程的连接"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _create_schema(self):
+        """创建表和全文索引"""
+        conn = self._connect()
+        conn.executescript(_SCHEMA)
+        row = conn.execute("SELECT sql FROM sqlite_master WHERE name = 'records_fts'").fetchone()
+        if row is not None:
+            self.fts_tokenizer = "trigram" if "trigram" in row[0] else "unicode61"
+            return
+        for tokenizer in ("trigram", "unicode61"):
+            try:
+                conn.executescript(_FTS_SCHEMA.format(tokenizer=tokenizer))
+            except sqlite3.OperationalError:
+                continue
+            self.fts_tokenizer = tokenizer
+            break
+        conn.commit()
+
+    @property
+    def has_fts(self) -> bool:
+        """是否有全文索引"""
+        return self.fts_tokenizer is not None
+
+    def insert(self, rows: Iterable[ArchiveRow]) -> int:
+        """
+        在一个事务中批量插入记录
+
+        Returns:
+            插入的记录数
+        """
+        conn = self._connect()
+        with self._write_lock, conn:
+            cursor = conn.executemany(
+                "INSERT INTO records(time, level, level_name, message, source) VALUES (?, ?, ?, ?, ?)",
+                rows)
+            return cursor.rowcount
+
+    def insert_missing(self, rows: Sequence[ArchiveRow], sources: Sequence[str]) -> int:
+        """
+        插入归档中还没有的记录
+
+        与时间范围内来源为 sources 之一的已有记录比较（时间取整到秒、级别和消息都相同），
+        相同的记录按出现次数抵消，因此同一秒内重复的消息不会被合并。用于导入可能已由
+        归档输出端实时写入、或者上次导入中途停止的日志文件。
+
+        Returns:
+            插入的记录数
+        """
+        if not rows:
+            return 0
+        conn = self._connect()
+        placeholders = ", ".join("?" * len(sources))
+        with self._write_lock, conn:
+            existing = Counter(
+                (int(stamp), level, message) for stamp, level, message in conn.execute(
+                    f"SELECT time, level, message FROM records WHERE time >= ? AND time < ? "
+                    f"AND source IN ({placeholders})",
+                    (min(row[0] for row in rows), max(row[0] for row in rows) + 1, *sources)))
+            missing = []
+            for row in rows:
+                key = (int(row[0]), row[1], row[3])
+                if existing[key]:
+                    existing[key] -= 1
+                else:
+                    missing.append(row)
+            conn.executemany(
+                "INSERT INTO records(time, level, level_name, message, source) VALUES (?, ?, ?, ?, ?)",
+                missing)
+            return len(missing)
+
+    def count(self) -> int:
+        """记录总数"""
+        return self._connect().execute("SELECT COUNT(*) FROM records").fetchone()[0]
+
+    def query(self, text: Optional[str] = None, min_level: int = 0,
+              since: Optional[float] = None, until: Optional[float] = None,
+              limit: int = 1000) -> List[Dict[str, object]]:
+        """
+        查询记录，按时间从新到旧排列
+
+        Args:
+            text: 消息中包含的文本，不区分大小写
+            min_level: 最低日志级别
+            since: 起始时间戳
+            until: 结束时间戳
+            limit: 最多返回的记录数
+
+        Returns:
+            记录列表，每条记录包含 time、level、message、source
+        """
+        conditions = ["r.level >= ?"]
+        params: List[object] = [min_level]
+        if since is not None:
+            conditions.append("r.time >= ?")
+            params.append(since)
+        if until is not None:
+            conditions.append("r.time < ?")
+            params.append(until)
+
+        table = "records r"
+        if text:
+            use_fts = self.has_fts and (self.fts_tokenizer != "trigram" or len(text) >= _MIN_FTS_QUERY)
+            if use_fts:
+                table = "records_fts f JOIN records r ON r.id = f.rowid"
+                conditions.append("records_fts MATCH ?")
+                params.append('"' + text.replace('"', '""') + '"')
+            else:
+                conditions.append("r.message LIKE ? ESCAPE '\\'")
+                escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+                params.append(f"%{escaped}%")
+
+        sql = (f"SELECT r.time, r.level_name, r.message, r.source FROM {table} "
+               f"WHERE {' AND '.join(conditions)} ORDER BY r.time DESC LIMIT ?")
+        params.append(limit)
+        rows = self._connect().execute(sql, params).fetchall()
+        return [{"time": row[0], "level": row[1], "message": row[2], "source": row[3]} for row in rows]
+
+    def search(self, text: Optional[str] = None, level: str = "warning", days: float = 30,
+               limit: int = 1000) -> List[Dict[str, object]]:
+        """查询最近若干天内不低于指定级别的记录"""
+        min_level = logging.getLevelName(level.upper())
+        return self.query(text, min_level=min_level if isinstance(min_level, int) else 0,
+                          since=time.time() - days * 86400, limit=limit)
+
+    def imported_offset(self, path: str) -> Tuple[int, float]:
+        """日志文件已导入的字节数和当时的修改时间"""
+        row = self._connect().execute(
+            "SELECT offset, mtime FROM imported_files WHERE path = ?", (os.path.abspath(path),)).fetchone()
+        return (row[0], row[1]) if row else (0, 0.0)
+
+    def mark_imported(self, path: str, offset: int, mtime: float):
+        """记录日志文件已导入到的位置"""
+        conn = self._connect()
+        with self._write_lock, conn:
+            conn.execute("INSERT OR REPLACE INTO imported_files(path, offset, mtime) VALUES (?, ?, ?)",
+                         (os.path.abspath(path), offset, mtime))
+
+    def close(self):
+        """关闭当前线程的连接"""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+def _parse_log_file(f, source: str) -> Iterable[ArchiveRow]:
+    """解析日志文件，不以时间开头的行（如异常调用栈）归入上一条记录"""
+    current = None
+    # 同一分钟内的记录只解析一次时间
+    minute_key, minute_start = None, 0.0
+    for line in f:
+        line = line.rstrip("\n")
+        match = _LINE_PATTERN.match(line)
+        if match:
+            if current is not None:
+                yield current
+            stamp, level_name, message = match.groups()
+            level = logging.getLevelName(level_name)
+            if stamp[:16] != minute_key:
+                minute_key = stamp[:16]
+                minute_start = time.mktime(time.strptime(minute_key, "%Y-%m-%d %H:%M"))
+            timestamp = minute_start + int(stamp[17:19])
+            current = (timestamp, level if isinstance(level, int) else 0, level_name, message, source)
+        elif current is not None and line:
+            current = current[:3] + (current[3] + "\n" + line,) + current[4:]
+    if current is not None:
+        yield current
+
+
+def import_log_files(token, progress, archive: LogArchive, log_dir: str, pattern: str = "*.log",
+                     exclude: Sequence[str] = (), batch_size: int = 5000) -> int:
+    """
+    将日志目录中的文本日志导入归档（可在工作线程中执行）
+
+    每个文件记录已导入的位置，文件增长后只导入新增部分，未变化的文件被跳过。
+    程序崩溃时归档输出端实时写入的记录和导入中途取消时已插入的记录不会重复导入，
+    见 LogArchive.insert_missing。
+
+    Args:
+        token: 取消令牌，可以为None
+        progress: 进度回调，参数为 (已处理文件数, 文件总数)，可以为None
+        archive: 日志归档
+        log_dir: 日志目录
+        pattern: 文件名模式
+        exclude: 不导入的文件（例如正在由归档输出端实时写入的当天日志）
+        batch_size: 每个事务插入的记录数
+
+    Returns:
+        导入的记录数
+    """
+    excluded = {os.path.abspath(path) for path in exclude if path}
+    paths = sorted(path for path in glob.glob(os.path.join(log_dir, pattern))
+                   if os.path.abspath(path) not in excluded)
+    imported = 0
+    for number, path in enumerate(paths, 1):
+        if token is not None:
+            token.raise_if_cancelled()
+        stat = os.stat(path)
+        offset, mtime = archive.imported_offset(path)
+        if stat.st_size < offset:
+            # 文件被截断或替换，无法确定哪些记录已经导入，整体跳过
+            continue
+        if stat.st_size > offset or stat.st_mtime != mtime:
+            with open(path, "r", encoding="utf-8", errors="replace") as f:
+                f.seek(offset)
+                source = os.path.basename(path)
+                rows = _parse_log_file(f, source)
+                batch = []
+                for row in rows:
+                    batch.append(row)
+                    if len(batch) >= batch_size:
+                        imported += archive.insert_missing(batch, (LIVE_SOURCE, source))
+                        batch = []
+                        if token is not None:
+                            token.raise_if_cancelled()
+                imported += archive.insert_missing(batch, (LIVE_SOURCE, source))
+            archive.mark_imported(path, stat.st_size, stat.st_mtime)
+        if progress is not None:
+            progress((number, len(paths)))
+    return imported
+
+
+class ArchiveSink(LogSink):
+    """
+    归档输出端，批量写入SQLite数据库
+
+    同时写入的文本日志文件可能与其他进程共享，文件中不只有本输出端写入的记录，
+    因此关闭时不标记为已导入，之后导入历史日志时整个文件重新扫描，已经实时写入的
+    记录由 LogArchive.insert_missing 跳过。消息包含异常调用栈，与日志文件中的记录一致。
+    """
+
+    def __init__(self, name: str = "archive", path: str = "logs/archive.db", **kwargs):
+        kwargs.setdefault("policy", BLOCK)
+        kwargs.setdefault("block_timeout", 1.0)
+        kwargs.setdefault("batch_size", 1000)
+        super().__init__(name, **kwargs)
+        self.path = path
+        self.archive: Optional[LogArchive] = None
+
+    def write_batch(self, batch):
+        if self.archive is None:
+            self.archive = LogArchive(self.path)
+        # 格式化时已把异常调用栈缓存在 exc_text 中
+        self.archive.insert([(record.created, record.levelno, record.levelname,
+                              record.getMessage() + "\n" + record.exc_text if record.exc_text
+                              else record.getMessage(), LIVE_SOURCE)
+                             for record, _ in batch])
+
+    def close_sink(self):
+        if self.archive is not None:
+            self.archive.close()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+日志导出模块 - 从日志存储中分块读取记录并流式写入文件
+
+导出在后台任务中执行，内存占用与日志总量无关。
+"""
+
+import os
+import gzip
+import json
+import time
+from typing import Optional, Sequence, Tuple
+
+from src.log_store import LogStore
+from src.logger import Logger
+
+# 导出格式
+FORMAT_TEXT = "text"
+FORMAT_JSONL = "jsonl"
+
+# 文件对话框的过滤器：(过滤器文本, 格式, 是否gzip压缩, 扩展名)
+FILE_FILTERS = [
+    ("文本文件 (*.txt)", FORMAT_TEXT, False, ".txt"),
+    ("JSON Lines (*.jsonl)", FORMAT_JSONL, False, ".jsonl"),
+    ("gzip压缩文本 (*.txt.gz)", FORMAT_TEXT, True, ".txt.gz"),
+    ("gzip压缩JSON Lines (*.jsonl.gz)", FORMAT_JSONL, True, ".jsonl.gz"),
+]
+
+
+def format_from_path(path: str) -> Tuple[str, bool]:
+    """
+    根据文件名判断导出格式
+
+    Returns:
+        (格式, 是否gzip压缩)
+    """
+    lower = path.lower()
+    compress = lower.endswith(".gz")
+    if compress:
+        lower = lower[:-3]
+    return (FORMAT_JSONL if lower.endswith((".jsonl", ".json")) else FORMAT_TEXT), compress
+
+
+def _format_time(timestamp: float) -> str:
+    """格式化时间戳，精确到毫秒"""
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(timestamp)) + f".{int(timestamp * 1000) % 1000:03d}"
+
+
+def _format_text(record) -> str:
+    timestamp, level, message = record
+    return f"{_format_time(timestamp)} - {message}\n"
+
+
+def _format_jsonl(record) -> str:
+    timestamp, level, message = record
+    return json.dumps({"time": _format_time(timestamp), "level": level, "message": message},
+                      ensure_ascii=False) + "\n"
+
+
+def export_records(token, progress, store: LogStore, path: str,
+                   fmt: str = FORMAT_TEXT, compress: bool = False,
+                   start: int = 0, end: Optional[int] = None, min_level: int = 0,
+                   indices: Optional[Sequence[int]] = None, chunk_size: int = 2000) -> int:
+    """
+    导出日志记录（在工作线程中执行）
+
+    先写入临时文件，完成后再替换目标文件，取消或出错时不会留下不完整的文件。
+
+    Args:
+        token: 取消令牌
+        progress: 进度回调，参数为 (已处理数, 总数)
+        store: 日志存储
+        path: 目标文件路径
+        fmt: 导出格式，text 或 jsonl
+        compress: 是否gzip压缩
+        start: 起始序号
+        end: 结束序号（不包含），默认为导出开始时的最新记录
+        min_level: 最低日志级别，低于该级别的记录不导出
+        indices: 指定要导出的记录序号（升序），指定时忽略 start 和 end
+        chunk_size: 每次从存储中读取的记录数
+
+    Returns:
+        导出的记录数
+    """
+    if indices is not None:
+        total = len(indices)
+        chunks = store.iter_indices(indices, chunk_size)
+    else:
+        if end is None:
+            end = store.end_index
+        start = max(start, store.first_index)
+        total = max(0, end - start)
+        chunks = store.iter_chunks(start, end, chunk_size)
+
+    format_record = _format_jsonl if fmt == FORMAT_JSONL else _format_text
+
+    tmp_path = path + ".part"
+    opener = gzip.open if compress else open
+    written = 0
+    processed = 0
+    try:
+        with opener(tmp_path, "wt", encoding="utf-8", newline="") as f:
+            for records in chunks:
+                token.raise_if_cancelled()
+                lines = [format_record(record) for record in records
+                         if not min_level or Logger.LEVELS.get(record[1].lower(), 0) >= min_level]
+                f.writelines(lines)
+                written += len(lines)
+                processed += len(records)
+                progress((processed, total))
+        token.raise_if_cancelled()
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    return written
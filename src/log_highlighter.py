@@ -0,0 +1,122 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+日志高亮模块 - 按日志级别为文本块着色，颜色来自当前主题
+
+新追加的文本块由QSyntaxHighlighter自动着色；切换主题时只重新着色可见的文本块，
+其余文本块在滚动到可见区域时再着色，耗时与可见行数成正比，与日志总量无关。
+"""
+
+from typing import Dict
+
+from PySide6.QtCore import QEvent, QTimer
+from PySide6.QtGui import QColor, QSyntaxHighlighter, QTextBlockUserData, QTextCharFormat
+from PySide6.QtWidgets import QPlainTextEdit
+
+from src.theme_manager import theme_manager
+
+# 日志级别及其在文本块状态中的编号
+LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+LEVEL_STATES = {level: state for state, level in enumerate(LEVELS)}
+DEFAULT_STATE = LEVEL_STATES["INFO"]
+
+
+class _BlockGeneration(QTextBlockUserData):
+    """记录文本块是用哪一代颜色着色的"""
+
+    def __init__(self, generation: int):
+        super().__init__()
+        self.generation = generation
+
+
+class LogHighlighter(QSyntaxHighlighter):
+    """
+    日志高亮器
+
+    文本块以 "级别 - " 开头时使用该级别的颜色，多行消息的后续行沿用上一块的级别。
+    """
+
+    def __init__(self, editor: QPlainTextEdit):
+        super().__init__(editor.document())
+        self.editor = editor
+        self.generation = 0
+        # 用当前这一代颜色着色过的文本块数，少于总块数说明还有过期的文本块
+        self._fresh_blocks = 0
+        self._formats: Dict[int, QTextCharFormat] = {}
+        self._load_colors()
+
+        # 滚动或改变大小时为新露出的文本块补上着色，合并到下一次事件循环中处理
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(0)
+        self._refresh_timer.timeout.connect(self.refresh_visible)
+        editor.verticalScrollBar().valueChanged.connect(self._schedule_refresh)
+        editor.viewport().installEventFilter(self)
+
+    def _load_colors(self):
+        """从当前主题读取各级别的颜色"""
+        colors = theme_manager.get_theme_colors()
+        self._formats = {}
+        for level, state in LEVEL_STATES.items():
+            text_format = QTextCharFormat()
+            text_format.setForeground(QColor(colors[f"log_{level.lower()}"]))
+            self._formats[state] = text_format
+
+    def highlightBlock(self, text: str):
+        """为单个文本块着色"""
+        state = LEVEL_STATES.get(text.partition(" - ")[0], -1)
+        if state < 0:
+            previous = self.previousBlockState()
+            state = previous if previous >= 0 else DEFAULT_STATE
+        self.setCurrentBlockState(state)
+        self.setFormat(0, len(text), self._formats[state])
+
+        data = self.currentBlockUserData()
+        if data is None or data.generation != self.generation:
+            self._fresh_blocks += 1
+            self.setCurrentBlockUserData(_BlockGeneration(self.generation))
+
+    @property
+    def has_stale_blocks(self) -> bool:
+        """是否还有用旧颜色着色的文本块"""
+        return self._fresh_blocks < self.document().blockCount()
+
+    def _schedule_refresh(self, *args):
+        """有过期文本块时，在下一次事件循环中重新着色可见范围"""
+        if self.has_stale_blocks and not self._refresh_timer.isActive():
+            self._refresh_timer.start()
+
+    def eventFilter(self, obj, event):
+        """可见区域改变大小后补上着色"""
+        if event.type() == QEvent.Type.Resize:
+            self._schedule_refresh()
+        return False
+
+    def update_colors(self):
+        """主题变更后重新读取颜色，只重新着色可见的文本块"""
+        self._load_colors()
+        self.generation += 1
+        self._fresh_blocks = 0
+        self.refresh_visible()
+
+    def refresh_visible(self) -> int:
+        """
+        重新着色可见范围内颜色已过期的文本块
+
+        Returns:
+            重新着色的文本块数
+        """
+        editor = self.editor
+        offset = editor.contentOffset()
+        bottom = editor.viewport().height()
+        block = editor.firstVisibleBlock()
+
+        count = 0
+        while block.isValid() and editor.blockBoundingGeometry(block).translated(offset).top() <= bottom:
+            data = block.userData()
+            if data is None or data.generation != self.generation:
+                self.rehighlightBlock(block)
+                count += 1
+            block = block.next()
+        return count
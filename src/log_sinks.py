@@ -0,0 +1,584 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+日志输出端模块 - 每个输出端有独立的级别、格式、有界队列和写入线程
+
+日志调用只把记录放入各输出端的队列，格式化和写入在输出端自己的线程中进行。
+队列满时按输出端的策略处理，写入缓慢的输出端（网络共享上的文件、syslog收集器等）
+不会拖慢其他输出端。
+"""
+
+import os
+import sys
+import time
+import socket
+import logging
+import threading
+from collections import deque
+from typing import Dict, List, Optional, Tuple, Union
+
+# 队列满时的处理策略
+BLOCK = "block"              # 阻塞日志调用，直到队列有空位或超时
+DROP_NEW = "drop_new"        # 丢弃新记录
+DROP_OLDEST = "drop_oldest"  # 丢弃队列中最旧的记录
+POLICIES = (BLOCK, DROP_NEW, DROP_OLDEST)
+
+# 文件输出端的持久性模式
+FAST = "fast"        # 在内存中缓冲，定时或累计到一定大小时写入
+SAFE = "safe"        # 每批记录写入后立即刷新到操作系统
+DURABLE = "durable"  # 同 SAFE，ERROR及以上的记录还会 fsync 落盘
+DURABILITY_MODES = (FAST, SAFE, DURABLE)
+
+# flush() 的默认最长等待时间（秒）。程序退出时 logging.shutdown() 不带参数调用 flush()，
+# 卡住的输出端线程不能让程序无法退出
+FLUSH_TIMEOUT = 2.0
+
+DEFAULT_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
+DEFAULT_DATEFMT = "%Y-%m-%d %H:%M:%S"
+
+
+def parse_level(level: Union[str, int]) -> int:
+    """将级别名称（不区分大小写）或数值转换为日志级别"""
+    if isinstance(level, int):
+        return level
+    value = logging.getLevelName(level.upper())
+    if not isinstance(value, int):
+        raise ValueError(f"未知的日志级别: {level}")
+    return value
+
+
+class FastFormatter(logging.Formatter):
+    """
+    快速格式化器，输出 "时间 - 级别 - 消息" 或 "级别 - 消息"
+
+    时间前缀按秒缓存，行内容直接拼接字符串。格式化结果保存在记录上，
+    使用同一个格式化器的多个输出端只格式化一次。
+    """
+
+    def __init__(self, with_time: bool = True, datefmt: str = DEFAULT_DATEFMT):
+        super().__init__(DEFAULT_FORMAT if with_time else "%(levelname)s - %(message)s", datefmt=datefmt)
+        self.with_time = with_time
+        # (秒, 时间前缀)，作为一个整体替换，多个输出端线程可以同时读取
+        self._time_prefix = (None, "")
+        self._cache_attr = f"_fast_format_{id(self)}"
+
+    def _prefix(self, created: float) -> str:
+        """记录时间所在秒的前缀"""
+        second = int(created)
+        cached_second, prefix = self._time_prefix
+        if second != cached_second:
+            prefix = time.strftime(self.datefmt, self.converter(second)) + " - "
+            self._time_prefix = (second, prefix)
+        return prefix
+
+    def format(self, record: logging.LogRecord) -> str:
+        text = getattr(record, self._cache_attr, None)
+        if text is not None:
+            return text
+
+        record.message = record.getMessage()
+        text = record.levelname + " - " + record.message
+        if self.with_time:
+            text = self._prefix(record.created) + text
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            text += "\n" + record.exc_text
+        if record.stack_info:
+            text += "\n" + self.formatStack(record.stack_info)
+        setattr(record, self._cache_attr, text)
+        return text
+
+
+# 输出端共用的格式化器
+DEFAULT_FORMATTER = FastFormatter()
+LEVEL_FORMATTER = FastFormatter(with_time=False)
+
+
+class LogSink(logging.Handler):
+    """
+    日志输出端基类
+
+    子类实现 write_batch()，在输出端线程中批量写入格式化后的记录；
+    需要释放资源时实现 close_sink()，同样在输出端线程中调用。
+    自行缓冲的子类实现 flush_sink() 和 idle_timeout()：队列空闲超过 idle_timeout()
+    秒或调用 flush() 时，输出端线程调用 flush_sink() 写出缓冲区。
+    """
+
+    def __init__(self, name: str, level: Union[str, int] = "debug",
+                 formatter: Optional[logging.Formatter] = None,
+                 capacity: int = 10000, policy: str = DROP_OLDEST,
+                 block_timeout: Optional[float] = None, batch_size: int = 256):
+        """
+        Args:
+            name: 输出端名称
+            level: 输出端的最低级别
+            formatter: 格式化器，默认为共用的 "时间 - 级别 - 消息" 格式化器
+            capacity: 队列容量
+            policy: 队列满时的处理策略，BLOCK、DROP_NEW 或 DROP_OLDEST
+            block_timeout: BLOCK 策略的最长等待时间（秒），超时后丢弃记录，None表示一直等待
+            batch_size: 每次批量写入的最大记录数
+        """
+        if policy not in POLICIES:
+            raise ValueError(f"未知的队列策略: {policy}")
+        super().__init__(parse_level(level))
+        self.set_name(name)
+        self.setFormatter(formatter or DEFAULT_FORMATTER)
+        self.capacity = capacity
+        self.policy = policy
+        self.block_timeout = block_timeout
+        self.batch_size = batch_size
+
+        self._queue: deque = deque()
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        # flush() 的请求序号和输出端线程已完成的序号
+        self._flush_requested = 0
+        self._flush_done = 0
+
+        # 统计
+        self.received = 0
+        self.written = 0
+        self.dropped = 0
+        self.errors = 0
+        self.max_queued = 0
+        self.write_ns = 0
+
+    def emit(self, record: logging.LogRecord):
+        """将记录放入队列（在日志调用的线程中执行）"""
+        with self._cond:
+            if self._closed:
+                return
+            self.received += 1
+            if len(self._queue) >= self.capacity and not self._make_room():
+                self.dropped += 1
+                return
+            self._queue.append(record)
+            if len(self._queue) > self.max_queued:
+                self.max_queued = len(self._queue)
+            if self._thread is None:
+                self._start_thread()
+            self._cond.notify_all()
+
+    def _make_room(self) -> bool:
+        """队列已满时按策略腾出空位，调用时已持有锁"""
+        if self.policy == DROP_OLDEST:
+            self._queue.popleft()
+            self.dropped += 1
+            return True
+        if self.policy == DROP_NEW:
+            return False
+        deadline = None if self.block_timeout is None else time.monotonic() + self.block_timeout
+        while len(self._queue) >= self.capacity and not self._closed:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return False
+            self._cond.wait(remaining)
+        return not self._closed
+
+    def _start_thread(self):
+        """启动输出端线程"""
+        self._thread = threading.Thread(target=self._run, name=f"LogSink-{self.name}", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        """输出端线程：批量取出记录，格式化并写入；空闲或收到 flush() 请求时写出缓冲区"""
+        while True:
+            with self._cond:
+                while not self._queue and not self._closed and self._flush_done == self._flush_requested:
+                    if not self._cond.wait(self.idle_timeout()):
+                        break
+                if self._queue:
+                    count = min(self.batch_size, len(self._queue))
+                    records = [self._queue.popleft() for _ in range(count)]
+                    # 唤醒等待空位的日志调用
+                    self._cond.notify_all()
+                elif self._closed:
+                    break
+                else:
+                    records = None
+                request = self._flush_requested
+
+            if records is None:
+                try:
+                    self.flush_sink()
+                except Exception:
+                    self.errors += 1
+                with self._cond:
+                    self._flush_done = request
+                    self._cond.notify_all()
+                continue
+
+            batch = []
+            for record in records:
+                try:
+                    batch.append((record, self.format(record)))
+                except Exception:
+                    self.errors += 1
+            start = time.perf_counter_ns()
+            try:
+                self.write_batch(batch)
+                self.written += len(batch)
+            except Exception:
+                self.errors += len(batch)
+            self.write_ns += time.perf_counter_ns() - start
+
+        try:
+            self.close_sink()
+        except Exception:
+            self.errors += 1
+
+    def write_batch(self, batch: List[Tuple[logging.LogRecord, str]]):
+        """
+        批量写入（在输出端线程中执行）
+
+        Args:
+            batch: (日志记录, 格式化后的文本) 列表
+        """
+        raise NotImplementedError
+
+    def close_sink(self):
+        """释放资源（在输出端线程中执行）"""
+
+    def flush_sink(self):
+        """写出自行缓冲的数据（在输出端线程中执行）"""
+
+    def idle_timeout(self) -> Optional[float]:
+        """队列空闲多久（秒）后调用 flush_sink()，None表示不需要"""
+        return None
+
+    def flush(self, timeout: Optional[float] = FLUSH_TIMEOUT) -> bool:
+        """
+        等待队列中的记录全部写入，自行缓冲的输出端同时写出缓冲区
+
+        Args:
+            timeout: 最长等待时间（秒），None表示一直等待
+
+        Returns:
+            是否在超时前写完
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            if self._thread is None or self._closed:
+                return True
+            self._flush_requested += 1
+            request = self._flush_requested
+            self._cond.notify_all()
+            while self._flush_done < request and self._thread.is_alive():
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def close(self, timeout: Optional[float] = 5.0):
+        """写完队列中的记录后停止输出端线程"""
+        with self._cond:
+            already_closed = self._closed
+            self._closed = True
+            self._cond.notify_all()
+            thread = self._thread
+        if not already_closed:
+            if thread is not None:
+                thread.join(timeout)
+            else:
+                self.close_sink()
+        super().close()
+
+    @property
+    def queued(self) -> int:
+        """队列中等待写入的记录数"""
+        return len(self._queue)
+
+    def stats(self) -> Dict[str, object]:
+        """输出端统计"""
+        return {
+            "level": logging.getLevelName(self.level),
+            "policy": self.policy,
+            "capacity": self.capacity,
+            "queued": self.queued,
+            "max_queued": self.max_queued,
+            "received": self.received,
+            "written": self.written,
+            "dropped": self.dropped,
+            "errors": self.errors,
+            "mean_write_us": self.write_ns / self.written / 1000 if self.written else 0.0,
+        }
+
+
+class ConsoleSink(LogSink):
+    """控制台输出端"""
+
+    def __init__(self, name: str = "console", stream=None, **kwargs):
+        super().__init__(name, **kwargs)
+        self.stream = stream
+
+    def write_batch(self, batch):
+        stream = self.stream or sys.stderr
+        stream.write("".join(text + "\n" for _, text in batch))
+        stream.flush()
+
+
+class FileSink(LogSink):
+    """
+    文件输出端，文件在首次写入时打开
+
+    持久性模式决定记录何时写入文件：
+
+    - FAST: 记录先在内存中缓冲，累计超过 buffer_bytes 或最早的记录已等待 flush_interval 秒时
+      一次写入；ERROR及以上的记录连同缓冲区立即写入
+    - SAFE: 每批记录写入后立即刷新到操作系统
+    - DURABLE: 同 SAFE，批中有ERROR及以上的记录时还调用 fsync
+
+    flush() 和关闭输出端时总是写出缓冲区。
+
+    未指定队列策略时，队列满后 DURABLE 模式阻塞日志调用（最多 block_timeout 秒）而不丢弃记录，
+    其他模式丢弃最旧的记录并计入 dropped，文件写入缓慢时不会拖慢界面线程和其他输出端。
+    """
+
+    def __init__(self, name: str = "file", path: str = "app.log", encoding: str = "utf-8",
+                 durability: str = FAST, buffer_bytes: int = 64 * 1024, flush_interval: float = 1.0,
+                 **kwargs):
+        """
+        Args:
+            name: 输出端名称
+            path: 日志文件路径
+            encoding: 文件编码
+            durability: 持久性模式，FAST、SAFE 或 DURABLE
+            buffer_bytes: FAST 模式下缓冲区的最大字符数
+            flush_interval: FAST 模式下记录在缓冲区中的最长等待时间（秒）
+            **kwargs: 传给 LogSink 的参数，未指定 policy 时随持久性模式选择
+        """
+        kwargs.setdefault("block_timeout", 1.0)
+        super().__init__(name, **kwargs)
+        self._auto_policy = "policy" not in kwargs
+        self.path = path
+        self.encoding = encoding
+        self.durability = FAST
+        self.set_durability(durability)
+        self.buffer_bytes = buffer_bytes
+        self.flush_interval = flush_interval
+        self._file = None
+        self._buffer: List[str] = []
+        self._buffered = 0
+        self._buffer_since = 0.0
+        # 写入和fsync的次数
+        self.writes = 0
+        self.syncs = 0
+
+    def set_durability(self, durability: str):
+        """修改持久性模式，缓冲区中已有的记录在下一次写入时一并写出"""
+        if durability not in DURABILITY_MODES:
+            raise ValueError(f"未知的持久性模式: {durability}")
+        self.durability = durability
+        if self._auto_policy:
+            self.policy = BLOCK if durability == DURABLE else DROP_OLDEST
+
+    def write_batch(self, batch):
+        if not batch:
+            return
+        urgent = False
+        for record, text in batch:
+            self._buffer.append(text + "\n")
+            self._buffered += len(text) + 1
+            if record.levelno >= logging.ERROR:
+                urgent = True
+        if self._buffer_since == 0.0:
+            self._buffer_since = time.monotonic()
+
+        if (self.durability != FAST or urgent or self._buffered >= self.buffer_bytes
+                or time.monotonic() - self._buffer_since >= self.flush_interval):
+            self._write_buffer(sync=urgent and self.durability == DURABLE)
+
+    def _write_buffer(self, sync: bool = False):
+        """把缓冲区写入文件"""
+        if not self._buffer:
+            return
+        texts = self._buffer
+        self._buffer = []
+        self._buffered = 0
+        self._buffer_since = 0.0
+        self.write_texts(texts)
+        self.writes += 1
+        if sync:
+            self.sync()
+            self.syncs += 1
+
+    def write_texts(self, texts: List[str]):
+        """写入以换行结尾的记录文本并刷新到操作系统"""
+        if self._file is None:
+            self._file = open(self.path, "a", encoding=self.encoding)
+        self._file.write("".join(texts))
+        self._file.flush()
+
+    def sync(self):
+        """把已写入的数据落盘"""
+        if self._file is not None:
+            os.fsync(self._file.fileno())
+
+    def idle_timeout(self) -> Optional[float]:
+        if not self._buffer:
+            return None
+        return max(0.0, self._buffer_since + self.flush_interval - time.monotonic())
+
+    def flush_sink(self):
+        self._write_buffer()
+
+    def close_sink(self):
+        self._write_buffer()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def stats(self) -> Dict[str, object]:
+        stats = super().stats()
+        stats.update(durability=self.durability, writes=self.writes, syncs=self.syncs,
+                     buffered=len(self._buffer))
+        return stats
+
+
+class SharedFileSink(FileSink):
+    """
+    多进程共享的文件输出端
+
+    多个进程同时写入同一个日志文件时，每次写入都是若干条完整记录：文件以 O_APPEND
+    方式打开，编码后的记录拼接成不超过 max_write_bytes 的块，用一次 os.write 写入，
+    超过 max_record_bytes 的记录被截断。POSIX系统上追加写入由内核保证整体定位到文件末尾；
+    Windows上的追加写入不是原子的，写入期间对文件首字节加锁。
+    """
+
+    # 截断记录时追加的标记
+    TRUNCATED = " ...[truncated]\n".encode("utf-8")
+
+    def __init__(self, name: str = "file", path: str = "app.log", encoding: str = "utf-8",
+                 max_record_bytes: int = 64 * 1024, max_write_bytes: int = 256 * 1024, **kwargs):
+        """
+        Args:
+            name: 输出端名称
+            path: 日志文件路径
+            encoding: 文件编码
+            max_record_bytes: 单条记录的最大字节数
+            max_write_bytes: 一次写入的最大字节数，单条记录超过该值时单独写入
+            **kwargs: 传给 FileSink 的参数，包括持久性模式
+        """
+        super().__init__(name, path, encoding, **kwargs)
+        self.max_record_bytes = max_record_bytes
+        self.max_write_bytes = max_write_bytes
+        self._fd: Optional[int] = None
+
+    def _encode(self, text: str) -> bytes:
+        """编码一条以换行结尾的记录，过长时截断"""
+        data = text.encode(self.encoding, "replace")
+        if len(data) > self.max_record_bytes:
+            keep = self.max_record_bytes - len(self.TRUNCATED)
+            # 不在多字节字符中间截断
+            data = data[:keep].decode(self.encoding, "ignore").encode(self.encoding) + self.TRUNCATED
+        return data
+
+    def write_texts(self, texts):
+        if self._fd is None:
+            flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+            self._fd = os.open(self.path, flags, 0o644)
+        chunk = []
+        size = 0
+        for text in texts:
+            data = self._encode(text)
+            if chunk and size + len(data) > self.max_write_bytes:
+                self._append(b"".join(chunk))
+                chunk = []
+                size = 0
+            chunk.append(data)
+            size += len(data)
+        if chunk:
+            self._append(b"".join(chunk))
+
+    def _append(self, data: bytes):
+        """把完整的记录块追加到文件末尾"""
+        if sys.platform == "win32":
+            self._append_locked(data)
+            return
+        written = os.write(self._fd, data)
+        # 磁盘已满或被信号中断时可能只写入一部分，补写剩余部分
+        while written < len(data):
+            written += os.write(self._fd, data[written:])
+
+    def _append_locked(self, data: bytes):
+        """Windows：锁住文件首字节后移到末尾写入"""
+        import msvcrt
+        os.lseek(self._fd, 0, os.SEEK_SET)
+        # LK_LOCK 最多重试10次（约10秒），仍未获得锁时抛出OSError
+        msvcrt.locking(self._fd, msvcrt.LK_LOCK, 1)
+        try:
+            os.lseek(self._fd, 0, os.SEEK_END)
+            written = 0
+            while written < len(data):
+                written += os.write(self._fd, data[written:])
+        finally:
+            os.lseek(self._fd, 0, os.SEEK_SET)
+            msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+
+    def sync(self):
+        if self._fd is not None:
+            os.fsync(self._fd)
+
+    def close_sink(self):
+        self._write_buffer()
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+class GuiSink(LogSink):
+    """GUI输出端，通过信号将日志发送到GUI线程"""
+
+    def __init__(self, name: str = "gui", signal=None, **kwargs):
+        kwargs.setdefault("formatter", LEVEL_FORMATTER)
+        super().__init__(name, **kwargs)
+        self.signal = signal
+
+    def write_batch(self, batch):
+        for record, text in batch:
+            self.signal.sent += 1
+            self.signal.new_log.emit(record.levelname, text)
+
+
+class UdpSyslogSink(LogSink):
+    """UDP syslog输出端（RFC 3164格式）"""
+
+    # 日志级别对应的syslog严重程度
+    SEVERITIES = {
+        logging.DEBUG: 7,
+        logging.INFO: 6,
+        logging.WARNING: 4,
+        logging.ERROR: 3,
+        logging.CRITICAL: 2,
+    }
+
+    def __init__(self, name: str = "syslog", host: str = "127.0.0.1", port: int = 514,
+                 facility: int = 1, app_name: str = "CursorProMax", **kwargs):
+        kwargs.setdefault("formatter", logging.Formatter("%(message)s"))
+        super().__init__(name, **kwargs)
+        self.address = (host, port)
+        self.facility = facility
+        self.app_name = app_name
+        self._socket = None
+
+    def write_batch(self, batch):
+        if self._socket is None:
+            self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        hostname = socket.gethostname()
+        for record, text in batch:
+            priority = self.facility * 8 + self.SEVERITIES.get(record.levelno, 6)
+            timestamp = time.strftime("%b %d %H:%M:%S", time.localtime(record.created))
+            message = f"<{priority}>{timestamp} {hostname} {self.app_name}: {text}"
+            try:
+                self._socket.sendto(message.encode("utf-8")[:2048], self.address)
+            except OSError:
+                self.errors += 1
+
+    def close_sink(self):
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
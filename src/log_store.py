@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+日志存储模块 - 保存GUI收到的日志记录，供显示组件和导出使用
+"""
+
+import time
+import threading
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+# 日志记录：(时间戳, 级别, 消息)
+LogRecord = Tuple[float, str, str]
+
+
+class LogStore:
+    """
+    只追加的日志存储
+
+    每条记录有一个递增的序号，超出容量时丢弃最旧的记录，已丢弃的序号不再可读。
+    写入在GUI线程中进行，读取可以在任意线程中分块进行。
+    """
+
+    def __init__(self, max_records: int = 200000):
+        """
+        Args:
+            max_records: 最多保存的记录数，0表示不限制
+        """
+        self.max_records = max_records
+        self._records: List[LogRecord] = []
+        # 第一条保存的记录的序号
+        self._base = 0
+        self._lock = threading.Lock()
+
+    def append(self, level: str, message: str, timestamp: Optional[float] = None) -> int:
+        """
+        追加一条记录
+
+        Returns:
+            记录的序号
+        """
+        record = (time.time() if timestamp is None else timestamp, level, message)
+        with self._lock:
+            self._records.append(record)
+            index = self._base + len(self._records) - 1
+            if self.max_records and len(self._records) > self.max_records:
+                # 一次丢弃多条，避免每次追加都移动整个列表
+                drop = max(1, self.max_records // 10)
+                del self._records[:drop]
+                self._base += drop
+        return index
+
+    @property
+    def first_index(self) -> int:
+        """最早一条可读记录的序号"""
+        return self._base
+
+    @property
+    def end_index(self) -> int:
+        """下一条记录的序号"""
+        with self._lock:
+            return self._base + len(self._records)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def read(self, start: int, end: int) -> Tuple[int, List[LogRecord]]:
+        """
+        读取序号区间 [start, end) 内的记录，已丢弃的部分被跳过
+
+        Returns:
+            (实际起始序号, 记录列表)
+        """
+        with self._lock:
+            start = max(start, self._base)
+            end = min(end, self._base + len(self._records))
+            if start >= end:
+                return start, []
+            return start, self._records[start - self._base:end - self._base]
+
+    def iter_chunks(self, start: int = 0, end: Optional[int] = None,
+                    chunk_size: int = 1000) -> Iterator[List[LogRecord]]:
+        """按块读取区间内的记录，每块读取时只短暂持有锁"""
+        if end is None:
+            end = self.end_index
+        position = start
+        while position < end:
+            # 读取期间可能有记录被丢弃，从仍可读的第一条继续
+            position = max(position, self.first_index)
+            position, records = self.read(position, min(position + chunk_size, end))
+            if not records:
+                break
+            yield records
+            position += len(records)
+
+    def iter_indices(self, indices: Sequence[int], chunk_size: int = 1000) -> Iterator[List[LogRecord]]:
+        """按块读取指定序号（升序）的记录"""
+        for offset in range(0, len(indices), chunk_size):
+            chunk = indices[offset:offset + chunk_size]
+            with self._lock:
+                base, end = self._base, self._base + len(self._records)
+                records = [self._records[index - base] for index in chunk if base <= index < end]
+            yield records
+
+    def clear(self):
+        """清空所有记录，序号继续递增"""
+        with self._lock:
+            self._base += len(self._records)
+            self._records = []
@@ -5,46 +5,91 @@
 日志显示组件模块
 """
 
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+from functools import partial
+from typing import Optional
+
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTextEdit,
-    QPushButton, QComboBox, QLabel, QCheckBox
+    QWidget, QVBoxLayout, QHBoxLayout, QPlainTextEdit,
+    QPushButton, QComboBox, QLabel, QCheckBox,
+    QMenu, QFileDialog, QProgressDialog, QLineEdit, QDialog
 )
 from PySide6.QtCore import Qt, Slot
-from PySide6.QtGui import QColor, QTextCharFormat, QFont, QTextCursor
+from PySide6.QtGui import QColor, QFont, QPalette, QTextCursor
 
 from src.logger import Logger, LogSignal
+from src.log_store import LogStore
+from src.log_archive import LogArchive
+from src.log_highlighter import LogHighlighter
+from src.log_export import FILE_FILTERS, export_records, format_from_path
+from src.jobs import job_manager
+from src.theme_manager import theme_manager
+from src.i18n.catalog import tr
+from src.settings import settings, LOG_LEVEL, LOG_AUTO_SCROLL
+from src.perf.signal_profiler import signal_profiler
+
+
+def _search_archive(token, progress, archive: LogArchive, text: str, level: str, days: float):
+    """在归档中搜索日志（在工作线程中执行）"""
+    start = time.perf_counter()
+    rows = archive.search(text, level=level, days=days)
+    return rows, (time.perf_counter() - start) * 1000
 
 
 class LogWidget(QWidget):
     """日志显示组件"""
 
-    # 日志级别对应的颜色
-    LOG_COLORS = {
-        "DEBUG": QColor(128, 128, 128),  # 灰色
-        "INFO": QColor(0, 0, 0),         # 黑色
-        "WARNING": QColor(255, 165, 0),  # 橙色
-        "ERROR": QColor(255, 0, 0),      # 红色
-        "CRITICAL": QColor(128, 0, 128)  # 紫色
-    }
+    # 导出范围
+    EXPORT_ALL = "all"
+    EXPORT_FILTERED = "filtered"
+    EXPORT_SELECTION = "selection"
+
+    # 归档搜索的时间范围（天）
+    SEARCH_DAYS = 30
 
-    def __init__(self, logger: Logger, parent=None):
+    def __init__(self, logger: Logger, parent=None, store: Optional[LogStore] = None):
         """
         初始化日志显示组件
 
         Args:
             logger: 日志管理器
             parent: 父窗口
+            store: 日志存储，默认新建
         """
         super().__init__(parent)
         self.logger = logger
+        self.store = store if store is not None else LogStore()
+
+        # 显示中的每条记录的序号和起始文本块编号，用于把选中的文本对应到记录
+        self._displayed = array("q")
+        self._display_blocks = array("q")
+        self._export_dialog = None
+        self._export_path = None
+        self.archive: Optional[LogArchive] = None
+        self._search_dialog = None
+        self._search_title = ""
 
         # 获取日志信号
         log_signal = logger.get_signal()
         if log_signal:
-            log_signal.new_log.connect(self.on_new_log)
+            signal_profiler.connect(log_signal.new_log, self.on_new_log, "LogSignal.new_log")
 
         self.setup_ui()
 
+        # 日志器写入了归档时可以搜索历史日志
+        if logger.archive_path:
+            self.set_archive(LogArchive(logger.archive_path))
+
+        # 连接主题变更信号
+        signal_profiler.connect(theme_manager.theme_changed, self._on_theme_changed,
+                                "ThemeManager.theme_changed")
+
+        # 日志级别和自动滚动也可以在设置页面中修改
+        signal_profiler.connect(settings.value_changed, self._on_setting_changed,
+                                "SettingsStore.value_changed")
+
     def setup_ui(self):
         """设置UI界面"""
         layout = QVBoxLayout(self)
@@ -56,12 +101,12 @@ class LogWidget(QWidget):
         control_layout.setContentsMargins(0, 0, 0, 5)
 
         # 日志级别选择
-        level_label = QLabel("日志级别:")
+        level_label = QLabel(tr("log.level"))
         level_label.setStyleSheet("font-size: 12px;")
 
         self.level_combo = QComboBox()
         self.level_combo.addItems(["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"])
-        self.level_combo.setCurrentText("INFO")
+        self.level_combo.setCurrentText(settings.get(LOG_LEVEL))
         self.level_combo.setFixedWidth(100)
         self.level_combo.setStyleSheet("""
             QComboBox {
@@ -75,30 +120,54 @@ class LogWidget(QWidget):
         self.level_combo.currentTextChanged.connect(self.on_level_changed)
 
         # 自动滚动选项
-        self.auto_scroll = QCheckBox("自动滚动")
-        self.auto_scroll.setChecked(True)
+        self.auto_scroll = QCheckBox(tr("log.auto_scroll"))
+        self.auto_scroll.setObjectName("auto_scroll")
+        self.auto_scroll.setChecked(settings.get(LOG_AUTO_SCROLL))
         self.auto_scroll.setStyleSheet("font-size: 12px;")
+        self.auto_scroll.toggled.connect(self._on_auto_scroll_toggled)
+
+        # 导出按钮
+        self.export_button = QPushButton(tr("log.export"))
+        self.export_button.setObjectName("export_button")
+        self.export_button.setFixedHeight(22)
+        self.export_button.setStyleSheet("font-size: 12px;")
+        self.export_button.clicked.connect(self._on_export_clicked)
+
+        # 归档搜索框，设置归档后显示
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText(tr("log.search_placeholder", days=self.SEARCH_DAYS))
+        self.search_edit.setFixedWidth(180)
+        self.search_edit.setStyleSheet("font-size: 12px;")
+        self.search_edit.setVisible(False)
+        self.search_edit.returnPressed.connect(self._on_search_entered)
 
         # 添加到控制布局
         control_layout.addWidget(level_label)
         control_layout.addWidget(self.level_combo)
         control_layout.addStretch()
+        control_layout.addWidget(self.search_edit)
         control_layout.addWidget(self.auto_scroll)
+        control_layout.addWidget(self.export_button)
 
         # 日志显示区域
-        self.log_text = QTextEdit()
+        self.log_text = QPlainTextEdit()
         self.log_text.setReadOnly(True)
-        self.log_text.setLineWrapMode(QTextEdit.LineWrapMode.WidgetWidth)
+        # 只读显示不需要撤销记录，否则每次追加都会在撤销栈中保留一份文本
+        self.log_text.setUndoRedoEnabled(False)
+        self.log_text.setLineWrapMode(QPlainTextEdit.LineWrapMode.WidgetWidth)
         self.log_text.setStyleSheet("""
-            QTextEdit {
+            QPlainTextEdit {
                 border: none;
-                background-color: #f9f9f9;
                 font-family: Consolas, monospace;
                 font-size: 12px;
                 line-height: 1.5;
                 padding: 5px;
             }
         """)
+        self._update_log_style()
+
+        # 按日志级别着色
+        self.highlighter = LogHighlighter(self.log_text)
 
         # 设置字体
         font = QFont("Consolas", 9)
@@ -117,19 +186,23 @@ class LogWidget(QWidget):
             level: 日志级别
             message: 日志消息
         """
+        # 所有记录都进入存储，导出时可以选择全部或筛选后的记录
+        index = self.store.append(level, message)
+        # 存储丢弃旧记录后显示随之删除，文档不会超过存储的容量
+        if self._displayed and self._displayed[0] < self.store.first_index:
+            self._trim_display()
+
         # 检查当前选择的日志级别是否需要显示
         selected_level = self.level_combo.currentText()
         if Logger.LEVELS.get(level.lower(), 0) < Logger.LEVELS.get(selected_level.lower(), 0):
             return
 
-        # 设置文本颜色
-        text_format = QTextCharFormat()
-        text_format.setForeground(self.LOG_COLORS.get(level, QColor(0, 0, 0)))
+        self._displayed.append(index)
+        self._display_blocks.append(self.log_text.document().blockCount() - 1)
 
-        # 添加日志到文本框
+        # 添加日志到文本框，颜色由高亮器按级别设置
         cursor = self.log_text.textCursor()
         cursor.movePosition(QTextCursor.MoveOperation.End)
-        cursor.setCharFormat(text_format)
         cursor.insertText(message + "\n")
 
         # 自动滚动到底部
@@ -137,15 +210,57 @@ class LogWidget(QWidget):
             scrollbar = self.log_text.verticalScrollBar()
             scrollbar.setValue(scrollbar.maximum())
 
+    def _trim_display(self):
+        """删除已从存储中丢弃的记录的显示文本"""
+        count = bisect_left(self._displayed, self.store.first_index)
+        if count >= len(self._displayed):
+            self.clear_logs()
+            return
+        first_block = self._display_blocks[count]
+        cursor = QTextCursor(self.log_text.document())
+        cursor.setPosition(self.log_text.document().findBlockByNumber(first_block).position(),
+                           QTextCursor.MoveMode.KeepAnchor)
+        cursor.removeSelectedText()
+        del self._displayed[:count]
+        self._display_blocks = array("q", (block - first_block for block in self._display_blocks[count:]))
+
+    def _update_log_style(self):
+        """按当前主题设置日志区域的背景色和默认文字颜色"""
+        # 颜色通过调色板设置，重新设置样式表会导致整个文档重新布局
+        colors = theme_manager.get_theme_colors()
+        palette = self.log_text.palette()
+        palette.setColor(QPalette.ColorRole.Base, QColor(colors['log_bg']))
+        palette.setColor(QPalette.ColorRole.Text, QColor(colors['log_info']))
+        self.log_text.setPalette(palette)
+
+    def _on_theme_changed(self, theme_name):
+        """主题变更时更新样式，只重新着色可见的日志"""
+        self._update_log_style()
+        self.highlighter.update_colors()
+
     @Slot(str)
     def on_level_changed(self, level: str):
         """当日志级别改变时的处理"""
-        # 设置日志过滤级别
-        self.logger.set_level(level.lower())
+        # 设置全局的日志过滤级别，单独设置过级别的组件不受影响
+        self.logger.root.set_level(level.lower())
+        settings.set(LOG_LEVEL, level)
+
+    def _on_auto_scroll_toggled(self, checked: bool):
+        """保存自动滚动选项"""
+        settings.set(LOG_AUTO_SCROLL, checked)
+
+    def _on_setting_changed(self, key, value):
+        """设置页面修改了日志级别或自动滚动时同步控件"""
+        if key == LOG_LEVEL:
+            self.level_combo.setCurrentText(value)
+        elif key == LOG_AUTO_SCROLL:
+            self.auto_scroll.setChecked(value)
 
     def clear_logs(self):
-        """清空日志显示"""
+        """清空日志显示，存储中的记录仍可导出"""
         self.log_text.clear()
+        self._displayed = array("q")
+        self._display_blocks = array("q")
 
     def append_plain_text(self, text: str):
         """添加普通文本到日志显示"""
@@ -156,4 +271,172 @@ class LogWidget(QWidget):
         # 自动滚动到底部
         if self.auto_scroll.isChecked():
             scrollbar = self.log_text.verticalScrollBar()
-            scrollbar.setValue(scrollbar.maximum())
\ No newline at end of file
+            scrollbar.setValue(scrollbar.maximum())
+
+    def _selected_indices(self) -> array:
+        """选中文本所覆盖的记录序号"""
+        cursor = self.log_text.textCursor()
+        if not cursor.hasSelection():
+            return array("q")
+        document = self.log_text.document()
+        first_block = document.findBlock(cursor.selectionStart()).blockNumber()
+        last_block = document.findBlock(cursor.selectionEnd()).blockNumber()
+        # 选区起点所在的记录可能从更早的文本块开始（多行消息）
+        first = max(0, bisect_right(self._display_blocks, first_block) - 1)
+        last = bisect_right(self._display_blocks, last_block)
+        return self._displayed[first:last]
+
+    def _on_export_clicked(self):
+        """选择导出范围"""
+        menu = QMenu(self)
+        menu.addAction(tr("log.export_all"), partial(self._choose_export_file, self.EXPORT_ALL))
+        menu.addAction(tr("log.export_filtered"), partial(self._choose_export_file, self.EXPORT_FILTERED))
+        selection = menu.addAction(tr("log.export_selection"), partial(self._choose_export_file, self.EXPORT_SELECTION))
+        selection.setEnabled(self.log_text.textCursor().hasSelection())
+        menu.exec(self.export_button.mapToGlobal(self.export_button.rect().bottomLeft()))
+
+    def _choose_export_file(self, scope: str):
+        """选择导出文件"""
+        filters = ";;".join(item[0] for item in FILE_FILTERS)
+        path, selected_filter = QFileDialog.getSaveFileName(self, tr("log.export_title"), "logs.txt", filters)
+        if not path:
+            return
+        # 没有输入扩展名时使用所选过滤器的扩展名
+        for text, fmt, compress, extension in FILE_FILTERS:
+            if text == selected_filter and format_from_path(path) != (fmt, compress):
+                path += extension
+                break
+        self.export_logs(scope, path)
+
+    def export_logs(self, scope: str, path: str) -> bool:
+        """
+        在后台导出日志
+
+        Args:
+            scope: 导出范围，EXPORT_ALL、EXPORT_FILTERED 或 EXPORT_SELECTION
+            path: 目标文件，格式由扩展名决定（.txt、.jsonl，加 .gz 表示压缩）
+
+        Returns:
+            是否开始导出
+        """
+        if job_manager.is_running("log_widget.export"):
+            self.logger.warning("已有日志导出正在进行")
+            return False
+
+        fmt, compress = format_from_path(path)
+        options = {"fmt": fmt, "compress": compress}
+        if scope == self.EXPORT_FILTERED:
+            options["min_level"] = Logger.LEVELS.get(self.level_combo.currentText().lower(), 0)
+        elif scope == self.EXPORT_SELECTION:
+            options["indices"] = self._selected_indices()
+            if not options["indices"]:
+                self.logger.warning("没有选中的日志")
+                return False
+
+        self._export_path = path
+        self._export_dialog = QProgressDialog(tr("log.exporting"), tr("log.cancel"), 0, 100, self)
+        self._export_dialog.setWindowTitle(tr("log.export_title"))
+        self._export_dialog.setWindowModality(Qt.WindowModality.WindowModal)
+        self._export_dialog.setMinimumDuration(500)
+        self._export_dialog.setAutoClose(False)
+        self._export_dialog.canceled.connect(partial(job_manager.cancel, "log_widget.export"))
+
+        job = job_manager.submit("log_widget.export", export_records, self.store, path,
+                                 on_result=self._on_export_done,
+                                 on_progress=self._on_export_progress,
+                                 on_error=self._on_export_error,
+                                 on_finished=self._on_export_finished,
+                                 **options)
+        job.signals.cancelled.connect(self._on_export_cancelled)
+        return True
+
+    def _on_export_progress(self, value):
+        """更新导出进度"""
+        processed, total = value
+        if self._export_dialog is not None and total:
+            self._export_dialog.setValue(int(processed * 100 / total))
+
+    def _on_export_done(self, count: int):
+        """导出完成"""
+        self.logger.info("已导出 %d 条日志到 %s", count, self._export_path)
+
+    def _on_export_cancelled(self):
+        """导出被取消"""
+        self.logger.info("日志导出已取消")
+
+    def _on_export_error(self, message: str):
+        """导出出错"""
+        self.logger.error("日志导出失败: %s", message)
+
+    def _on_export_finished(self):
+        """关闭进度对话框"""
+        if self._export_dialog is not None:
+            self._export_dialog.close()
+            self._export_dialog.deleteLater()
+            self._export_dialog = None
+
+    def set_archive(self, archive: Optional[LogArchive]):
+        """设置用于搜索历史日志的归档，None表示关闭搜索"""
+        self.archive = archive
+        self.search_edit.setVisible(archive is not None)
+
+    def _on_search_entered(self):
+        """按回车搜索归档，级别使用当前选择的日志级别"""
+        text = self.search_edit.text().strip()
+        self.search_archive(text, self.level_combo.currentText())
+
+    def search_archive(self, text: str, level: str = "WARNING", days: Optional[float] = None) -> bool:
+        """
+        在后台搜索归档，结果显示在单独的窗口中
+
+        Args:
+            text: 消息中包含的文本，为空时不按文本过滤
+            level: 最低日志级别
+            days: 时间范围（天），默认为 SEARCH_DAYS
+
+        Returns:
+            是否开始搜索
+        """
+        if self.archive is None:
+            return False
+        if job_manager.is_running("log_widget.archive_search"):
+            self.logger.warning("上一次日志搜索尚未完成")
+            return False
+        days = self.SEARCH_DAYS if days is None else days
+        self._search_title = tr("log.search_title", text=text or tr("log.search_all"), level=level, days=days)
+        job_manager.submit("log_widget.archive_search", _search_archive, self.archive, text, level, days,
+                           on_result=self._on_search_done,
+                           on_error=self._on_search_error)
+        return True
+
+    def _on_search_done(self, result):
+        """显示搜索结果"""
+        rows, elapsed_ms = result
+        if self._search_dialog is None:
+            self._search_dialog = QDialog(self)
+            self._search_dialog.resize(800, 500)
+            layout = QVBoxLayout(self._search_dialog)
+            self._search_summary = QLabel()
+            self._search_text = QPlainTextEdit()
+            self._search_text.setReadOnly(True)
+            self._search_text.setFont(QFont("Consolas", 9))
+            self._search_text.setPalette(self.log_text.palette())
+            self._search_highlighter = LogHighlighter(self._search_text)
+            layout.addWidget(self._search_summary)
+            layout.addWidget(self._search_text)
+        else:
+            self._search_text.setPalette(self.log_text.palette())
+            self._search_highlighter.update_colors()
+
+        self._search_dialog.setWindowTitle(self._search_title)
+        self._search_summary.setText(tr("log.search_summary", count=len(rows), elapsed_ms=elapsed_ms))
+        # 与日志显示相同的 "级别 - 时间 - 消息" 格式，按级别着色
+        self._search_text.setPlainText("\n".join(
+            f"{row['level']} - {time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(row['time']))} - {row['message']}"
+            for row in rows))
+        self._search_dialog.show()
+        self._search_dialog.raise_()
+
+    def _on_search_error(self, message: str):
+        """搜索出错"""
+        self.logger.error("日志搜索失败: %s", message)
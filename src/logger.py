@@ -6,35 +6,100 @@
 """
 
 import os
+import sys
+import atexit
 import logging
 import datetime
-from typing import Optional, List
+import threading
+import faulthandler
+from typing import Dict, Optional, List
 
 from PySide6.QtCore import QObject, Signal
 
+from src.log_sinks import LogSink, ConsoleSink, FileSink, SharedFileSink, GuiSink, FAST, FLUSH_TIMEOUT
+from src.log_archive import ArchiveSink
+from src.perf.tracer import tracer, Span
+from src.perf.prometheus import PREFIX, ShardedCounter
+
 
 class LogSignal(QObject):
     """日志信号类，用于向GUI发送日志消息"""
     new_log = Signal(str, str)  # 参数：日志级别，日志消息
 
+    def __init__(self):
+        super().__init__()
+        # 已发送和已投递到GUI线程的日志数量，分别只由GUI输出端线程和GUI线程递增
+        self.sent = 0
+        self.delivered = 0
+        self.new_log.connect(self._on_delivered)
+
+    def _on_delivered(self, level, message):
+        """日志投递到GUI线程"""
+        self.delivered += 1
 
-class GuiLogHandler(logging.Handler):
-    """自定义日志处理器，将日志发送到GUI"""
+    @property
+    def queue_depth(self) -> int:
+        """GUI日志队列深度，即已发送但尚未投递的日志数量"""
+        # 先读取已投递数，之后读到的已发送数不会小于它
+        delivered = self.delivered
+        return self.sent - delivered
+
+
+class LevelCounter(logging.Handler):
+    """
+    按级别统计日志记录数量的处理器
 
-    def __init__(self, signal: LogSignal):
+    挂在根日志器上，组件日志器传播上来的记录同样会被统计。
+    只做计数，不经过处理器的锁和过滤器；计数按线程分片，工作线程和GUI线程互不争用。
+    """
+
+    def __init__(self):
         super().__init__()
-        self.signal = signal
-        self.setFormatter(logging.Formatter('%(levelname)s - %(message)s'))
+        self.counter = ShardedCounter(PREFIX + "log_records_total", "按级别统计的日志记录数量", ("level",))
+
+    def handle(self, record):
+        """统计记录"""
+        self.counter.inc(record.levelname)
+        return True
 
     def emit(self, record):
-        """发送日志记录到GUI"""
-        msg = self.format(record)
-        self.signal.new_log.emit(record.levelname, msg)
+        pass
+
+    @property
+    def counts(self) -> Dict[str, int]:
+        """各级别的记录数量，未出现过的标准级别为0"""
+        counts = {name.upper(): 0 for name in Logger.LEVELS}
+        for (level,), count in self.counter.values().items():
+            counts[level] = count
+        return counts
+
+
+def parse_component_levels(text: str) -> Dict[str, str]:
+    """
+    解析组件级别设置，如 "home=debug, nav=warning"
+
+    Returns:
+        {组件名: 级别名称}，格式不正确或级别未知的项被忽略
+    """
+    levels = {}
+    for item in text.replace(";", ",").split(","):
+        component, _, level = item.partition("=")
+        component, level = component.strip(), level.strip().lower()
+        if component and level in Logger.LEVELS:
+            levels[component] = level
+    return levels
 
 
 class Logger:
     """
     日志管理类 - 支持GUI实时显示和文件、控制台输出
+
+    child() 为各组件创建子日志器（如 CursorProMax.home），子日志器的级别可以单独设置，
+    记录传播到根日志器，由根日志器的输出端输出。
+
+    日志方法支持 % 格式化参数，如 logger.debug("页面 %s 耗时 %.1fms", page_id, ms)。
+    级别未开启时直接返回，不会格式化消息；开启时消息在输出端线程中格式化，
+    因此参数应当是之后不会再被修改的值。
     """
 
     LEVELS = {
@@ -47,7 +112,8 @@ class Logger:
 
     def __init__(self, name: str = "PySideApp", log_dir: str = "logs",
                  console: bool = True, file: bool = True, gui: bool = False,
-                 level: str = "info"):
+                 level: str = "info", archive: bool = False, shared: bool = False,
+                 durability: str = FAST):
         """
         初始化日志管理器
 
@@ -58,6 +124,9 @@ class Logger:
             file: 是否输出到文件
             gui: 是否输出到GUI
             level: 日志级别 (debug, info, warning, error, critical)
+            archive: 是否写入SQLite归档（日志目录下的 名称.db）
+            shared: 日志文件是否与其他进程共享，共享时每次写入都是完整的记录，不会与其他进程的记录交错
+            durability: 日志文件的持久性模式 (fast, safe, durable)，见 FileSink
         """
         self.name = name
         self.log_dir = log_dir
@@ -65,67 +134,286 @@ class Logger:
         self.logger.setLevel(self.LEVELS.get(level.lower(), logging.INFO))
         self.logger.propagate = False
 
+        # 根日志器和已创建的组件日志器
+        self.root = self
+        self.component = None
+        self._children: Dict[str, "ComponentLogger"] = {}
+
         # 清除现有的处理器
         for handler in self.logger.handlers[:]:
             self.logger.removeHandler(handler)
+            if isinstance(handler, LogSink):
+                handler.close()
+
+        # 按级别统计日志数量，包括组件日志器的记录
+        self.level_counter = LevelCounter()
+        self.logger.addHandler(self.level_counter)
 
-        # 设置日志格式
-        formatter = logging.Formatter(
-            '%(asctime)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
+        # 输出端，按名称索引
+        self.sinks: Dict[str, LogSink] = {}
+        # install_exit_hooks() 打开的崩溃记录文件
+        self._crash_file = None
 
-        # 添加控制台处理器
+        # 添加控制台输出端
         if console:
-            console_handler = logging.StreamHandler()
-            console_handler.setFormatter(formatter)
-            self.logger.addHandler(console_handler)
+            self.add_sink(ConsoleSink("console"))
 
-        # 添加文件处理器
+        # 添加文件输出端
+        self.log_file = None
         if file:
             if not os.path.exists(log_dir):
                 os.makedirs(log_dir)
 
             # 以日期命名日志文件
             today = datetime.datetime.now().strftime("%Y-%m-%d")
-            log_file = os.path.join(log_dir, f"{name}_{today}.log")
-
-            file_handler = logging.FileHandler(log_file, encoding='utf-8')
-            file_handler.setFormatter(formatter)
-            self.logger.addHandler(file_handler)
+            self.log_file = os.path.join(log_dir, f"{name}_{today}.log")
+            sink_class = SharedFileSink if shared else FileSink
+            self.add_sink(sink_class("file", self.log_file, durability=durability))
 
         # GUI信号
         self.log_signal = LogSignal() if gui else None
 
-        # 添加GUI处理器
+        # 添加GUI输出端
         if gui and self.log_signal:
-            gui_handler = GuiLogHandler(self.log_signal)
-            self.logger.addHandler(gui_handler)
+            self.add_sink(GuiSink("gui", self.log_signal))
+
+        # 添加归档输出端
+        self.archive_path = None
+        if archive:
+            self.archive_path = os.path.join(log_dir, f"{name}.db")
+            self.add_sink(ArchiveSink("archive", self.archive_path))
+
+    def add_sink(self, sink: LogSink) -> LogSink:
+        """
+        添加输出端，同名的输出端会被替换
+
+        Args:
+            sink: 输出端
+
+        Returns:
+            添加的输出端
+        """
+        self.remove_sink(sink.name)
+        self.sinks[sink.name] = sink
+        self.logger.addHandler(sink)
+        return sink
+
+    def remove_sink(self, name: str, timeout: Optional[float] = 5.0) -> bool:
+        """
+        移除输出端，移除前写完队列中的记录
+
+        Args:
+            name: 输出端名称
+            timeout: 等待写完的最长时间（秒）
+
+        Returns:
+            是否存在该输出端
+        """
+        sink = self.sinks.pop(name, None)
+        if sink is None:
+            return False
+        self.logger.removeHandler(sink)
+        sink.close(timeout)
+        return True
+
+    def get_sink(self, name: str) -> Optional[LogSink]:
+        """获取输出端"""
+        return self.sinks.get(name)
+
+    def sink_stats(self) -> Dict[str, Dict[str, object]]:
+        """各输出端的吞吐量、丢弃数等统计"""
+        return {name: sink.stats() for name, sink in self.sinks.items()}
+
+    def flush(self, timeout: Optional[float] = FLUSH_TIMEOUT) -> bool:
+        """等待所有输出端写完队列中的记录"""
+        return all([sink.flush(timeout) for sink in self.sinks.values()])
+
+    def shutdown(self, timeout: Optional[float] = 5.0):
+        """写完并关闭所有输出端"""
+        for name in list(self.sinks):
+            self.remove_sink(name, timeout)
+
+    def set_durability(self, durability: str):
+        """修改日志文件的持久性模式 (fast, safe, durable)"""
+        sink = self.sinks.get("file")
+        if isinstance(sink, FileSink):
+            sink.set_durability(durability)
+
+    def install_exit_hooks(self, flush_timeout: float = 2.0):
+        """
+        在程序退出和崩溃时写出日志，只需调用一次
+
+        - atexit: 正常退出时写出各输出端的队列和缓冲区
+        - sys.excepthook、threading.excepthook: 未捕获的异常记为CRITICAL并写出后，再交给原来的钩子
+        - faulthandler: 段错误等致命错误发生时无法再执行Python代码，由faulthandler把各线程的
+          调用栈写入日志目录下的 名称_crash.log；ERROR及以上的记录总是立即写入文件，不会留在缓冲区中
+
+        Args:
+            flush_timeout: 每次写出的最长等待时间（秒）
+        """
+        root = self.root
+        if getattr(root, "_exit_hooks_installed", False):
+            return
+        root._exit_hooks_installed = True
+
+        atexit.register(root.flush, flush_timeout)
+
+        previous_excepthook = sys.excepthook
+
+        def excepthook(exc_type, exc, tb):
+            if not issubclass(exc_type, KeyboardInterrupt):
+                root.logger.critical("未捕获的异常", exc_info=(exc_type, exc, tb))
+                root.flush(flush_timeout)
+            previous_excepthook(exc_type, exc, tb)
+
+        sys.excepthook = excepthook
+
+        previous_thread_excepthook = threading.excepthook
+
+        def thread_excepthook(args):
+            if args.exc_type is not SystemExit:
+                thread_name = args.thread.name if args.thread is not None else "?"
+                root.logger.critical("线程 %s 中未捕获的异常", thread_name,
+                                     exc_info=(args.exc_type, args.exc_value, args.exc_traceback))
+                root.flush(flush_timeout)
+            previous_thread_excepthook(args)
+
+        threading.excepthook = thread_excepthook
+
+        if root.log_file:
+            root._crash_file = open(os.path.join(root.log_dir, f"{root.name}_crash.log"), "a", encoding="utf-8")
+            faulthandler.enable(root._crash_file, all_threads=True)
 
     def set_level(self, level: str):
         """设置日志级别"""
         self.logger.setLevel(self.LEVELS.get(level.lower(), logging.INFO))
 
-    def debug(self, message: str):
+    def child(self, component: str) -> "ComponentLogger":
+        """
+        获取组件日志器，同一组件返回同一个实例
+
+        Args:
+            component: 组件名，可以用 "." 分隔多级，如 "home.account"
+        """
+        logger = self._children.get(component)
+        if logger is None:
+            logger = self._children[component] = ComponentLogger(self, component)
+        return logger
+
+    def set_component_level(self, component: str, level: Optional[str]):
+        """设置组件的日志级别，None表示沿用上级的级别"""
+        self.child(component).set_level(level)
+
+    def apply_component_levels(self, levels: Dict[str, str]):
+        """按 {组件名: 级别} 设置组件级别，未列出的组件恢复为沿用上级的级别"""
+        for component in list(self._children):
+            if component not in levels:
+                self._children[component].set_level(None)
+        for component, level in levels.items():
+            self.set_component_level(component, level)
+
+    def component_levels(self) -> Dict[str, Optional[str]]:
+        """已创建的组件日志器的级别，未单独设置的为None"""
+        return {component: logging.getLevelName(child.logger.level) if child.logger.level else None
+                for component, child in self._children.items()}
+
+    def span(self, name: str, **fields) -> Span:
+        """
+        创建耗时区间，可作为上下文管理器或装饰器使用，分类为组件名
+
+        跟踪未开启时不记录任何数据，见 src.perf.tracer。
+        """
+        return tracer.span(name, self.component or self.name, **fields)
+
+    def is_enabled_for(self, level: str) -> bool:
+        """指定级别的日志是否会被记录，用于跳过只为日志准备数据的代码"""
+        return self.logger.isEnabledFor(self.LEVELS[level.lower()])
+
+    def debug(self, message: str, *args):
         """记录调试级别日志"""
-        self.logger.debug(message)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger._log(logging.DEBUG, message, args, stacklevel=2)
 
-    def info(self, message: str):
+    def info(self, message: str, *args):
         """记录信息级别日志"""
-        self.logger.info(message)
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger._log(logging.INFO, message, args, stacklevel=2)
 
-    def warning(self, message: str):
+    def warning(self, message: str, *args):
         """记录警告级别日志"""
-        self.logger.warning(message)
+        if self.logger.isEnabledFor(logging.WARNING):
+            self.logger._log(logging.WARNING, message, args, stacklevel=2)
 
-    def error(self, message: str):
+    def error(self, message: str, *args):
         """记录错误级别日志"""
-        self.logger.error(message)
+        if self.logger.isEnabledFor(logging.ERROR):
+            self.logger._log(logging.ERROR, message, args, stacklevel=2)
 
-    def critical(self, message: str):
+    def critical(self, message: str, *args):
         """记录严重错误级别日志"""
-        self.logger.critical(message)
+        if self.logger.isEnabledFor(logging.CRITICAL):
+            self.logger._log(logging.CRITICAL, message, args, stacklevel=2)
+
+    def record_counts(self) -> Dict[str, int]:
+        """获取各级别已记录的日志数量"""
+        return self.level_counter.counts
 
     def get_signal(self) -> Optional[LogSignal]:
         """获取日志信号对象，用于连接到GUI"""
-        return self.log_signal
\ No newline at end of file
+        return self.log_signal
+
+
+class ComponentLogger(Logger):
+    """
+    组件日志器，由 Logger.child() 创建
+
+    未单独设置级别时沿用上级日志器的级别。输出端、GUI信号和日志统计都属于根日志器，
+    添加或移除输出端同样作用于根日志器。
+    """
+
+    def __init__(self, root: Logger, component: str):
+        self.root = root
+        self.component = component
+        self.name = f"{root.name}.{component}"
+        self.logger = logging.getLogger(self.name)
+        self.logger.propagate = True
+
+    # 以下属性都来自根日志器
+    log_dir = property(lambda self: self.root.log_dir)
+    log_file = property(lambda self: self.root.log_file)
+    archive_path = property(lambda self: self.root.archive_path)
+    sinks = property(lambda self: self.root.sinks)
+    log_signal = property(lambda self: self.root.log_signal)
+    level_counter = property(lambda self: self.root.level_counter)
+
+    def add_sink(self, sink: LogSink) -> LogSink:
+        """在根日志器上添加输出端"""
+        return self.root.add_sink(sink)
+
+    def remove_sink(self, name: str, timeout: Optional[float] = 5.0) -> bool:
+        """从根日志器上移除输出端"""
+        return self.root.remove_sink(name, timeout)
+
+    def shutdown(self, timeout: Optional[float] = 5.0):
+        """关闭根日志器的所有输出端"""
+        self.root.shutdown(timeout)
+
+    def set_level(self, level: Optional[str]):
+        """设置组件的日志级别，None或空字符串表示沿用上级的级别"""
+        self.logger.setLevel(self.LEVELS.get(level.lower(), logging.INFO) if level else logging.NOTSET)
+
+    def child(self, component: str) -> "ComponentLogger":
+        """获取下一级组件日志器"""
+        return self.root.child(f"{self.component}.{component}")
+
+    def set_component_level(self, component: str, level: Optional[str]):
+        """设置下一级组件的日志级别"""
+        self.child(component).set_level(level)
+
+    def apply_component_levels(self, levels: Dict[str, str]):
+        """按根日志器中的组件名设置组件级别"""
+        self.root.apply_component_levels(levels)
+
+    def component_levels(self) -> Dict[str, Optional[str]]:
+        """根日志器中所有组件日志器的级别"""
+        return self.root.component_levels()
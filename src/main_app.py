@@ -5,32 +5,53 @@
 主应用入口模块
 """
 
+import time
+
+# 启动耗时从导入主模块开始计算，包括导入Qt的时间
+START_TIME = time.perf_counter()
+
+import os
 import sys
+from PySide6.QtCore import QTimer
 from PySide6.QtWidgets import QApplication, QHBoxLayout
 
 from src.main_frame import MainFrame
 from src.navigation.navigation import NavigationSidebar
-from src.content.content_pages import ContentManager
-
-
-def main():
-    """应用程序主入口"""
-    app = QApplication(sys.argv)
-
-    # 设置应用程序样式
-    app.setStyle("Fusion")
-
+from src.content.content_manager import ContentManager
+from src.page_registry import page_registry
+from src.settings import settings, LAST_PAGE
+from src.perf.signal_profiler import signal_profiler
+from src.perf.paint_profiler import paint_profiler
+from src.perf import session
+from src.perf.prometheus import (
+    MetricsServer, metrics_registry, logger_collector, configured_port, startup_seconds
+)
+
+
+def create_main_window():
+    """
+    创建并组装主窗口，需要先创建QApplication
+
+    Returns:
+        (主窗口, 导航栏, 内容管理器)
+    """
     # 创建主窗口
     main_window = MainFrame()
 
+    # 打开上次关闭时的页面
+    initial_page = settings.get(LAST_PAGE)
+    if initial_page not in page_registry:
+        initial_page = "home"
+
     # 创建导航栏
-    sidebar = NavigationSidebar()
+    sidebar = NavigationSidebar(initial_page)
 
     # 创建内容管理器
-    content_manager = ContentManager(main_window.logger)
+    content_manager = ContentManager(main_window.logger, initial_page)
 
     # 连接导航信号
-    sidebar.navigation_changed.connect(content_manager.set_current_page)
+    signal_profiler.connect(sidebar.navigation_changed, content_manager.set_current_page,
+                            "NavigationSidebar.navigation_changed")
 
     # 创建并设置主布局
     main_layout = QHBoxLayout()
@@ -44,11 +65,70 @@ def main():
     # 设置主窗口布局
     main_window.set_central_layout(main_layout)
 
-    # 显示窗口
+    return main_window, sidebar, content_manager
+
+
+def _on_started(logger, sidebar):
+    """记录启动耗时，然后加载第三方页面"""
+    elapsed = time.perf_counter() - START_TIME
+    startup_seconds.set(elapsed)
+    logger.debug("启动耗时 %.0fms", elapsed * 1000)
+
+    # 扫描入口点较慢，放在首次绘制之后
+    for info in page_registry.load_plugins(logger):
+        sidebar.add_page(info)
+        logger.debug("已加载第三方页面: %s", info.page_id)
+
+
+def _on_recording_stopped(logger, recorder):
+    """停止录制并记录操作数量"""
+    count = recorder.stop()
+    logger.info("已录制 %d 个操作: %s", count, recorder.path)
+
+
+def main():
+    """应用程序主入口"""
+    app = QApplication(sys.argv)
+
+    # 设置应用程序样式
+    app.setStyle("Fusion")
+
+    # 按需开启绘制耗时分析
+    if paint_profiler.enabled:
+        paint_profiler.install(app)
+
+    # 创建主窗口
+    main_window, sidebar, content_manager = create_main_window()
+
+    # 按需录制界面操作
+    if os.environ.get(session.ENV_VAR):
+        recorder = session.SessionRecorder(os.environ[session.ENV_VAR], main_window, sidebar, content_manager)
+        recorder.start()
+        # 关闭窗口时日志输出端随之关闭，在此之前停止录制
+        main_window.closing.connect(lambda: _on_recording_stopped(main_window.logger, recorder))
+
+    # 按需开启本机指标端点
+    metrics_server = None
+    port = configured_port()
+    if port is not None:
+        metrics_registry.add_collector(logger_collector(main_window.logger))
+        metrics_server = MetricsServer(metrics_registry, port)
+        try:
+            metrics_server.start()
+            main_window.logger.info("指标端点已开启: %s", metrics_server.url)
+        except OSError as e:
+            main_window.logger.warning("指标端点开启失败: %s", e)
+            metrics_server = None
+
+    # 显示窗口，事件循环开始处理事件时即完成启动
     main_window.show()
+    QTimer.singleShot(0, lambda: _on_started(main_window.logger, sidebar))
 
     # 程序入口
-    sys.exit(app.exec())
+    exit_code = app.exec()
+    if metrics_server is not None:
+        metrics_server.stop()
+    sys.exit(exit_code)
 
 
 if __name__ == "__main__":
@@ -6,28 +6,69 @@
 """
 
 from PySide6.QtWidgets import QMainWindow, QWidget
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QByteArray, Signal
 from PySide6.QtGui import QIcon, QFontDatabase, QFont
 
-from src.logger import Logger
+from src.logger import Logger, parse_component_levels
 from src.theme_manager import theme_manager
+from src.settings import settings, THEME, LOG_LEVEL, LOG_COMPONENT_LEVELS, LOG_DURABILITY, LOG_ARCHIVE, WINDOW_GEOMETRY, UI_LOCALE
+from src.jobs import job_manager
+from src.i18n.catalog import translator
+from src.log_archive import LogArchive, import_log_files
+from src.perf.nav_latency import navigation_timer
+from src.perf.signal_profiler import signal_profiler
+from src.perf.watchdog import EventLoopWatchdog
+from src.perf.paint_profiler import paint_profiler
+from src.perf.tracer import tracer
 
 
 class MainFrame(QMainWindow):
     """主应用窗口框架"""
 
+    # 界面卡顿判定阈值（毫秒）
+    STALL_THRESHOLD_MS = 100
+
+    # 窗口即将关闭，在日志输出端关闭之前发出
+    closing = Signal()
+
     def __init__(self):
         super().__init__()
 
-        # 初始化日志
+        # 界面语言在创建页面之前确定，目录在第一次查找文本时才打开
+        translator.set_locale(settings.get(UI_LOCALE))
+
+        # 初始化日志，同时运行的多个实例共享当天的日志文件
         self.logger = Logger(
             name="CursorProMax",
             log_dir="logs",
             console=True,
             file=True,
             gui=True,
-            level="debug"
+            level=settings.get(LOG_LEVEL).lower(),
+            archive=settings.get(LOG_ARCHIVE),
+            shared=True,
+            durability=settings.get(LOG_DURABILITY)
         )
+        # 退出、未捕获的异常和致命错误时写出日志
+        self.logger.install_exit_hooks()
+        # 各组件可以单独设置日志级别，如 "home=debug, nav=warning"
+        self.logger.apply_component_levels(parse_component_levels(settings.get(LOG_COMPONENT_LEVELS)))
+        self.theme_logger = self.logger.child("theme")
+
+        # 开启归档时把归档之前的文本日志导入归档，当天的日志由归档输出端实时写入
+        if self.logger.archive_path:
+            job_manager.submit("log_archive.import", import_log_files,
+                               LogArchive(self.logger.archive_path), self.logger.log_dir,
+                               exclude=[self.logger.log_file],
+                               on_result=self._on_log_import_done)
+
+        # 监控事件循环卡顿
+        self.watchdog = EventLoopWatchdog(self.logger.child("watchdog"), threshold_ms=self.STALL_THRESHOLD_MS, parent=self)
+        self.watchdog.start()
+
+        # 恢复上次的主题，此时其他部件尚未创建
+        if theme_manager.current_theme != settings.get(THEME):
+            theme_manager.set_theme(settings.get(THEME))
 
         # 设置应用字体
         self._setup_fonts()
@@ -35,8 +76,22 @@ class MainFrame(QMainWindow):
         # 设置UI
         self._setup_ui()
 
+        # 恢复窗口位置和大小
+        geometry = settings.get(WINDOW_GEOMETRY)
+        if geometry:
+            self.restoreGeometry(QByteArray.fromBase64(geometry.encode("ascii")))
+
         # 连接主题变更信号
-        theme_manager.theme_changed.connect(self._on_theme_changed)
+        signal_profiler.connect(theme_manager.theme_changed, self._on_theme_changed,
+                                "ThemeManager.theme_changed")
+
+        # 日志级别在设置页面或日志组件中修改
+        signal_profiler.connect(settings.value_changed, self._on_setting_changed,
+                                "SettingsStore.value_changed")
+        signal_profiler.connect(settings.write_failed, self._on_settings_write_failed,
+                                "SettingsStore.write_failed")
+
+        self.logger.debug("设置已加载，耗时 %.2fms", settings.load_ms)
 
         self.logger.info("应用程序框架已初始化")
 
@@ -97,7 +152,7 @@ class MainFrame(QMainWindow):
                 margin: 0px;
             }}
             QScrollBar::handle:vertical {{
-                background: {theme_manager._darken_color(colors['border_color'], 0.2)};
+                background: {theme_manager.darken_color(colors['border_color'], 0.2)};
                 min-height: 20px;
                 border-radius: 4px;
             }}
@@ -114,7 +169,7 @@ class MainFrame(QMainWindow):
                 margin: 0px;
             }}
             QScrollBar::handle:horizontal {{
-                background: {theme_manager._darken_color(colors['border_color'], 0.2)};
+                background: {theme_manager.darken_color(colors['border_color'], 0.2)};
                 min-width: 20px;
                 border-radius: 4px;
             }}
@@ -182,8 +237,27 @@ class MainFrame(QMainWindow):
 
     def _on_theme_changed(self, theme_name):
         """主题变更处理函数"""
-        self.logger.info(f"应用{theme_name}主题")
+        self.theme_logger.info("应用%s主题", theme_name)
         self._update_styles()
+        settings.set(THEME, theme_name)
+
+    def _on_setting_changed(self, key, value):
+        """设置变更处理函数"""
+        if key == LOG_LEVEL:
+            self.logger.set_level(value.lower())
+        elif key == LOG_COMPONENT_LEVELS:
+            self.logger.apply_component_levels(parse_component_levels(value))
+        elif key == LOG_DURABILITY:
+            self.logger.set_durability(value)
+
+    def _on_settings_write_failed(self, message):
+        """设置文件写入失败"""
+        self.logger.error("设置保存失败: %s", message)
+
+    def _on_log_import_done(self, count: int):
+        """历史日志导入完成"""
+        if count:
+            self.logger.info("已将 %d 条历史日志导入归档", count)
 
     def set_central_layout(self, layout):
         """设置中央布局"""
@@ -191,5 +265,22 @@ class MainFrame(QMainWindow):
 
     def closeEvent(self, event):
         """窗口关闭事件"""
+        self.closing.emit()
+        # 取消后台任务，等待工作线程退出
+        if not job_manager.shutdown():
+            self.logger.warning("部分后台任务未能及时结束")
+        self.watchdog.stop()
+        self.watchdog.log_summary()
+        navigation_timer.log_summary(self.logger)
+        signal_profiler.log_report(self.logger)
+        paint_profiler.log_report(self.logger)
+        if tracer.enabled and len(tracer):
+            self.logger.info("已导出跟踪数据: %s", tracer.export(self.logger.log_dir))
+        # 保存窗口位置和大小，写入尚未保存的设置
+        settings.set(WINDOW_GEOMETRY, bytes(self.saveGeometry().toBase64()).decode("ascii"))
+        if not settings.flush():
+            self.logger.warning("设置未能保存")
         self.logger.info("应用程序关闭")
+        # 写完各输出端的队列和缓冲区后关闭输出端，卡住的输出端最多等待2秒
+        self.logger.shutdown(timeout=2.0)
         event.accept()
\ No newline at end of file
@@ -5,10 +5,16 @@
 导航组件实现模块
 """
 
+from functools import partial
+
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton
 from PySide6.QtCore import Qt, Signal
 
+from src.page_registry import page_registry
+from src.perf.nav_latency import navigation_timer
+from src.perf.signal_profiler import signal_profiler
 from src.theme_manager import theme_manager
+from src.i18n.catalog import tr
 
 
 class SidebarButton(QPushButton):
@@ -22,7 +28,8 @@ class SidebarButton(QPushButton):
         self.setCheckable(True)
 
         # 连接主题变更信号
-        theme_manager.theme_changed.connect(self._on_theme_changed)
+        signal_profiler.connect(theme_manager.theme_changed, self._on_theme_changed,
+                                "ThemeManager.theme_changed")
 
     def _update_style(self):
         """更新按钮样式"""
@@ -71,13 +78,15 @@ class NavigationSidebar(QWidget):
     # 定义导航信号
     navigation_changed = Signal(str)
 
-    def __init__(self, parent=None):
+    def __init__(self, initial_page="home", parent=None):
         super().__init__(parent)
+        self._initial_page = initial_page
         self.setFixedWidth(200)
         self._update_styles()
 
         # 连接主题变更信号
-        theme_manager.theme_changed.connect(self._on_theme_changed)
+        signal_profiler.connect(theme_manager.theme_changed, self._on_theme_changed,
+                                "ThemeManager.theme_changed")
 
         self._setup_ui()
 
@@ -98,7 +107,7 @@ class NavigationSidebar(QWidget):
             colors = theme_manager.get_theme_colors()
 
             if theme_name == "light":
-                self.theme_switcher.setText("切换到深色主题")
+                self.theme_switcher.setText(tr("nav.theme_to_dark"))
                 # 浅色主题下的样式
                 self.theme_switcher.setStyleSheet(f"""
                     QPushButton {{
@@ -118,7 +127,7 @@ class NavigationSidebar(QWidget):
                     }}
                 """)
             else:
-                self.theme_switcher.setText("切换到浅色主题")
+                self.theme_switcher.setText(tr("nav.theme_to_light"))
                 # 深色主题下的样式
                 self.theme_switcher.setStyleSheet(f"""
                     QPushButton {{
@@ -177,30 +186,18 @@ class NavigationSidebar(QWidget):
             nav_container.setStyleSheet(f"background-color: {colors['nav_bg']};border: none;")
         else:
             nav_container.setStyleSheet(f"background-color: {colors['nav_bg']};border: none;")
-        nav_layout = QVBoxLayout(nav_container)
-        nav_layout.setContentsMargins(0, 0, 0, 0)
-        nav_layout.setSpacing(0)  # 按钮之间无间距
+        self._nav_layout = QVBoxLayout(nav_container)
+        self._nav_layout.setContentsMargins(0, 0, 0, 0)
+        self._nav_layout.setSpacing(0)  # 按钮之间无间距
 
-        # 导航按钮
-        self.btn_home = SidebarButton("主页")
-        self.btn_account = SidebarButton("账号管理")
-        self.btn_settings = SidebarButton("设置")
-        self.btn_about = SidebarButton("关于")
+        # 导航按钮，由页面注册表生成
+        self._nav_buttons = {}
+        self._current_page = None
+        for info in page_registry.pages():
+            self.add_page(info)
 
         # 设置默认选中
-        self.btn_home.setChecked(True)
-
-        # 连接信号
-        self.btn_home.clicked.connect(lambda: self._on_navigation_changed("home"))
-        self.btn_account.clicked.connect(lambda: self._on_navigation_changed("account"))
-        self.btn_settings.clicked.connect(lambda: self._on_navigation_changed("settings"))
-        self.btn_about.clicked.connect(lambda: self._on_navigation_changed("about"))
-
-        # 添加按钮到导航容器
-        nav_layout.addWidget(self.btn_home)
-        nav_layout.addWidget(self.btn_account)
-        nav_layout.addWidget(self.btn_settings)
-        nav_layout.addWidget(self.btn_about)
+        self._set_checked_page(self._initial_page)
 
         # 添加导航容器到主布局
         layout.addWidget(nav_container)
@@ -222,7 +219,7 @@ class NavigationSidebar(QWidget):
 
         # 添加样式切换按钮
         current_theme = theme_manager.current_theme
-        btn_text = "切换到深色主题" if current_theme == "light" else "切换到浅色主题"
+        btn_text = tr("nav.theme_to_dark") if current_theme == "light" else tr("nav.theme_to_light")
 
         self.theme_switcher = QPushButton(btn_text)
         self.theme_switcher.setFixedHeight(30)
@@ -291,21 +288,36 @@ class NavigationSidebar(QWidget):
         b = max(0, int(b * (1 - factor)))
         return f"#{r:02x}{g:02x}{b:02x}"
 
+    def add_page(self, info):
+        """为页面添加导航按钮，用于启动后加载的第三方页面"""
+        button = SidebarButton(tr(info.label))
+        button.clicked.connect(partial(self._on_navigation_changed, info.page_id))
+        self._nav_layout.addWidget(button)
+        self._nav_buttons[info.page_id] = button
+        return button
+
+    def nav_button(self, page_id):
+        """获取页面对应的导航按钮"""
+        return self._nav_buttons.get(page_id)
+
+    def _set_checked_page(self, page_name):
+        """更新按钮选中状态"""
+        previous = self._nav_buttons.get(self._current_page)
+        if previous is not None:
+            previous.setChecked(False)
+
+        button = self._nav_buttons.get(page_name)
+        if button is not None:
+            button.setChecked(True)
+        self._current_page = page_name
+
     def _on_navigation_changed(self, page_name):
         """导航变更处理函数"""
+        # 记录导航耗时起点
+        navigation_timer.start(page_name)
+
         # 更新按钮选中状态
-        for btn in [self.btn_home, self.btn_account, self.btn_settings, self.btn_about]:
-            btn.setChecked(False)
-
-        # 设置当前按钮选中
-        if page_name == "home":
-            self.btn_home.setChecked(True)
-        elif page_name == "account":
-            self.btn_account.setChecked(True)
-        elif page_name == "settings":
-            self.btn_settings.setChecked(True)
-        elif page_name == "about":
-            self.btn_about.setChecked(True)
+        self._set_checked_page(page_name)
 
         # 发送导航变更信号
         self.navigation_changed.emit(page_name)
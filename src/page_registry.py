@@ -0,0 +1,214 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+页面注册表模块 - 统一管理导航栏按钮和内容页面
+"""
+
+import importlib
+from typing import Callable, Dict, List, Optional
+
+# 第三方页面入口点分组名称
+ENTRY_POINT_GROUP = "cursor_pro_max.pages"
+
+
+class PageInfo:
+    """
+    页面描述信息
+
+    只记录模块路径和工厂名称，页面模块在第一次打开时才会被导入。
+    """
+
+    __slots__ = ("page_id", "label", "module_path", "factory_name", "_factory")
+
+    def __init__(self, page_id: str, label: str, module_path: str,
+                 factory_name: str, factory: Optional[Callable] = None):
+        """
+        初始化页面描述
+
+        Args:
+            page_id: 页面标识，如 "home"
+            label: 导航栏显示的文本或消息标识，显示时通过 tr() 翻译
+            module_path: 页面所在模块路径，如 "src.content.content_pages"
+            factory_name: 模块中的页面工厂（通常是页面类）名称
+            factory: 已解析的工厂对象，为空时在首次使用时导入
+        """
+        self.page_id = page_id
+        self.label = label
+        self.module_path = module_path
+        self.factory_name = factory_name
+        self._factory = factory
+
+    @property
+    def loaded(self) -> bool:
+        """页面模块是否已导入"""
+        return self._factory is not None
+
+    def load_factory(self) -> Callable:
+        """导入页面模块并返回页面工厂，结果会被缓存"""
+        if self._factory is None:
+            module = importlib.import_module(self.module_path)
+            self._factory = getattr(module, self.factory_name)
+        return self._factory
+
+    def __repr__(self):
+        return f"PageInfo({self.page_id!r}, {self.label!r}, {self.module_path}:{self.factory_name})"
+
+
+class PageRegistry:
+    """页面注册表类"""
+
+    def __init__(self):
+        # 字典保持注册顺序，同时提供O(1)查找
+        self._pages: Dict[str, PageInfo] = {}
+        self._plugins_loaded = False
+
+    def register(self, page_id: str, label: str, module_path: str,
+                 factory_name: str, factory: Optional[Callable] = None) -> PageInfo:
+        """
+        注册页面，重复注册同一标识会覆盖原有描述但保留顺序
+
+        Args:
+            page_id: 页面标识
+            label: 导航栏显示的文本或消息标识
+            module_path: 页面所在模块路径
+            factory_name: 页面工厂名称
+            factory: 可选，已解析的页面工厂
+
+        Returns:
+            注册后的页面描述
+        """
+        info = PageInfo(page_id, label, module_path, factory_name, factory)
+        self._pages[page_id] = info
+        return info
+
+    def unregister(self, page_id: str) -> bool:
+        """注销页面"""
+        return self._pages.pop(page_id, None) is not None
+
+    def get(self, page_id: str) -> Optional[PageInfo]:
+        """根据标识获取页面描述"""
+        return self._pages.get(page_id)
+
+    def __contains__(self, page_id) -> bool:
+        return page_id in self._pages
+
+    def pages(self) -> List[PageInfo]:
+        """按注册顺序返回所有页面描述"""
+        return list(self._pages.values())
+
+    def create_page(self, page_id: str, *args, **kwargs):
+        """
+        创建页面实例
+
+        Args:
+            page_id: 页面标识
+            *args: 传递给页面工厂的位置参数
+            **kwargs: 传递给页面工厂的关键字参数
+
+        Raises:
+            KeyError: 页面未注册
+        """
+        info = self.get(page_id)
+        if info is None:
+            raise KeyError(f"未注册的页面: {page_id}")
+        return info.load_factory()(*args, **kwargs)
+
+    def load_plugins(self, logger=None) -> List[PageInfo]:
+        """
+        加载第三方页面，只在第一次调用时扫描入口点
+
+        扫描入口点需要读取所有已安装包的元数据，应在窗口首次绘制之后调用，
+        内置页面的查找和导航栏的构建不依赖它。
+
+        Args:
+            logger: 可选，记录无法加载的第三方页面
+
+        Returns:
+            新注册的第三方页面描述
+        """
+        if self._plugins_loaded:
+            return []
+        self._plugins_loaded = True
+        before = set(self._pages)
+        self.load_entry_points(logger=logger)
+        return [info for page_id, info in self._pages.items() if page_id not in before]
+
+    def load_entry_points(self, group: str = ENTRY_POINT_GROUP, logger=None) -> int:
+        """
+        从包入口点发现第三方页面，通常通过 load_plugins() 调用
+
+        入口点应指向一个轻量的描述对象（PageInfo、字典或元组），
+        而不是页面类本身，这样发现页面时不会导入页面模块::
+
+            [project.entry-points."cursor_pro_max.pages"]
+            stats = "my_plugin.pages:STATS_PAGE"
+
+            # my_plugin/pages.py
+            STATS_PAGE = {"label": "统计", "module": "my_plugin.stats", "factory": "StatsPage"}
+
+        无法加载或格式不正确的入口点被跳过，不影响其他入口点。
+
+        Args:
+            group: 入口点分组名称
+            logger: 可选，记录被跳过的入口点
+
+        Returns:
+            新注册的页面数量
+        """
+        try:
+            from importlib.metadata import entry_points
+        except ImportError:  # pragma: no cover - Python < 3.8
+            return 0
+
+        try:
+            eps = entry_points()
+            if hasattr(eps, "select"):
+                eps = eps.select(group=group)
+            else:
+                eps = eps.get(group, [])
+        except Exception:
+            return 0
+
+        count = 0
+        for ep in eps:
+            try:
+                self._register_spec(ep.name, ep.load())
+            except Exception as e:
+                if logger is not None:
+                    logger.warning("跳过第三方页面 %s: %s", ep.name, e)
+                continue
+            count += 1
+        return count
+
+    def _register_spec(self, name: str, spec) -> PageInfo:
+        """
+        注册入口点指向的页面描述
+
+        Raises:
+            ValueError: 描述对象的格式不正确
+        """
+        if isinstance(spec, PageInfo):
+            self._pages[spec.page_id] = spec
+            return spec
+        if isinstance(spec, dict):
+            fields = {"id": spec.get("id", name), "label": spec.get("label"),
+                      "module": spec.get("module"), "factory": spec.get("factory")}
+            invalid = [key for key, value in fields.items() if not isinstance(value, str) or not value]
+            if invalid:
+                raise ValueError(f"页面描述缺少或包含无效的字段: {', '.join(invalid)}")
+            return self.register(fields["id"], fields["label"], fields["module"], fields["factory"])
+        if (isinstance(spec, (tuple, list)) and len(spec) == 3
+                and all(isinstance(item, str) and item for item in spec)):
+            label, module_path, factory_name = spec
+            return self.register(name, label, module_path, factory_name)
+        raise ValueError(f"不支持的页面描述: {spec!r}")
+
+
+# 创建全局实例并注册内置页面
+page_registry = PageRegistry()
+page_registry.register("home", "nav.home", "src.content.content_pages", "HomePage")
+page_registry.register("account", "nav.account", "src.content.content_pages", "AccountPage")
+page_registry.register("settings", "nav.settings", "src.content.settings_page", "SettingsPage")
+page_registry.register("diagnostics", "nav.diagnostics", "src.content.diagnostics_page", "DiagnosticsPage")
+page_registry.register("about", "nav.about", "src.content.content_pages", "AboutPage")
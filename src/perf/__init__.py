@@ -0,0 +1,3 @@
+"""
+性能诊断模块
+"""
\ No newline at end of file
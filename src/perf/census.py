@@ -0,0 +1,239 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+内存与QObject普查模块 - 在脚本化的主题切换和页面导航前后对比内存和对象数量，发现泄漏
+
+交互使用::
+
+    python -m src.perf.census --cycles 50
+
+作为无界面测试使用::
+
+    result = run_census(main_window, sidebar, content_manager, cycles=20)
+    result.assert_flat()
+"""
+
+import gc
+import sys
+import argparse
+import tracemalloc
+from collections import Counter
+from typing import Dict, List, Optional, Sequence
+
+from PySide6.QtCore import QCoreApplication, QEvent, QObject, SIGNAL
+from PySide6.QtWidgets import QApplication
+
+from src.theme_manager import theme_manager
+
+
+class CensusSnapshot:
+    """某一时刻的内存和QObject快照"""
+
+    def __init__(self, qobjects: Counter, theme_connections: int,
+                 memory: Optional[tracemalloc.Snapshot], traced_bytes: int):
+        self.qobjects = qobjects
+        self.theme_connections = theme_connections
+        self.memory = memory
+        self.traced_bytes = traced_bytes
+
+    @property
+    def qobject_total(self) -> int:
+        """QObject总数"""
+        return sum(self.qobjects.values())
+
+
+def _settle():
+    """处理挂起的事件和延迟删除，然后回收Python垃圾"""
+    app = QCoreApplication.instance()
+    if app is not None:
+        app.processEvents()
+        QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+        app.processEvents()
+    gc.collect()
+
+
+def count_qobjects() -> Counter:
+    """按类名统计所有窗口中存活的QObject"""
+    counts: Counter = Counter()
+    app = QApplication.instance()
+    if app is None:
+        return counts
+    for widget in app.topLevelWidgets():
+        counts[type(widget).__name__] += 1
+        for child in widget.findChildren(QObject):
+            counts[type(child).__name__] += 1
+    return counts
+
+
+def take_snapshot() -> CensusSnapshot:
+    """采集快照，开启tracemalloc时同时采集Python内存分配"""
+    _settle()
+    memory = None
+    traced = 0
+    if tracemalloc.is_tracing():
+        memory = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+        ))
+        # 按过滤后的快照统计，排除之前快照对象本身占用的内存
+        traced = sum(stat.size for stat in memory.statistics("filename"))
+    connections = theme_manager.receivers(SIGNAL("theme_changed(QString)"))
+    return CensusSnapshot(count_qobjects(), connections, memory, traced)
+
+
+class CensusResult:
+    """普查结果"""
+
+    def __init__(self, before: CensusSnapshot, after: CensusSnapshot, cycles: int,
+                 memory_tolerance: int, qobject_tolerance: int):
+        self.before = before
+        self.after = after
+        self.cycles = cycles
+        self.memory_tolerance = memory_tolerance
+        self.qobject_tolerance = qobject_tolerance
+
+    @property
+    def qobject_growth(self) -> Dict[str, int]:
+        """各类QObject的数量增长（只包含有增长的类）"""
+        growth = {}
+        for name in set(self.before.qobjects) | set(self.after.qobjects):
+            delta = self.after.qobjects.get(name, 0) - self.before.qobjects.get(name, 0)
+            if delta > 0:
+                growth[name] = delta
+        return growth
+
+    @property
+    def memory_growth(self) -> int:
+        """Python内存增长（字节），未开启tracemalloc时为0"""
+        return self.after.traced_bytes - self.before.traced_bytes
+
+    @property
+    def connection_growth(self) -> int:
+        """主题信号连接数增长"""
+        return self.after.theme_connections - self.before.theme_connections
+
+    def top_allocations(self, limit: int = 10) -> List[str]:
+        """内存增长最多的代码位置"""
+        if self.before.memory is None or self.after.memory is None:
+            return []
+        stats = self.after.memory.compare_to(self.before.memory, "lineno")
+        return [str(stat) for stat in stats[:limit] if stat.size_diff > 0]
+
+    @property
+    def leaks(self) -> List[str]:
+        """疑似泄漏项"""
+        problems = []
+        for name, delta in sorted(self.qobject_growth.items(), key=lambda item: -item[1]):
+            if delta > self.qobject_tolerance:
+                problems.append(f"QObject {name} 增加了 {delta} 个")
+        if self.connection_growth > self.qobject_tolerance:
+            problems.append(f"theme_changed 信号连接增加了 {self.connection_growth} 个")
+        if self.memory_growth > self.memory_tolerance:
+            problems.append(f"Python内存增长 {self.memory_growth / 1024:.1f}KB")
+        return problems
+
+    @property
+    def ok(self) -> bool:
+        """是否没有发现泄漏"""
+        return not self.leaks
+
+    def format_report(self) -> str:
+        """生成文本报告"""
+        lines = [
+            f"循环次数: {self.cycles}",
+            f"QObject总数: {self.before.qobject_total} -> {self.after.qobject_total}",
+            f"theme_changed连接数: {self.before.theme_connections} -> {self.after.theme_connections}",
+        ]
+        if self.before.memory is not None:
+            lines.append(f"Python内存: {self.before.traced_bytes / 1024:.1f}KB -> "
+                         f"{self.after.traced_bytes / 1024:.1f}KB")
+            allocations = self.top_allocations()
+            if allocations:
+                lines.append("内存增长最多的位置:")
+                lines.extend(f"  {line}" for line in allocations)
+        leaks = self.leaks
+        lines.append("疑似泄漏:" if leaks else "未发现泄漏")
+        lines.extend(f"  {leak}" for leak in leaks)
+        return "\n".join(lines)
+
+    def assert_flat(self):
+        """发现泄漏时抛出AssertionError，用于无界面测试"""
+        if not self.ok:
+            raise AssertionError(self.format_report())
+
+
+def run_cycle(sidebar, pages: Sequence[str], home: str = "home"):
+    """执行一轮脚本操作：两次主题切换并依次访问每个页面"""
+    for _ in range(2):
+        theme_manager.switch_theme()
+        _settle()
+    for page_id in pages:
+        sidebar.nav_button(page_id).click()
+        _settle()
+    sidebar.nav_button(home).click()
+    _settle()
+
+
+def run_census(main_window, sidebar, content_manager, cycles: int = 20,
+               pages: Optional[Sequence[str]] = None, warmup: int = 2,
+               memory_tolerance: int = 256 * 1024, qobject_tolerance: int = 0) -> CensusResult:
+    """
+    在主题切换和页面导航循环前后进行普查
+
+    Args:
+        main_window: 主窗口
+        sidebar: 导航栏
+        content_manager: 内容管理器
+        cycles: 循环次数
+        pages: 要访问的页面标识，默认为导航栏中的所有页面
+        warmup: 预热循环次数，用于排除首次创建页面和缓存带来的增长
+        memory_tolerance: 允许的Python内存增长（字节）
+        qobject_tolerance: 每类QObject允许的数量增长
+
+    Returns:
+        普查结果
+    """
+    if pages is None:
+        pages = list(sidebar._nav_buttons)
+    home = content_manager.current_page or "home"
+
+    for _ in range(warmup):
+        run_cycle(sidebar, pages, home)
+    before = take_snapshot()
+
+    for _ in range(cycles):
+        run_cycle(sidebar, pages, home)
+    after = take_snapshot()
+
+    return CensusResult(before, after, cycles, memory_tolerance, qobject_tolerance)
+
+
+def main(argv=None):
+    """命令行入口"""
+    parser = argparse.ArgumentParser(description="内存与QObject泄漏检查")
+    parser.add_argument("--cycles", type=int, default=20, help="主题切换和导航的循环次数")
+    parser.add_argument("--warmup", type=int, default=2, help="预热循环次数")
+    parser.add_argument("--frames", type=int, default=1, help="tracemalloc记录的调用栈深度")
+    parser.add_argument("--no-tracemalloc", action="store_true", help="不跟踪Python内存分配")
+    args = parser.parse_args(argv)
+
+    if not args.no_tracemalloc:
+        tracemalloc.start(args.frames)
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    from src.main_app import create_main_window
+    main_window, sidebar, content_manager = create_main_window()
+    main_window.show()
+
+    result = run_census(main_window, sidebar, content_manager,
+                        cycles=args.cycles, warmup=args.warmup)
+    print(result.format_report())
+
+    main_window.close()
+    app.processEvents()
+    return 0 if result.ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+直方图模块 - HDR风格的对数线性分桶直方图
+"""
+
+import math
+from typing import Dict, Iterable, Iterator, Tuple
+
+
+class LatencyHistogram:
+    """
+    HDR风格直方图
+
+    数值按2的幂分段，每段内再线性细分为固定数量的子桶，
+    因此在整个量程内保持相同的相对精度，记录操作为O(1)且内存占用很小。
+    数值单位由调用方决定，本项目统一使用微秒。
+    """
+
+    def __init__(self, significant_bits: int = 7):
+        """
+        初始化直方图
+
+        Args:
+            significant_bits: 子桶精度位数，7位约对应1%的相对误差
+        """
+        self._sub_bits = significant_bits
+        self._sub_count = 1 << significant_bits
+        self._half_count = self._sub_count >> 1
+        self._counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+
+    def _index_for(self, value: int) -> int:
+        """计算数值所在的桶序号"""
+        if value < self._sub_count:
+            return value
+        shift = value.bit_length() - self._sub_bits
+        return self._sub_count + (shift - 1) * self._half_count + ((value >> shift) - self._half_count)
+
+    def _bounds_for(self, index: int) -> Tuple[int, int]:
+        """计算桶序号对应的数值范围（闭区间）"""
+        if index < self._sub_count:
+            return index, index
+        offset = index - self._sub_count
+        shift = offset // self._half_count + 1
+        sub = offset % self._half_count + self._half_count
+        return sub << shift, ((sub + 1) << shift) - 1
+
+    def record(self, value: int, count: int = 1):
+        """记录一个数值"""
+        value = max(0, int(value))
+        index = self._index_for(value)
+        self._counts[index] = self._counts.get(index, 0) + count
+
+        if self.count == 0 or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self.count += count
+        self.total += value * count
+
+    @property
+    def mean(self) -> float:
+        """平均值"""
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, percent: float) -> int:
+        """
+        计算百分位数
+
+        Args:
+            percent: 百分位（0-100）
+
+        Returns:
+            该百分位所在桶的上界，不超过记录过的最大值
+        """
+        if self.count == 0:
+            return 0
+        target = max(1, math.ceil(self.count * percent / 100.0))
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= target:
+                return min(self._bounds_for(index)[1], self.max)
+        return self.max
+
+    def percentiles(self, percents: Iterable[float] = (50, 95, 99)) -> Dict[float, int]:
+        """一次计算多个百分位数"""
+        return {percent: self.percentile(percent) for percent in percents}
+
+    def buckets(self) -> Iterator[Tuple[int, int, int]]:
+        """按数值从小到大遍历非空桶，返回 (下界, 上界, 计数)"""
+        for index in sorted(self._counts):
+            low, high = self._bounds_for(index)
+            yield low, high, self._counts[index]
+
+    def count_at_or_below(self, value: int) -> int:
+        """统计不大于指定数值的记录数量（按桶上界近似）"""
+        return sum(count for _, high, count in self.buckets() if high <= value)
+
+    def merge(self, other: "LatencyHistogram"):
+        """合并另一个相同精度的直方图"""
+        if other._sub_bits != self._sub_bits:
+            raise ValueError("直方图精度不一致，无法合并")
+        if other.count == 0:
+            return
+        for index, count in other._counts.items():
+            self._counts[index] = self._counts.get(index, 0) + count
+        if self.count == 0 or other.min < self.min:
+            self.min = other.min
+        self.max = max(self.max, other.max)
+        self.count += other.count
+        self.total += other.total
+
+    def reset(self):
+        """清空直方图"""
+        self._counts.clear()
+        self.count = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+
+    def summary(self, scale: float = 1000.0) -> Dict[str, float]:
+        """
+        生成统计摘要
+
+        Args:
+            scale: 输出单位换算系数，默认将微秒换算为毫秒
+        """
+        return {
+            "count": self.count,
+            "mean": self.mean / scale,
+            "p50": self.percentile(50) / scale,
+            "p95": self.percentile(95) / scale,
+            "p99": self.percentile(99) / scale,
+            "max": self.max / scale,
+        }
@@ -0,0 +1,206 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+运行时指标采样模块 - 将各项运行指标采样到固定大小的环形缓冲区
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+from PySide6.QtCore import QObject
+from PySide6.QtWidgets import QApplication
+
+from src.perf.nav_latency import navigation_timer
+from src.theme_manager import theme_manager
+
+
+class RingBuffer:
+    """固定容量的浮点数环形缓冲区"""
+
+    __slots__ = ("capacity", "_data", "_head", "_size")
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._data = array("d", bytes(8 * capacity))
+        self._head = 0
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def append(self, value: float):
+        """追加一个数值，缓冲区满时覆盖最旧的数值"""
+        self._data[self._head] = value
+        self._head = (self._head + 1) % self.capacity
+        if self._size < self.capacity:
+            self._size += 1
+
+    @property
+    def last(self) -> float:
+        """最新的数值"""
+        if not self._size:
+            return 0.0
+        return self._data[self._head - 1]
+
+    def values(self) -> List[float]:
+        """按时间顺序返回所有数值"""
+        if self._size < self.capacity:
+            return self._data[:self._size].tolist()
+        return self._data[self._head:].tolist() + self._data[:self._head].tolist()
+
+    def clear(self):
+        """清空缓冲区"""
+        self._head = 0
+        self._size = 0
+
+
+def rss_bytes() -> int:
+    """获取当前进程的常驻内存（字节），无法获取时返回0"""
+    try:
+        if sys.platform.startswith("linux"):
+            with open("/proc/self/statm", "rb") as f:
+                return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+        if sys.platform == "win32":
+            import ctypes
+            from ctypes import wintypes
+
+            class ProcessMemoryCounters(ctypes.Structure):
+                _fields_ = [
+                    ("cb", wintypes.DWORD),
+                    ("PageFaultCount", wintypes.DWORD),
+                    ("PeakWorkingSetSize", ctypes.c_size_t),
+                    ("WorkingSetSize", ctypes.c_size_t),
+                    ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                    ("PagefileUsage", ctypes.c_size_t),
+                    ("PeakPagefileUsage", ctypes.c_size_t),
+                ]
+
+            counters = ProcessMemoryCounters()
+            counters.cb = ctypes.sizeof(counters)
+            process = ctypes.windll.kernel32.GetCurrentProcess()
+            if ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb):
+                return counters.WorkingSetSize
+            return 0
+
+        # macOS等平台只能获取峰值
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    except Exception:
+        return 0
+
+
+# python_heap() 的单位
+HEAP_BYTES = "bytes"    # 开启tracemalloc时已跟踪的字节数
+HEAP_BLOCKS = "blocks"  # 未开启时已分配的内存块数量
+
+
+def python_heap() -> Tuple[int, str]:
+    """
+    获取Python堆占用
+
+    Returns:
+        (数值, 单位)：开启tracemalloc时为已跟踪的字节数和 HEAP_BYTES，否则为已分配的内存块数量和 HEAP_BLOCKS
+    """
+    if tracemalloc.is_tracing():
+        return tracemalloc.get_traced_memory()[0], HEAP_BYTES
+    return sys.getallocatedblocks(), HEAP_BLOCKS
+
+
+def qobject_count() -> int:
+    """统计所有顶层窗口下存活的QObject数量"""
+    app = QApplication.instance()
+    if app is None:
+        return 0
+    return sum(1 + len(widget.findChildren(QObject)) for widget in app.topLevelWidgets())
+
+
+class MetricsSampler:
+    """
+    运行时指标采样器
+
+    只在调用 sample() 时采集数据，由诊断页面在可见时定时驱动，
+    页面隐藏后不产生任何开销。历史数据保存在固定大小的环形缓冲区中。
+    """
+
+    # 日志级别对应的指标名称
+    LEVEL_KEYS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+
+    def __init__(self, capacity: int = 120):
+        """
+        初始化采样器
+
+        Args:
+            capacity: 每项指标保留的采样点数量
+        """
+        self.capacity = capacity
+        self.buffers: Dict[str, RingBuffer] = {}
+        self._last_counts: Optional[Dict[str, int]] = None
+        self._last_time = 0.0
+        # python_heap 指标的单位，见 python_heap()
+        self.heap_unit = HEAP_BLOCKS
+
+    def buffer(self, key: str) -> RingBuffer:
+        """获取指标对应的环形缓冲区"""
+        ring = self.buffers.get(key)
+        if ring is None:
+            ring = self.buffers[key] = RingBuffer(self.capacity)
+        return ring
+
+    def restart(self):
+        """重新开始计算速率，避免把不可见期间的平均值当作当前速率"""
+        self._last_counts = None
+
+    def sample(self, logger, watchdog=None) -> Dict[str, float]:
+        """
+        采集一次所有指标
+
+        Args:
+            logger: 日志管理器，用于获取各级别日志数量和GUI日志队列
+            watchdog: 可选，事件循环看门狗，用于获取事件循环延迟
+
+        Returns:
+            本次采样的指标值
+        """
+        now = time.perf_counter()
+        values: Dict[str, float] = {}
+
+        # 各级别日志速率
+        counts = logger.record_counts()
+        if self._last_counts is not None and now > self._last_time:
+            elapsed = now - self._last_time
+            for level in self.LEVEL_KEYS:
+                delta = counts.get(level, 0) - self._last_counts.get(level, 0)
+                values[f"log_rate.{level}"] = delta / elapsed
+        self._last_counts = counts
+        self._last_time = now
+
+        signal = logger.get_signal()
+        values["gui_log_queue"] = signal.queue_depth if signal else 0
+        values["rss"] = rss_bytes()
+        heap, unit = python_heap()
+        if unit != self.heap_unit:
+            # 开启或关闭tracemalloc后单位变化，之前的采样点不可比较
+            self.buffer("python_heap").clear()
+            self.heap_unit = unit
+        values["python_heap"] = heap
+        values["qobjects"] = qobject_count()
+        values["event_loop_lag"] = watchdog.last_lag_ms if watchdog else 0.0
+        values["theme_switch"] = theme_manager.last_switch_ms
+        values["navigation"] = navigation_timer.last_latency_ms
+
+        for key, value in values.items():
+            self.buffer(key).append(value)
+        return values
+
+
+# 创建全局实例，历史数据在诊断页面被回收重建后仍然保留
+metrics_sampler = MetricsSampler()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+导航耗时统计模块 - 测量从点击导航按钮到目标页面首次绘制完成的耗时
+"""
+
+import time
+from typing import Dict, Optional
+
+from PySide6.QtCore import QObject, QEvent, QTimer, Signal
+
+from src.perf.histogram import LatencyHistogram
+from src.perf.prometheus import metrics_registry
+
+# 导出到指标端点的导航耗时，按页面和是否新建页面分组
+NAVIGATION_SECONDS = metrics_registry.histogram(
+    "navigation_seconds", "从点击导航到目标页面首次绘制完成的耗时（秒）", ("page", "kind"))
+
+
+class NavigationTimer(QObject):
+    """导航耗时统计类"""
+
+    # 一次导航测量完成：页面标识，耗时（毫秒），是否新建页面
+    navigation_measured = Signal(str, float, bool)
+
+    def __init__(self):
+        super().__init__()
+        # 页面标识 -> {"built": 直方图, "reused": 直方图}
+        self._histograms: Dict[str, Dict[str, LatencyHistogram]] = {}
+        self._pending_page: Optional[str] = None
+        self._pending_start = 0
+        self._target = None
+        self._target_built = False
+        self.last_latency_ms = 0.0
+
+    def start(self, page_id: str):
+        """记录导航起点，通常在导航按钮点击时调用"""
+        self._pending_page = page_id
+        self._pending_start = time.perf_counter_ns()
+
+    def page_shown(self, page_id: str, widget, built: bool, already_current: bool = False):
+        """
+        页面已被设为当前页面，等待其首次绘制
+
+        Args:
+            page_id: 页面标识
+            widget: 页面部件
+            built: 页面是否为本次新建
+            already_current: 页面本来就是当前页面，此时不会重绘，不做统计
+        """
+        # 非点击触发的导航（如初始页面、回放）从此处开始计时
+        if self._pending_page != page_id:
+            self.start(page_id)
+
+        self._release_target()
+        if already_current:
+            self._pending_page = None
+            return
+
+        self._target = widget
+        self._target_built = built
+        widget.installEventFilter(self)
+
+    def _release_target(self):
+        """移除对上一个目标页面的监听"""
+        if self._target is not None:
+            try:
+                self._target.removeEventFilter(self)
+            except RuntimeError:
+                # 页面已被回收
+                pass
+            self._target = None
+
+    def eventFilter(self, obj, event):
+        """监听目标页面的绘制事件"""
+        if obj is self._target and event.type() == QEvent.Type.Paint:
+            self._release_target()
+            # 子部件在同一次重绘中依次绘制，零延时定时器在整次重绘结束后触发
+            QTimer.singleShot(0, self._finish)
+        return False
+
+    def _finish(self):
+        """完成一次测量"""
+        page_id = self._pending_page
+        if page_id is None:
+            return
+        self._pending_page = None
+
+        elapsed_us = (time.perf_counter_ns() - self._pending_start) // 1000
+        kind = "built" if self._target_built else "reused"
+        histograms = self._histograms.setdefault(
+            page_id, {"built": LatencyHistogram(), "reused": LatencyHistogram()})
+        histograms[kind].record(elapsed_us)
+        NAVIGATION_SECONDS.observe(elapsed_us / 1e6, page_id, kind)
+
+        self.last_latency_ms = elapsed_us / 1000.0
+        self.navigation_measured.emit(page_id, self.last_latency_ms, self._target_built)
+
+    def stats(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """
+        获取各页面的导航耗时统计
+
+        Returns:
+            {页面标识: {"built"/"reused"/"all": {count, mean, p50, p95, p99, max}}}，单位毫秒
+        """
+        result = {}
+        for page_id, histograms in self._histograms.items():
+            combined = LatencyHistogram()
+            combined.merge(histograms["built"])
+            combined.merge(histograms["reused"])
+            result[page_id] = {
+                "built": histograms["built"].summary(),
+                "reused": histograms["reused"].summary(),
+                "all": combined.summary(),
+            }
+        return result
+
+    def histograms(self) -> Dict[str, Dict[str, LatencyHistogram]]:
+        """获取原始直方图（单位微秒）"""
+        return self._histograms
+
+    def reset(self):
+        """清空统计"""
+        self._histograms.clear()
+
+    def log_summary(self, logger):
+        """将各页面导航耗时的百分位数写入日志"""
+        for page_id, kinds in self.stats().items():
+            for kind in ("built", "reused"):
+                summary = kinds[kind]
+                if not summary["count"]:
+                    continue
+                logger.info("导航耗时 %s (%s): 次数=%d p50=%.1fms p95=%.1fms p99=%.1fms max=%.1fms",
+                            page_id, "新建" if kind == "built" else "复用", summary["count"],
+                            summary["p50"], summary["p95"], summary["p99"], summary["max"])
+
+
+# 创建全局实例
+navigation_timer = NavigationTimer()
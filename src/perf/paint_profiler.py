@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+绘制耗时分析模块 - 通过应用程序事件过滤器统计各部件处理绘制事件的耗时
+"""
+
+import os
+import time
+from typing import Dict, List, Set, Tuple
+
+from PySide6.QtCore import QObject, QEvent, QCoreApplication
+
+# 设置该环境变量为1即可在启动时开启绘制分析
+ENV_VAR = "CURSOR_PRO_MAX_PROFILE_PAINT"
+
+
+class PaintStats:
+    """单类部件的绘制统计"""
+
+    __slots__ = ("class_name", "object_name", "count", "total_ns", "max_ns")
+
+    def __init__(self, class_name: str, object_name: str):
+        self.class_name = class_name
+        self.object_name = object_name
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+    def as_dict(self) -> Dict[str, object]:
+        """转换为字典，时间单位毫秒"""
+        return {
+            "class": self.class_name,
+            "object": self.object_name,
+            "count": self.count,
+            "total_ms": self.total_ns / 1e6,
+            "mean_ms": self.total_ns / self.count / 1e6 if self.count else 0.0,
+            "max_ms": self.max_ns / 1e6,
+        }
+
+
+class PaintProfiler(QObject):
+    """
+    绘制耗时分析器
+
+    安装在QApplication上，拦截绘制事件后在计时中重新投递给目标部件，
+    因此统计的是该部件自身的绘制耗时（子部件的绘制在之后单独进行，不计入父部件）。
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.enabled = os.environ.get(ENV_VAR) == "1"
+        self._installed = False
+        self._stats: Dict[Tuple[str, str], PaintStats] = {}
+        # 正在计时中的部件，重新投递的事件不再拦截
+        self._active: Set[int] = set()
+
+    @property
+    def installed(self) -> bool:
+        """是否已安装事件过滤器"""
+        return self._installed
+
+    def install(self, app=None):
+        """在应用程序上安装事件过滤器"""
+        app = app or QCoreApplication.instance()
+        if app is None or self._installed:
+            return
+        app.installEventFilter(self)
+        self._installed = True
+        self.enabled = True
+
+    def uninstall(self, app=None):
+        """移除事件过滤器"""
+        app = app or QCoreApplication.instance()
+        if app is None or not self._installed:
+            return
+        app.removeEventFilter(self)
+        self._installed = False
+
+    def eventFilter(self, obj, event):
+        """计时绘制事件"""
+        if event.type() != QEvent.Type.Paint:
+            return False
+
+        key = id(obj)
+        if key in self._active:
+            return False
+
+        self._active.add(key)
+        start = time.perf_counter_ns()
+        try:
+            QCoreApplication.sendEvent(obj, event)
+        finally:
+            elapsed = time.perf_counter_ns() - start
+            self._active.discard(key)
+
+        stats_key = (type(obj).__name__, obj.objectName())
+        stats = self._stats.get(stats_key)
+        if stats is None:
+            stats = self._stats[stats_key] = PaintStats(*stats_key)
+        stats.count += 1
+        stats.total_ns += elapsed
+        if elapsed > stats.max_ns:
+            stats.max_ns = elapsed
+
+        # 事件已经处理，不再重复投递
+        return True
+
+    def reset(self):
+        """清空统计数据"""
+        self._stats.clear()
+
+    def report(self, top: int = 0, by: str = "total_ms") -> List[Dict[str, object]]:
+        """
+        生成排序后的报告
+
+        Args:
+            top: 只返回前N项，0表示全部
+            by: 排序字段，total_ms 或 max_ms
+        """
+        rows = sorted((stats.as_dict() for stats in self._stats.values()),
+                      key=lambda row: row[by], reverse=True)
+        return rows[:top] if top else rows
+
+    def format_report(self, top: int = 15) -> str:
+        """生成文本报告，包含总耗时和最坏情况两个排行"""
+        lines = [f"{'总耗时(ms)':>10} {'次数':>6} {'平均(ms)':>9} {'最大(ms)':>9}  部件"]
+        for row in self.report(top):
+            name = f"{row['class']}#{row['object']}" if row["object"] else row["class"]
+            lines.append(f"{row['total_ms']:>10.2f} {row['count']:>6} {row['mean_ms']:>9.3f} "
+                         f"{row['max_ms']:>9.3f}  {name}")
+        worst = self.report(5, by="max_ms")
+        if worst:
+            lines.append("单次绘制最慢:")
+            for row in worst:
+                name = f"{row['class']}#{row['object']}" if row["object"] else row["class"]
+                lines.append(f"{row['max_ms']:>10.3f}ms  {name}")
+        return "\n".join(lines)
+
+    def log_report(self, logger, top: int = 15):
+        """将报告写入日志"""
+        if self._installed and self._stats:
+            logger.info("绘制耗时统计:\n%s", self.format_report(top))
+
+
+# 创建全局实例
+paint_profiler = PaintProfiler()
@@ -0,0 +1,375 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+指标导出模块 - 在本机端口上以Prometheus文本格式提供运行指标
+
+热路径上的计数器和直方图按线程分片：每个线程只写自己的分片，不加锁，
+抓取时由后台线程复制各分片并求和。日志数量、内存占用等已有的统计在抓取时
+由收集函数读取，不增加任何运行开销。
+
+默认关闭。设置环境变量 CURSOR_PRO_MAX_METRICS_PORT=端口号 后启动即可开启，
+只监听 127.0.0.1::
+
+    curl http://127.0.0.1:9464/metrics
+"""
+
+import os
+import math
+import bisect
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# 设置该环境变量为端口号即可在启动时开启指标端点
+ENV_VAR = "CURSOR_PRO_MAX_METRICS_PORT"
+
+# 指标名称前缀
+PREFIX = "cursorpromax_"
+
+# 默认的直方图分桶上界（秒），覆盖1毫秒到10秒
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# 指标族：(名称, 类型, 说明, [(标签, 数值)])
+MetricFamily = Tuple[str, str, str, List[Tuple[Dict[str, str], float]]]
+
+
+class ThreadShards:
+    """
+    按线程分片的存储
+
+    每个线程第一次写入时创建自己的分片并登记，之后只通过线程局部变量访问，
+    写入不需要加锁。线程结束后分片保留，计数不会丢失。
+    """
+
+    def __init__(self, factory: Callable[[], object]):
+        self._factory = factory
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._shards: List[object] = []
+
+    def get(self):
+        """获取当前线程的分片"""
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._local.shard = self._factory()
+            with self._lock:
+                self._shards.append(shard)
+            return shard
+
+    def all(self) -> List[object]:
+        """所有线程的分片"""
+        with self._lock:
+            return list(self._shards)
+
+
+class ShardedCounter:
+    """按线程分片的计数器，可以带标签"""
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str] = ()):
+        self.name = name
+        self.help = help_text
+        self.label_names = tuple(label_names)
+        self._shards = ThreadShards(dict)
+
+    def inc(self, *labels: str, amount: float = 1):
+        """
+        增加计数
+
+        Args:
+            labels: 标签值，顺序与 label_names 一致
+            amount: 增加量
+        """
+        shard = self._shards.get()
+        shard[labels] = shard.get(labels, 0) + amount
+
+    def values(self) -> Dict[Tuple[str, ...], float]:
+        """各标签组合的合计值"""
+        totals: Dict[Tuple[str, ...], float] = {}
+        for shard in self._shards.all():
+            # dict() 在GIL保护下一次完成复制，写入线程不会打断
+            for labels, value in dict(shard).items():
+                totals[labels] = totals.get(labels, 0) + value
+        return totals
+
+    def collect(self) -> Iterable[MetricFamily]:
+        values = self.values()
+        if not self.label_names and not values:
+            # 不带标签的计数器在第一次增加之前输出0
+            values[()] = 0
+        samples = [(dict(zip(self.label_names, labels)), value) for labels, value in values.items()]
+        yield self.name, "counter", self.help, samples
+
+
+class ShardedHistogram:
+    """
+    按线程分片的直方图，分桶固定
+
+    每个分片为 {标签: [各桶计数..., 总和]}，抓取时累加为Prometheus的累积分桶。
+    """
+
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help_text
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(sorted(buckets))
+        self._shards = ThreadShards(dict)
+
+    def observe(self, value: float, *labels: str):
+        """
+        记录一个数值
+
+        Args:
+            value: 数值，耗时类指标的单位为秒
+            labels: 标签值，顺序与 label_names 一致
+        """
+        shard = self._shards.get()
+        cells = shard.get(labels)
+        if cells is None:
+            # 最后一个桶为 +Inf，之后是总和
+            cells = shard[labels] = [0] * (len(self.buckets) + 2)
+        cells[bisect.bisect_left(self.buckets, value)] += 1
+        cells[-1] += value
+
+    def values(self) -> Dict[Tuple[str, ...], List[float]]:
+        """各标签组合合计后的 [各桶计数..., 总和]（非累积）"""
+        totals: Dict[Tuple[str, ...], List[float]] = {}
+        for shard in self._shards.all():
+            for labels, cells in dict(shard).items():
+                cells = list(cells)
+                merged = totals.get(labels)
+                if merged is None:
+                    totals[labels] = cells
+                else:
+                    for index, value in enumerate(cells):
+                        merged[index] += value
+        return totals
+
+    def collect(self) -> Iterable[MetricFamily]:
+        values = self.values()
+        if not self.label_names and not values:
+            values[()] = [0] * (len(self.buckets) + 2)
+        samples = []
+        for labels, cells in values.items():
+            label_map = dict(zip(self.label_names, labels))
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), cells):
+                cumulative += count
+                samples.append((dict(label_map, le=_format_value(bound)), cumulative, "_bucket"))
+            samples.append((label_map, cells[-1], "_sum"))
+            samples.append((label_map, cumulative, "_count"))
+        yield self.name, "histogram", self.help, samples
+
+
+class Gauge:
+    """仪表，写入为单次赋值"""
+
+    def __init__(self, name: str, help_text: str):
+        self.name = name
+        self.help = help_text
+        self.value = 0.0
+
+    def set(self, value: float):
+        """设置数值"""
+        self.value = value
+
+    def collect(self) -> Iterable[MetricFamily]:
+        yield self.name, "gauge", self.help, [({}, self.value)]
+
+
+class MetricsRegistry:
+    """指标注册表，负责按Prometheus文本格式输出所有指标"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, object] = {}
+        self._collectors: List[Callable[[], Iterable[MetricFamily]]] = []
+
+    def _register(self, metric):
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help_text: str, label_names: Sequence[str] = ()) -> ShardedCounter:
+        """创建计数器，名称已存在时返回已有的计数器"""
+        return self._register(ShardedCounter(PREFIX + name, help_text, label_names))
+
+    def histogram(self, name: str, help_text: str, label_names: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> ShardedHistogram:
+        """创建直方图，名称已存在时返回已有的直方图"""
+        return self._register(ShardedHistogram(PREFIX + name, help_text, label_names, buckets))
+
+    def gauge(self, name: str, help_text: str) -> Gauge:
+        """创建仪表，名称已存在时返回已有的仪表"""
+        return self._register(Gauge(PREFIX + name, help_text))
+
+    def add_collector(self, collector: Callable[[], Iterable[MetricFamily]]):
+        """
+        添加抓取时调用的收集函数
+
+        收集函数在端点的工作线程中调用，返回 (名称, 类型, 说明, [(标签, 数值)]) 的序列，
+        只能读取数据，不能调用Qt部件。
+        """
+        with self._lock:
+            self._collectors.append(collector)
+
+    def remove_collector(self, collector: Callable[[], Iterable[MetricFamily]]):
+        """移除收集函数"""
+        with self._lock:
+            if collector in self._collectors:
+                self._collectors.remove(collector)
+
+    def collect(self) -> List[MetricFamily]:
+        """收集所有指标"""
+        with self._lock:
+            sources = [metric.collect for metric in self._metrics.values()] + list(self._collectors)
+        families = []
+        for source in sources:
+            families.extend(source())
+        return families
+
+    def render(self) -> str:
+        """按Prometheus文本格式输出"""
+        lines = []
+        for name, kind, help_text, samples in self.collect():
+            lines.append(f"# HELP {name} {_escape_help(help_text)}")
+            lines.append(f"# TYPE {name} {kind}")
+            for sample in samples:
+                labels, value = sample[0], sample[1]
+                suffix = sample[2] if len(sample) > 2 else ""
+                lines.append(f"{name}{suffix}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape_help(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    items = []
+    for key, value in labels.items():
+        value = str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        items.append(f'{key}="{value}"')
+    return "{" + ",".join(items) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def logger_collector(logger) -> Callable[[], Iterable[MetricFamily]]:
+    """
+    创建读取日志统计的收集函数
+
+    Args:
+        logger: 根日志管理器
+    """
+    from src.perf.metrics import rss_bytes
+
+    def collect():
+        counts = logger.record_counts()
+        yield (PREFIX + "log_records_total", "counter", "按级别统计的日志记录数量",
+               [({"level": level}, count) for level, count in counts.items()])
+        sinks = logger.sink_stats()
+        yield (PREFIX + "log_dropped_records_total", "counter", "输出端队列已满时丢弃的日志记录数量",
+               [({"sink": name}, stats.get("dropped", 0)) for name, stats in sinks.items()])
+        signal = logger.get_signal()
+        yield (PREFIX + "gui_log_queue_depth", "gauge", "等待投递到GUI线程的日志数量",
+               [({}, signal.queue_depth if signal else 0)])
+        yield "process_resident_memory_bytes", "gauge", "进程常驻内存（字节）", [({}, rss_bytes())]
+
+    return collect
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    """只响应 GET /metrics"""
+
+    def do_GET(self):
+        if self.path.split("?", 1)[0] not in ("/metrics", "/"):
+            self.send_error(404)
+            return
+        body = self.server.registry.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # 不在控制台输出访问记录
+        pass
+
+
+class MetricsServer:
+    """在后台线程中运行的指标端点，只监听本机地址"""
+
+    def __init__(self, registry: "MetricsRegistry", port: int = 9464, host: str = "127.0.0.1"):
+        """
+        Args:
+            registry: 指标注册表
+            port: 端口号，0表示由系统分配
+            host: 监听地址
+        """
+        self.registry = registry
+        self.host = host
+        self.port = port
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def running(self) -> bool:
+        """是否正在运行"""
+        return self._server is not None
+
+    @property
+    def url(self) -> str:
+        """端点地址"""
+        return f"http://{self.host}:{self.port}/metrics"
+
+    def start(self):
+        """开始监听，端口被占用时抛出 OSError"""
+        if self._server is not None:
+            return
+        server = ThreadingHTTPServer((self.host, self.port), _MetricsHandler)
+        server.daemon_threads = True
+        server.registry = self.registry
+        self.port = server.server_address[1]
+        self._server = server
+        self._thread = threading.Thread(target=server.serve_forever, name="MetricsServer", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """停止监听"""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join(timeout=1.0)
+        self._server = None
+        self._thread = None
+
+
+def configured_port() -> Optional[int]:
+    """环境变量中配置的端口号，未配置或格式不正确时返回None"""
+    value = os.environ.get(ENV_VAR, "").strip()
+    return int(value) if value.isdigit() else None
+
+
+# 创建全局实例
+metrics_registry = MetricsRegistry()
+
+# 进程启动到主窗口首次显示的耗时，由主入口设置
+startup_seconds = metrics_registry.gauge("startup_seconds", "启动到主窗口首次显示的耗时（秒）")
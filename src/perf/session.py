@@ -0,0 +1,514 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+会话录制与回放模块 - 录制真实使用中的界面操作，在无界面环境中按原节奏或全速回放并收集性能指标
+
+录制的操作包括页面导航、主题切换、页面内的按钮点击和日志突发，连同相对时间一起
+按行写入gzip压缩的JSON Lines文件。第一行是会话头（初始页面、主题、窗口大小）。
+按钮按对象名（objectName）录制，与界面语言无关，没有对象名的按钮不录制；
+回放时找不到录制的页面或按钮会抛出 ValueError，而不是跳过。
+
+录制::
+
+    python -m src.perf.session record session.jsonl.gz
+    # 或者设置环境变量后正常启动
+    CURSOR_PRO_MAX_RECORD_SESSION=session.jsonl.gz python cursor_pro_max.py
+
+回放::
+
+    python -m src.perf.session replay session.jsonl.gz            # 按录制时的节奏
+    python -m src.perf.session replay session.jsonl.gz --fast     # 全速
+    python -m src.perf.session replay session.jsonl.gz --fast --json result.json --max-stalls 0
+
+回放时使用临时的数据目录和日志目录，不会修改本机的设置。
+"""
+
+import os
+import sys
+import gzip
+import json
+import time
+import argparse
+import tempfile
+from typing import Dict, List, Optional, Tuple
+
+from PySide6.QtCore import QObject, QEvent, QEventLoop, QTimer, QCoreApplication
+from PySide6.QtWidgets import QAbstractButton
+
+from src.theme_manager import theme_manager
+from src.perf.histogram import LatencyHistogram
+from src.perf.nav_latency import navigation_timer
+from src.perf.paint_profiler import paint_profiler
+
+# 设置该环境变量为文件路径即可在启动时开始录制，退出时保存
+ENV_VAR = "CURSOR_PRO_MAX_RECORD_SESSION"
+
+# 版本2起按钮按对象名录制，版本1按显示文本录制，换了界面语言就无法回放
+FORMAT_VERSION = 2
+
+# 操作类型
+EVENT_NAVIGATE = "nav"
+EVENT_THEME = "theme"
+EVENT_CLICK = "click"
+EVENT_LOGS = "logs"
+
+EVENT_TYPES = (EVENT_NAVIGATE, EVENT_THEME, EVENT_CLICK, EVENT_LOGS)
+
+
+def _button_key(page, button) -> Optional[Tuple[str, int]]:
+    """
+    按钮在页面中的标识
+
+    Returns:
+        (对象名, 页面中相同对象名的按钮里的序号)，按钮没有对象名时返回 None
+    """
+    name = button.objectName()
+    if not name:
+        return None
+    index = 0
+    for other in page.findChildren(QAbstractButton):
+        if other is button:
+            break
+        if other.objectName() == name:
+            index += 1
+    return name, index
+
+
+def _find_button(page, name: str, index: int) -> Optional[QAbstractButton]:
+    """按对象名查找页面中的按钮"""
+    matches = [button for button in page.findChildren(QAbstractButton) if button.objectName() == name]
+    return matches[index] if index < len(matches) else None
+
+
+def load_session(path: str) -> Tuple[Dict[str, object], List[Dict[str, object]]]:
+    """
+    读取会话文件
+
+    Returns:
+        (会话头, 按时间排序的操作列表)
+
+    Raises:
+        ValueError: 文件格式不正确或版本不受支持
+    """
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        lines = [line for line in f if line.strip()]
+    if not lines:
+        raise ValueError(f"会话文件为空: {path}")
+    header = json.loads(lines[0])
+    if header.get("version") != FORMAT_VERSION:
+        raise ValueError(f"不支持的会话文件版本: {header.get('version')}")
+    events = [json.loads(line) for line in lines[1:]]
+    events.sort(key=lambda event: event["t"])
+    return header, events
+
+
+def save_session(path: str, header: Dict[str, object], events: List[Dict[str, object]]):
+    """写入会话文件，用于生成合成的会话"""
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        f.write(json.dumps(dict(header, version=FORMAT_VERSION), ensure_ascii=False) + "\n")
+        for event in events:
+            f.write(json.dumps(event, ensure_ascii=False, separators=(",", ":")) + "\n")
+
+
+class SessionRecorder(QObject):
+    """
+    会话录制器
+
+    导航和主题切换通过信号录制，按钮点击通过应用程序事件过滤器录制（只录制
+    当前页面中有对象名的按钮，导航栏按钮由导航信号覆盖）。日志数量定时采样，
+    一个采样周期内的日志数量达到 burst_threshold 时才录制为日志突发；
+    零星的日志大多由被录制的操作本身产生，回放这些操作时会重新产生。
+    """
+
+    def __init__(self, path: str, main_window, sidebar, content_manager,
+                 burst_threshold: int = 20, poll_ms: int = 50):
+        """
+        Args:
+            path: 会话文件路径
+            main_window: 主窗口
+            sidebar: 导航栏
+            content_manager: 内容管理器
+            burst_threshold: 一个采样周期内多少条日志算作突发
+            poll_ms: 日志数量采样周期（毫秒）
+        """
+        super().__init__()
+        self.path = path
+        self.main_window = main_window
+        self.sidebar = sidebar
+        self.content_manager = content_manager
+        self.burst_threshold = burst_threshold
+        self.event_count = 0
+
+        self._file = None
+        self._start = 0.0
+        self._last_counts: Dict[str, int] = {}
+        self._timer = QTimer(self)
+        self._timer.setInterval(poll_ms)
+        self._timer.timeout.connect(self._poll_logs)
+
+    @property
+    def recording(self) -> bool:
+        """是否正在录制"""
+        return self._file is not None
+
+    def start(self):
+        """开始录制"""
+        if self._file is not None:
+            return
+        self._file = gzip.open(self.path, "wt", encoding="utf-8")
+        size = self.main_window.size()
+        header = {
+            "version": FORMAT_VERSION,
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "initial_page": self.content_manager.current_page,
+            "theme": theme_manager.current_theme,
+            "size": [size.width(), size.height()],
+        }
+        self._file.write(json.dumps(header, ensure_ascii=False) + "\n")
+        self._start = time.perf_counter()
+        self._last_counts = self.main_window.logger.record_counts()
+
+        self.sidebar.navigation_changed.connect(self._on_navigation)
+        theme_manager.theme_changed.connect(self._on_theme_changed)
+        QCoreApplication.instance().installEventFilter(self)
+        self._timer.start()
+
+    def stop(self) -> int:
+        """
+        停止录制并关闭文件
+
+        Returns:
+            录制的操作数量
+        """
+        if self._file is None:
+            return self.event_count
+        self._timer.stop()
+        self._poll_logs()
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.removeEventFilter(self)
+        self.sidebar.navigation_changed.disconnect(self._on_navigation)
+        theme_manager.theme_changed.disconnect(self._on_theme_changed)
+        self._file.close()
+        self._file = None
+        return self.event_count
+
+    def _write(self, event_type: str, **fields):
+        """写入一条操作"""
+        event = {"t": round(time.perf_counter() - self._start, 4), "type": event_type}
+        event.update(fields)
+        self._file.write(json.dumps(event, ensure_ascii=False, separators=(",", ":")) + "\n")
+        self.event_count += 1
+
+    def _on_navigation(self, page_id):
+        self._write(EVENT_NAVIGATE, page=page_id)
+
+    def _on_theme_changed(self, theme_name):
+        self._write(EVENT_THEME, theme=theme_name)
+
+    def eventFilter(self, obj, event):
+        """录制当前页面中的按钮点击"""
+        if (event.type() == QEvent.Type.MouseButtonRelease and isinstance(obj, QAbstractButton)
+                and obj.isDown() and obj.rect().contains(event.position().toPoint())):
+            page = self.content_manager.currentWidget()
+            if page is not None and page.isAncestorOf(obj):
+                key = _button_key(page, obj)
+                if key is None:
+                    self.main_window.logger.warning("按钮没有对象名，不能录制点击: %s", obj.text())
+                else:
+                    name, index = key
+                    self._write(EVENT_CLICK, page=self.content_manager.current_page, button=name, index=index)
+        return False
+
+    def _poll_logs(self):
+        """采样日志数量，录制日志突发"""
+        counts = self.main_window.logger.record_counts()
+        delta = {level: count - self._last_counts.get(level, 0) for level, count in counts.items()}
+        self._last_counts = counts
+        delta = {level: count for level, count in delta.items() if count > 0}
+        if sum(delta.values()) >= self.burst_threshold:
+            self._write(EVENT_LOGS, levels=delta)
+
+
+class ReplayResult:
+    """回放结果"""
+
+    def __init__(self, replayed: int, skipped: int, duration_s: float, speed: float,
+                 latency: Dict[str, LatencyHistogram], navigation: Dict[str, object],
+                 watchdog: Optional[Dict[str, object]], paint: List[Dict[str, object]]):
+        self.replayed = replayed
+        self.skipped = skipped
+        self.duration_s = duration_s
+        self.speed = speed
+        self.latency = latency
+        self.navigation = navigation
+        self.watchdog = watchdog
+        self.paint = paint
+
+    @property
+    def stall_count(self) -> int:
+        """回放期间的界面卡顿次数"""
+        return self.watchdog["stall_count"] if self.watchdog else 0
+
+    def as_dict(self) -> Dict[str, object]:
+        """转换为可写入JSON的字典，时间单位毫秒"""
+        return {
+            "replayed": self.replayed,
+            "skipped": self.skipped,
+            "duration_s": self.duration_s,
+            "speed": self.speed,
+            "latency": {kind: histogram.summary() for kind, histogram in self.latency.items()},
+            "navigation": self.navigation,
+            "watchdog": self.watchdog,
+            "paint": self.paint,
+        }
+
+    def format_report(self) -> str:
+        """生成文本报告"""
+        mode = "全速" if not self.speed else f"{self.speed:g}倍速"
+        lines = [f"回放 {self.replayed} 个操作（跳过 {self.skipped} 个），{mode}，耗时 {self.duration_s:.2f}s",
+                 f"{'操作':<12} {'次数':>6} {'p50(ms)':>9} {'p95(ms)':>9} {'p99(ms)':>9} {'最大(ms)':>9}"]
+        for kind, histogram in self.latency.items():
+            summary = histogram.summary()
+            if summary["count"]:
+                lines.append(f"{kind:<12} {summary['count']:>6} {summary['p50']:>9.2f} {summary['p95']:>9.2f} "
+                             f"{summary['p99']:>9.2f} {summary['max']:>9.2f}")
+        for page_id, kinds in self.navigation.items():
+            summary = kinds["all"]
+            lines.append(f"导航到 {page_id}: 次数={summary['count']} p50={summary['p50']:.1f}ms "
+                         f"p99={summary['p99']:.1f}ms max={summary['max']:.1f}ms")
+        if self.watchdog:
+            stalls = self.watchdog["stalls"]
+            lines.append(f"界面卡顿: 次数={self.stall_count} max={stalls['max']:.0f}ms "
+                         f"事件循环最大延迟={self.watchdog['max_lag_ms']:.0f}ms")
+        if self.paint:
+            lines.append("绘制总耗时最多的部件:")
+            for row in self.paint:
+                name = f"{row['class']}#{row['object']}" if row["object"] else row["class"]
+                lines.append(f"  {row['total_ms']:>8.2f}ms {row['count']:>5}次  {name}")
+        return "\n".join(lines)
+
+
+class SessionPlayer:
+    """
+    会话回放器
+
+    每个操作执行后处理完挂起的事件（包括重绘），从执行操作到事件处理完的耗时
+    按操作类型统计；同时收集导航耗时、看门狗的卡顿统计和绘制耗时。
+    与当前状态不符的操作（如主题已经相同、按钮被禁用）被跳过，
+    找不到录制的页面或按钮说明会话与程序不匹配，抛出 ValueError。
+    """
+
+    def __init__(self, main_window, sidebar, content_manager, profile_paint: bool = True):
+        """
+        Args:
+            main_window: 主窗口
+            sidebar: 导航栏
+            content_manager: 内容管理器
+            profile_paint: 是否在回放期间统计绘制耗时
+        """
+        self.main_window = main_window
+        self.sidebar = sidebar
+        self.content_manager = content_manager
+        self.profile_paint = profile_paint
+        self._handlers = {
+            EVENT_NAVIGATE: self._navigate,
+            EVENT_THEME: self._switch_theme,
+            EVENT_CLICK: self._click,
+            EVENT_LOGS: self._emit_logs,
+        }
+
+    def _navigate(self, event) -> bool:
+        button = self.sidebar.nav_button(event["page"])
+        if button is None:
+            raise ValueError(f"找不到页面: {event['page']}")
+        button.click()
+        return True
+
+    def _switch_theme(self, event) -> bool:
+        # 点击"恢复默认设置"等操作已经切换过主题时不再重复切换
+        if theme_manager.current_theme == event["theme"]:
+            return False
+        return theme_manager.set_theme(event["theme"])
+
+    def _click(self, event) -> bool:
+        if self.content_manager.current_page != event["page"]:
+            return False
+        page = self.content_manager.page(event["page"])
+        index = event.get("index", 0)
+        button = _find_button(page, event["button"], index)
+        if button is None:
+            raise ValueError(f"页面 {event['page']} 中找不到按钮: {event['button']}[{index}]")
+        if not button.isEnabled():
+            return False
+        button.click()
+        return True
+
+    def _emit_logs(self, event) -> bool:
+        logger = self.main_window.logger
+        for level, count in event["levels"].items():
+            log = getattr(logger, level.lower(), logger.info)
+            for number in range(count):
+                log("回放日志 %d/%d", number + 1, count)
+        return True
+
+    @staticmethod
+    def _settle():
+        """处理挂起的事件"""
+        QCoreApplication.processEvents()
+        QCoreApplication.sendPostedEvents()
+        QCoreApplication.processEvents()
+
+    @staticmethod
+    def _wait(seconds: float):
+        """运行事件循环直到指定时间过去，期间正常处理定时器和重绘"""
+        if seconds <= 0:
+            return
+        loop = QEventLoop()
+        QTimer.singleShot(int(seconds * 1000), loop.quit)
+        loop.exec()
+
+    def play(self, events: List[Dict[str, object]], speed: float = 1.0) -> ReplayResult:
+        """
+        回放操作
+
+        Args:
+            events: 按时间排序的操作列表
+            speed: 回放速度倍数，0表示全速（不等待操作之间的间隔）
+
+        Returns:
+            回放结果
+
+        Raises:
+            ValueError: 找不到录制的页面或按钮
+        """
+        latency = {kind: LatencyHistogram() for kind in EVENT_TYPES}
+        latency["theme_slots"] = LatencyHistogram()
+        navigation_timer.reset()
+        watchdog = getattr(self.main_window, "watchdog", None)
+        if watchdog is not None:
+            watchdog.reset()
+        paint_was_installed = paint_profiler.installed
+        if self.profile_paint:
+            paint_profiler.reset()
+            paint_profiler.install()
+
+        replayed = skipped = 0
+        start = time.perf_counter()
+        try:
+            for event in events:
+                if speed:
+                    self._wait(start + event["t"] / speed - time.perf_counter())
+                handler = self._handlers.get(event["type"])
+                began = time.perf_counter_ns()
+                if handler is None or not handler(event):
+                    skipped += 1
+                    continue
+                self._settle()
+                latency[event["type"]].record((time.perf_counter_ns() - began) // 1000)
+                if event["type"] == EVENT_THEME:
+                    latency["theme_slots"].record(int(theme_manager.last_switch_ms * 1000))
+                replayed += 1
+            # 等待最后一次导航的首次绘制完成
+            self._settle()
+        finally:
+            if self.profile_paint and not paint_was_installed:
+                paint_profiler.uninstall()
+
+        return ReplayResult(
+            replayed, skipped, time.perf_counter() - start, speed, latency,
+            navigation_timer.stats(),
+            watchdog.stats() if watchdog is not None else None,
+            paint_profiler.report(top=10) if self.profile_paint else [],
+        )
+
+
+def _record(args) -> int:
+    """录制：正常启动应用程序，退出时保存"""
+    os.environ[ENV_VAR] = os.path.abspath(args.output)
+    from src.main_app import main as app_main
+    app_main()
+    return 0
+
+
+def _replay(args) -> int:
+    """回放：在临时目录中启动主窗口并回放会话"""
+    path = os.path.abspath(args.session)
+    json_path = os.path.abspath(args.json) if args.json else None
+    header, events = load_session(path)
+
+    # 必须在创建QApplication之前设置
+    if not args.show:
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    if not args.keep_home:
+        home = tempfile.mkdtemp(prefix="cursor_pro_max_replay_")
+        os.environ["CURSOR_PRO_MAX_HOME"] = home
+        os.chdir(home)
+
+    from PySide6.QtWidgets import QApplication
+    from src.settings import settings, THEME, LAST_PAGE
+    from src.main_app import create_main_window
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    app.setStyle("Fusion")
+
+    # 从录制开始时的状态回放
+    settings.set(THEME, header.get("theme", "light"))
+    settings.set(LAST_PAGE, header.get("initial_page") or "home")
+    main_window, sidebar, content_manager = create_main_window()
+    if header.get("size"):
+        main_window.resize(*header["size"])
+    main_window.show()
+    SessionPlayer._settle()
+
+    speed = 0.0 if args.fast else args.speed
+    try:
+        result = SessionPlayer(main_window, sidebar, content_manager,
+                               profile_paint=not args.no_paint).play(events, speed)
+    except ValueError as e:
+        print(f"回放失败: {e}")
+        main_window.close()
+        app.processEvents()
+        return 1
+    print(result.format_report())
+    if json_path:
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(dict(result.as_dict(), session=path), f, ensure_ascii=False, indent=2)
+
+    main_window.close()
+    app.processEvents()
+    if args.max_stalls is not None and result.stall_count > args.max_stalls:
+        print(f"界面卡顿 {result.stall_count} 次，超过允许的 {args.max_stalls} 次")
+        return 1
+    return 0
+
+
+def main(argv=None):
+    """命令行入口"""
+    parser = argparse.ArgumentParser(description="界面会话录制与回放")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    record = commands.add_parser("record", help="启动应用程序并录制操作，退出时保存")
+    record.add_argument("output", help="会话文件路径（.jsonl.gz）")
+
+    replay = commands.add_parser("replay", help="回放会话并输出性能指标")
+    replay.add_argument("session", help="会话文件路径")
+    replay.add_argument("--fast", action="store_true", help="全速回放，不等待操作之间的间隔")
+    replay.add_argument("--speed", type=float, default=1.0, help="回放速度倍数")
+    replay.add_argument("--json", help="将结果写入JSON文件")
+    replay.add_argument("--max-stalls", type=int, default=None,
+                        help="允许的界面卡顿次数，超过时返回非零退出码")
+    replay.add_argument("--show", action="store_true", help="显示窗口（默认无界面运行）")
+    replay.add_argument("--no-paint", action="store_true", help="不统计绘制耗时")
+    replay.add_argument("--keep-home", action="store_true",
+                        help="使用本机的数据目录和当前目录（默认使用临时目录）")
+
+    args = parser.parse_args(argv)
+    if args.command == "record":
+        return _record(args)
+    return _replay(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
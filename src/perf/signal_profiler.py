@@ -0,0 +1,146 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+信号槽性能分析模块 - 统计应用信号各个槽函数的调用次数和耗时
+"""
+
+import os
+import time
+from functools import partial
+from typing import Callable, Dict, List, Tuple
+
+from PySide6.QtCore import QObject
+
+# 设置该环境变量为1即可在启动时开启信号分析
+ENV_VAR = "CURSOR_PRO_MAX_PROFILE_SIGNALS"
+
+
+class SlotStats:
+    """单个槽函数的统计数据"""
+
+    __slots__ = ("signal_name", "slot_name", "calls", "total_ns", "max_ns")
+
+    def __init__(self, signal_name: str, slot_name: str):
+        self.signal_name = signal_name
+        self.slot_name = slot_name
+        self.calls = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+    def as_dict(self) -> Dict[str, object]:
+        """转换为字典，时间单位毫秒"""
+        return {
+            "signal": self.signal_name,
+            "slot": self.slot_name,
+            "calls": self.calls,
+            "total_ms": self.total_ns / 1e6,
+            "mean_ms": self.total_ns / self.calls / 1e6 if self.calls else 0.0,
+            "max_ms": self.max_ns / 1e6,
+        }
+
+
+class SignalProfiler:
+    """
+    信号槽性能分析器
+
+    默认关闭，此时 connect() 与直接连接完全相同，没有任何额外开销。
+    开启后连接的槽函数会被包装，记录每次调用的耗时。
+    同一个类的多个实例（如每个 SidebarButton）汇总到同一条统计中。
+    """
+
+    def __init__(self):
+        self.enabled = os.environ.get(ENV_VAR) == "1"
+        self._stats: Dict[Tuple[str, str], SlotStats] = {}
+
+    def enable(self, enabled: bool = True):
+        """
+        开启或关闭分析
+
+        只对之后建立的连接生效，因此应在创建窗口之前调用。
+        """
+        self.enabled = enabled
+
+    def connect(self, signal, slot: Callable, signal_name: str):
+        """
+        连接信号和槽
+
+        Args:
+            signal: 信号实例，如 theme_manager.theme_changed
+            slot: 槽函数
+            signal_name: 用于报告的信号名称，如 "ThemeManager.theme_changed"
+        """
+        if not self.enabled:
+            signal.connect(slot)
+            return
+
+        slot_name = getattr(slot, "__qualname__", None) or repr(slot)
+        key = (signal_name, slot_name)
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = SlotStats(signal_name, slot_name)
+
+        def profiled_slot(*args):
+            start = time.perf_counter_ns()
+            try:
+                slot(*args)
+            finally:
+                elapsed = time.perf_counter_ns() - start
+                stats.calls += 1
+                stats.total_ns += elapsed
+                if elapsed > stats.max_ns:
+                    stats.max_ns = elapsed
+
+        signal.connect(profiled_slot)
+
+        # 包装函数不会随接收者自动断开，接收者销毁时需要手动断开
+        receiver = getattr(slot, "__self__", None)
+        if isinstance(receiver, QObject):
+            receiver.destroyed.connect(partial(self._disconnect, signal, profiled_slot))
+
+    @staticmethod
+    def _disconnect(signal, wrapper, *args):
+        """断开包装后的槽函数"""
+        try:
+            signal.disconnect(wrapper)
+        except (RuntimeError, TypeError):
+            pass
+
+    def reset(self):
+        """清空统计数据"""
+        for stats in self._stats.values():
+            stats.calls = 0
+            stats.total_ns = 0
+            stats.max_ns = 0
+
+    def report(self, top: int = 0) -> List[Dict[str, object]]:
+        """
+        生成按总耗时排序的报告
+
+        Args:
+            top: 只返回前N项，0表示全部
+        """
+        ranked = sorted((s for s in self._stats.values() if s.calls),
+                        key=lambda s: s.total_ns, reverse=True)
+        if top:
+            ranked = ranked[:top]
+        return [stats.as_dict() for stats in ranked]
+
+    def format_report(self, top: int = 20) -> str:
+        """生成文本报告"""
+        lines = [f"{'总耗时(ms)':>10} {'次数':>6} {'平均(ms)':>9} {'最大(ms)':>9}  信号 -> 槽"]
+        for row in self.report(top):
+            lines.append(
+                f"{row['total_ms']:>10.2f} {row['calls']:>6} {row['mean_ms']:>9.3f} "
+                f"{row['max_ms']:>9.3f}  {row['signal']} -> {row['slot']}"
+            )
+        return "\n".join(lines)
+
+    def log_report(self, logger, top: int = 20):
+        """将报告写入日志"""
+        if self.enabled and self._stats:
+            logger.info("信号槽耗时统计:\n%s", self.format_report(top))
+
+
+# 创建全局实例
+signal_profiler = SignalProfiler()
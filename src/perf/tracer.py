@@ -0,0 +1,190 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+跟踪模块 - 记录嵌套的耗时区间，导出为Chrome/Perfetto可以打开的trace-event JSON
+
+用法::
+
+    with logger.span("加载账号", source="state.vscdb"):
+        ...
+
+    @tracer.span("HomePage._setup_ui", "home")
+    def _setup_ui(self):
+        ...
+
+区间结束时写入固定容量的环形缓冲区（满时覆盖最旧的区间），不加锁也不做格式化。
+导出的文件可以在 chrome://tracing 或 https://ui.perfetto.dev 中按线程查看火焰图式的时间线，
+同一线程中的区间按起止时间自动嵌套。
+
+默认关闭，此时 with 语句和装饰器只多一次属性检查。设置环境变量
+CURSOR_PRO_MAX_TRACE=1 后启动即可开启，退出时导出到日志目录；
+也可以在诊断页面中开始、停止和导出。
+"""
+
+import os
+import json
+import time
+import functools
+import itertools
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
+
+# 设置该环境变量为1即可在启动时开启跟踪
+ENV_VAR = "CURSOR_PRO_MAX_TRACE"
+
+# 区间：(开始时间ns, 耗时ns, 名称, 分类, 线程ID, 附加字段)
+SpanRecord = Tuple[int, int, str, str, int, Optional[dict]]
+
+
+class Span:
+    """一个耗时区间，可作为上下文管理器或装饰器使用"""
+
+    __slots__ = ("tracer", "name", "category", "fields", "start")
+
+    def __init__(self, tracer: "Tracer", name: Optional[str], category: str, fields: Optional[dict]):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.fields = fields
+        self.start = 0
+
+    def __enter__(self):
+        if self.tracer.enabled:
+            self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if self.start:
+            self.tracer.record(self.name, self.category, self.start, time.perf_counter_ns(), self.fields)
+        return False
+
+    def __call__(self, fn: Callable) -> Callable:
+        """作为装饰器使用，名称默认为函数的限定名；每次调用时检查跟踪是否开启"""
+        tracer = self.tracer
+        name = self.name or fn.__qualname__
+        category = self.category
+        fields = self.fields
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return fn(*args, **kwargs)
+            start = time.perf_counter_ns()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                tracer.record(name, category, start, time.perf_counter_ns(), fields)
+
+        return wrapper
+
+
+class Tracer:
+    """区间跟踪器"""
+
+    def __init__(self, capacity: int = 200000):
+        """
+        Args:
+            capacity: 环形缓冲区保留的区间数量
+        """
+        self.enabled = os.environ.get(ENV_VAR) == "1"
+        self.capacity = capacity
+        self._events: List[Optional[SpanRecord]] = [None] * capacity
+        # next() 在GIL保护下是原子的，多个线程可以同时取得各自的写入位置
+        self._counter = itertools.count()
+        self._written = 0
+        self._thread_names: Dict[int, str] = {}
+        self._epoch_ns = time.perf_counter_ns()
+
+    def enable(self, enabled: bool = True):
+        """开启或关闭跟踪，已记录的区间保留"""
+        self.enabled = enabled
+
+    def span(self, name: Optional[str] = None, category: str = "app", **fields) -> Span:
+        """
+        创建区间
+
+        Args:
+            name: 区间名称，作为装饰器时默认为函数的限定名
+            category: 分类，通常为组件名
+            fields: 附加字段，导出到区间的 args 中
+        """
+        return Span(self, name, category, fields or None)
+
+    def record(self, name: str, category: str, start_ns: int, end_ns: int, fields: Optional[dict] = None):
+        """记录一个已结束的区间"""
+        thread = threading.get_native_id()
+        if thread not in self._thread_names:
+            self._thread_names[thread] = threading.current_thread().name
+        index = next(self._counter)
+        self._events[index % self.capacity] = (start_ns, end_ns - start_ns, name, category, thread, fields)
+        self._written = index + 1
+
+    def __len__(self):
+        return min(self._written, self.capacity)
+
+    @property
+    def dropped(self) -> int:
+        """因缓冲区已满被覆盖的区间数量"""
+        return max(0, self._written - self.capacity)
+
+    def clear(self):
+        """清空已记录的区间"""
+        self._events = [None] * self.capacity
+        self._counter = itertools.count()
+        self._written = 0
+
+    def snapshot(self) -> Tuple[List[SpanRecord], Dict[int, str]]:
+        """复制当前的区间和线程名称，之后可以在其他线程中导出"""
+        events = [event for event in self._events if event is not None]
+        return events, dict(self._thread_names)
+
+    def trace_events(self, events: Optional[List[SpanRecord]] = None,
+                     thread_names: Optional[Dict[int, str]] = None) -> List[dict]:
+        """转换为trace-event格式，时间单位微秒"""
+        if events is None:
+            events, thread_names = self.snapshot()
+        pid = os.getpid()
+        result = [{"name": "process_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": "CursorProMax"}}]
+        for thread, thread_name in (thread_names or {}).items():
+            result.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": thread, "args": {"name": thread_name}})
+        epoch = self._epoch_ns
+        for start, duration, name, category, thread, fields in sorted(events, key=lambda event: event[0]):
+            event = {"name": name, "cat": category, "ph": "X", "pid": pid, "tid": thread,
+                     "ts": (start - epoch) / 1000.0, "dur": duration / 1000.0}
+            if fields:
+                event["args"] = fields
+            result.append(event)
+        return result
+
+    def export(self, log_dir: str = "logs", path: Optional[str] = None,
+               events: Optional[List[SpanRecord]] = None,
+               thread_names: Optional[Dict[int, str]] = None) -> str:
+        """
+        导出为trace-event JSON文件
+
+        Args:
+            log_dir: 未指定路径时写入该目录，文件名为 trace_日期_时间.json
+            path: 文件路径
+            events: 要导出的区间，默认为当前缓冲区中的全部区间
+            thread_names: 线程名称
+
+        Returns:
+            文件路径
+        """
+        if path is None:
+            os.makedirs(log_dir, exist_ok=True)
+            path = os.path.join(log_dir, time.strftime("trace_%Y%m%d_%H%M%S.json"))
+        document = {"traceEvents": self.trace_events(events, thread_names), "displayTimeUnit": "ms"}
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(document, f, ensure_ascii=False, separators=(",", ":"), default=str)
+        return os.path.abspath(path)
+
+
+def export_trace(token, progress, log_dir: str, events: List[SpanRecord], thread_names: Dict[int, str]) -> str:
+    """导出跟踪数据（在工作线程中执行）"""
+    return tracer.export(log_dir, events=events, thread_names=thread_names)
+
+
+# 创建全局实例
+tracer = Tracer()
@@ -0,0 +1,178 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+界面卡顿监控模块 - 通过事件循环心跳检测GUI线程无响应并记录调用栈
+"""
+
+import sys
+import time
+import threading
+import traceback
+from typing import Dict, Optional
+
+from PySide6.QtCore import QObject, QTimer
+
+from src.logger import Logger
+from src.perf.histogram import LatencyHistogram
+from src.perf.prometheus import metrics_registry
+
+# 导出到指标端点的事件循环延迟和卡顿次数
+EVENT_LOOP_LAG_SECONDS = metrics_registry.histogram(
+    "event_loop_lag_seconds", "事件循环心跳超出预期间隔的延迟（秒）",
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0))
+STALLS_TOTAL = metrics_registry.counter("ui_stalls_total", "界面卡顿次数")
+
+
+class EventLoopWatchdog(QObject):
+    """
+    事件循环看门狗
+
+    GUI线程上的定时器定期更新心跳时间，后台线程检查心跳间隔，
+    超过阈值时抓取GUI线程当前的Python调用栈并写入日志。
+    """
+
+    def __init__(self, logger: Logger, threshold_ms: int = 100,
+                 heartbeat_ms: int = 50, parent=None):
+        """
+        初始化看门狗
+
+        Args:
+            logger: 日志管理器
+            threshold_ms: 判定为卡顿的无响应时长（毫秒）
+            heartbeat_ms: 心跳间隔（毫秒），应小于阈值
+            parent: 父对象
+        """
+        super().__init__(parent)
+        self.logger = logger
+        self.threshold_ms = threshold_ms
+        self.heartbeat_ms = heartbeat_ms
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(heartbeat_ms)
+        self._timer.timeout.connect(self._on_heartbeat)
+
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._gui_thread_id = 0
+
+        # 心跳状态，由GUI线程写入、监控线程读取
+        self._last_beat = 0.0
+        self._stall_reported = False
+
+        # 统计数据
+        self.stall_count = 0
+        self.stall_histogram = LatencyHistogram()
+        self.lag_histogram = LatencyHistogram()
+        self.last_lag_ms = 0.0
+        self.max_lag_ms = 0.0
+
+    @property
+    def running(self) -> bool:
+        """是否正在监控"""
+        return self._thread is not None
+
+    def start(self):
+        """开始监控，必须在GUI线程中调用"""
+        if self._thread is not None:
+            return
+        self._gui_thread_id = threading.get_ident()
+        # 事件循环开始运行后才有第一次心跳，在此之前不做判定
+        self._last_beat = 0.0
+        self._stop_event.clear()
+        self._timer.start()
+
+        self._thread = threading.Thread(target=self._monitor, name="EventLoopWatchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """停止监控"""
+        self._timer.stop()
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join(timeout=1.0)
+        self._thread = None
+
+    def reset(self):
+        """清空卡顿统计，用于分段测量"""
+        self.stall_count = 0
+        self.stall_histogram.reset()
+        self.lag_histogram.reset()
+        self.last_lag_ms = 0.0
+        self.max_lag_ms = 0.0
+
+    def _on_heartbeat(self):
+        """GUI线程心跳"""
+        now = time.perf_counter()
+        with self._lock:
+            previous = self._last_beat
+            self._last_beat = now
+            reported = self._stall_reported
+            self._stall_reported = False
+
+        if not previous:
+            return
+
+        # 心跳实际间隔超出预期的部分即为事件循环延迟
+        gap_ms = (now - previous) * 1000.0
+        lag_ms = max(0.0, gap_ms - self.heartbeat_ms)
+        self.last_lag_ms = lag_ms
+        self.max_lag_ms = max(self.max_lag_ms, lag_ms)
+        self.lag_histogram.record(int(lag_ms * 1000))
+        EVENT_LOOP_LAG_SECONDS.observe(lag_ms / 1000.0)
+
+        if reported:
+            self.stall_histogram.record(int(gap_ms * 1000))
+            self.logger.warning("界面卡顿结束，持续 %.0fms", gap_ms)
+
+    def _monitor(self):
+        """后台监控线程"""
+        check_interval = max(self.threshold_ms / 4.0, 5.0) / 1000.0
+        threshold = self.threshold_ms / 1000.0
+        heartbeat = self.heartbeat_ms / 1000.0
+
+        while not self._stop_event.wait(check_interval):
+            with self._lock:
+                last_beat = self._last_beat
+                if not last_beat or self._stall_reported:
+                    continue
+                stalled = time.perf_counter() - last_beat - heartbeat
+                if stalled < threshold:
+                    continue
+                self._stall_reported = True
+
+            self.stall_count += 1
+            STALLS_TOTAL.inc()
+            stack = self._capture_gui_stack()
+            self.logger.warning("检测到界面卡顿，GUI线程已 %.0fms 无响应，当前调用栈:\n%s",
+                                stalled * 1000, stack)
+
+    def _capture_gui_stack(self) -> str:
+        """抓取GUI线程当前的Python调用栈"""
+        frame = sys._current_frames().get(self._gui_thread_id)
+        if frame is None:
+            return "(无法获取GUI线程调用栈)"
+        return "".join(traceback.format_stack(frame)).rstrip()
+
+    def stats(self) -> Dict[str, object]:
+        """
+        获取卡顿统计
+
+        Returns:
+            包含卡顿次数、卡顿时长分布和事件循环延迟的字典，时长单位毫秒
+        """
+        return {
+            "stall_count": self.stall_count,
+            "stalls": self.stall_histogram.summary(),
+            "lag": self.lag_histogram.summary(),
+            "last_lag_ms": self.last_lag_ms,
+            "max_lag_ms": self.max_lag_ms,
+        }
+
+    def log_summary(self):
+        """将卡顿统计写入日志"""
+        stalls = self.stall_histogram.summary()
+        self.logger.info("界面卡顿统计: 次数=%d p50=%.0fms p99=%.0fms max=%.0fms 事件循环最大延迟=%.0fms",
+                         self.stall_count, stalls["p50"], stalls["p99"], stalls["max"], self.max_lag_ms)
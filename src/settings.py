@@ -0,0 +1,277 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+设置模块 - 带类型的持久化设置，启动时读取一次，修改后在后台线程中延迟写入
+
+连续的修改（反复切换主题、拖动窗口等）在停止修改 delay 秒后合并为一次写入，
+写入先写临时文件再替换，不会在写入中断时损坏设置文件。界面线程只修改内存中的值，
+不会因读写设置文件而阻塞。
+"""
+
+import os
+import json
+import time
+import threading
+from typing import Any, Dict, Optional, Sequence
+
+from PySide6.QtCore import QObject, Signal
+
+from src.app_paths import app_data_path
+from src.theme_manager import ThemeManager
+from src.log_sinks import DURABILITY_MODES, FAST
+from src.i18n.catalog import translator, SOURCE_LOCALE
+
+SETTINGS_FILE = "settings.json"
+
+# 内置设置项
+THEME = "theme"
+LOG_LEVEL = "log.level"
+LOG_AUTO_SCROLL = "log.auto_scroll"
+LOG_COMPONENT_LEVELS = "log.component_levels"
+LOG_DURABILITY = "log.durability"
+LOG_ARCHIVE = "log.archive"
+WINDOW_GEOMETRY = "window.geometry"
+LAST_PAGE = "window.last_page"
+UI_LOCALE = "ui.locale"
+
+
+class SettingDef:
+    """设置项定义"""
+
+    __slots__ = ("key", "type", "default", "choices")
+
+    def __init__(self, key: str, value_type: type, default: Any, choices: Optional[Sequence] = None):
+        """
+        Args:
+            key: 设置项名称
+            value_type: 值的类型，bool、int、float 或 str
+            default: 默认值
+            choices: 可选值，为空表示不限制
+        """
+        self.key = key
+        self.type = value_type
+        self.default = default
+        self.choices = tuple(choices) if choices is not None else None
+
+    def coerce(self, value: Any) -> Any:
+        """
+        检查并转换值的类型
+
+        Raises:
+            TypeError: 类型不匹配
+            ValueError: 不在可选值中
+        """
+        if self.type is float and isinstance(value, int) and not isinstance(value, bool):
+            value = float(value)
+        elif (self.type is not bool and isinstance(value, bool)) or not isinstance(value, self.type):
+            raise TypeError(f"设置项 {self.key} 的值应为 {self.type.__name__}: {value!r}")
+        if self.choices is not None and value not in self.choices:
+            raise ValueError(f"设置项 {self.key} 的值应为 {self.choices} 之一: {value!r}")
+        return value
+
+
+class SettingsStore(QObject):
+    """
+    设置存储
+
+    value_changed 信号在修改设置的线程中发出，参数为 (设置项名称, 新值)；
+    write_failed 信号在写入线程中发出，参数为错误信息。
+    """
+
+    value_changed = Signal(str, object)
+    write_failed = Signal(str)
+
+    def __init__(self, path: Optional[str] = None, delay: float = 0.5):
+        """
+        Args:
+            path: 设置文件路径，默认为数据目录中的 settings.json
+            delay: 最后一次修改后等待多久写入（秒）
+        """
+        super().__init__()
+        self._path = path
+        self.delay = delay
+        self._defs: Dict[str, SettingDef] = {}
+        self._values: Dict[str, Any] = {}
+        self._loaded = False
+        self.load_ms = 0.0
+
+        # 写入线程
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._changed_at: Optional[float] = None
+        self._flush_requested = False
+        self._busy = False
+        self.write_count = 0
+        # 最近一次写入失败的错误，写入成功后清除
+        self.last_error: Optional[OSError] = None
+
+    @property
+    def path(self) -> str:
+        """设置文件路径"""
+        if self._path is None:
+            self._path = app_data_path(SETTINGS_FILE)
+        return self._path
+
+    def define(self, key: str, value_type: type, default: Any, choices: Optional[Sequence] = None) -> SettingDef:
+        """定义设置项，文件中已有的无效值会被丢弃"""
+        definition = SettingDef(key, value_type, default, choices)
+        self._defs[key] = definition
+        if self._loaded and key in self._values:
+            try:
+                self._values[key] = definition.coerce(self._values[key])
+            except (TypeError, ValueError):
+                del self._values[key]
+        return definition
+
+    def definitions(self) -> Dict[str, SettingDef]:
+        """所有设置项定义"""
+        return dict(self._defs)
+
+    def load(self):
+        """读取设置文件，只在第一次访问设置时执行"""
+        start = time.perf_counter()
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = {}
+        values = {}
+        if isinstance(data, dict):
+            for key, value in data.items():
+                definition = self._defs.get(key)
+                if definition is None:
+                    # 未定义的设置项原样保留，可能来自其他版本或插件
+                    values[key] = value
+                    continue
+                try:
+                    values[key] = definition.coerce(value)
+                except (TypeError, ValueError):
+                    continue
+        with self._cond:
+            self._values = values
+            self._loaded = True
+        self.load_ms = (time.perf_counter() - start) * 1000
+
+    def _ensure_loaded(self):
+        if not self._loaded:
+            self.load()
+
+    def get(self, key: str) -> Any:
+        """
+        读取设置，未设置时返回默认值
+
+        Raises:
+            KeyError: 未定义的设置项
+        """
+        self._ensure_loaded()
+        definition = self._defs[key]
+        return self._values.get(key, definition.default)
+
+    def set(self, key: str, value: Any) -> bool:
+        """
+        修改设置，值未变化时不做任何事
+
+        Returns:
+            值是否发生变化
+
+        Raises:
+            KeyError: 未定义的设置项
+            TypeError: 类型不匹配
+            ValueError: 不在可选值中
+        """
+        self._ensure_loaded()
+        value = self._defs[key].coerce(value)
+        if self.get(key) == value:
+            return False
+        with self._cond:
+            self._values[key] = value
+            self._mark_changed()
+        self.value_changed.emit(key, value)
+        return True
+
+    def reset(self, key: str) -> bool:
+        """恢复默认值"""
+        return self.set(key, self._defs[key].default)
+
+    def _mark_changed(self):
+        """记录修改时间并唤醒写入线程，调用时已持有锁"""
+        self._changed_at = time.monotonic()
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="SettingsWriter", daemon=True)
+            self._thread.start()
+        self._cond.notify_all()
+
+    def _run(self):
+        """写入线程：停止修改 delay 秒后写入一次"""
+        while True:
+            with self._cond:
+                while self._changed_at is None:
+                    self._cond.wait()
+                while not self._flush_requested:
+                    remaining = self._changed_at + self.delay - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                snapshot = dict(self._values)
+                self._changed_at = None
+                self._flush_requested = False
+                self._busy = True
+
+            try:
+                self._write(snapshot)
+            finally:
+                with self._cond:
+                    self._busy = False
+                    self._cond.notify_all()
+
+    def _write(self, values: Dict[str, Any]):
+        """写入设置文件，先写临时文件再替换"""
+        tmp_path = self.path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(values, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            self.last_error = e
+            self.write_failed.emit(str(e))
+            return
+        self.last_error = None
+        self.write_count += 1
+
+    def flush(self, timeout: Optional[float] = 2.0) -> bool:
+        """
+        立即写入尚未保存的修改并等待写完（退出程序前调用）
+
+        Returns:
+            是否在超时前写完，最近一次写入失败时返回 False
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            if self._changed_at is not None:
+                self._flush_requested = True
+                self._cond.notify_all()
+            while self._changed_at is not None or self._busy:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return self.last_error is None
+
+    @property
+    def pending(self) -> bool:
+        """是否有尚未写入的修改"""
+        return self._changed_at is not None or self._busy
+
+
+# 创建全局实例并定义内置设置项
+settings = SettingsStore()
+settings.define(THEME, str, "light", choices=tuple(ThemeManager.THEMES))
+settings.define(LOG_LEVEL, str, "DEBUG", choices=("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"))
+settings.define(LOG_AUTO_SCROLL, bool, True)
+settings.define(LOG_COMPONENT_LEVELS, str, "")
+settings.define(LOG_DURABILITY, str, FAST, choices=DURABILITY_MODES)
+settings.define(LOG_ARCHIVE, bool, False)
+settings.define(WINDOW_GEOMETRY, str, "")
+settings.define(LAST_PAGE, str, "home")
+settings.define(UI_LOCALE, str, SOURCE_LOCALE, choices=tuple(translator.available_locales()))
@@ -0,0 +1,267 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+系统探测模块 - 检测Chrome、Cursor版本和操作系统信息
+
+每个探测项在后台线程池中并行执行，结果缓存到数据目录中。
+缓存超过有效期或来源文件的修改时间发生变化时重新探测。
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import glob
+import shutil
+import platform
+import plistlib
+import subprocess
+from typing import Callable, Dict, List, Optional, Tuple
+
+from PySide6.QtCore import QObject, Signal
+
+from src.app_paths import app_data_path
+from src.jobs import job_manager
+
+# 缓存有效期（秒）
+CACHE_TTL = 24 * 60 * 60
+
+CACHE_FILE = "system_probe.json"
+
+# 未检测到时的值，是消息标识，显示时通过 tr() 翻译
+UNKNOWN = "probe.unknown"
+
+_VERSION_PATTERN = re.compile(r"\d+(?:\.\d+)+")
+
+
+def _existing(paths) -> List[str]:
+    """过滤出存在的路径"""
+    return [path for path in paths if path and os.path.exists(path)]
+
+
+def chrome_sources() -> List[str]:
+    """Chrome版本信息的候选来源"""
+    if sys.platform == "win32":
+        roots = [os.environ.get("PROGRAMFILES"), os.environ.get("PROGRAMFILES(X86)"),
+                 os.environ.get("LOCALAPPDATA")]
+        return _existing(os.path.join(root, "Google", "Chrome", "Application")
+                         for root in roots if root)
+    if sys.platform == "darwin":
+        return _existing(["/Applications/Google Chrome.app/Contents/Info.plist",
+                          os.path.expanduser("~/Applications/Google Chrome.app/Contents/Info.plist")])
+    paths = ["/opt/google/chrome/chrome"]
+    for name in ("google-chrome", "google-chrome-stable", "chromium", "chromium-browser"):
+        paths.append(shutil.which(name))
+    return _existing(paths)
+
+
+def probe_chrome(source: str) -> Optional[str]:
+    """读取Chrome版本"""
+    if source.endswith(".plist"):
+        with open(source, "rb") as f:
+            return plistlib.load(f).get("CFBundleShortVersionString")
+    if os.path.isdir(source):
+        # Windows下安装目录中包含以版本号命名的子目录
+        versions = [name for name in os.listdir(source) if _VERSION_PATTERN.fullmatch(name)]
+        if not versions:
+            return None
+        return max(versions, key=lambda v: tuple(int(part) for part in v.split(".")))
+    # Linux下没有版本文件，只能询问可执行文件
+    output = subprocess.run([source, "--version"], capture_output=True, text=True,
+                            timeout=5).stdout
+    match = _VERSION_PATTERN.search(output)
+    return match.group(0) if match else None
+
+
+def cursor_sources() -> List[str]:
+    """Cursor版本信息的候选来源（package.json）"""
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA", "")
+        return _existing([os.path.join(base, "Programs", "cursor", "resources", "app", "package.json")])
+    if sys.platform == "darwin":
+        return _existing(["/Applications/Cursor.app/Contents/Resources/app/package.json",
+                          os.path.expanduser("~/Applications/Cursor.app/Contents/Resources/app/package.json")])
+    paths = ["/opt/Cursor/resources/app/package.json",
+             "/opt/cursor/resources/app/package.json",
+             "/usr/share/cursor/resources/app/package.json"]
+    # AppImage解压后的目录
+    paths.extend(glob.glob(os.path.expanduser("~/.local/share/cursor*/resources/app/package.json")))
+    return _existing(paths)
+
+
+def probe_cursor(source: str) -> Optional[str]:
+    """读取Cursor版本"""
+    with open(source, "r", encoding="utf-8") as f:
+        return json.load(f).get("version")
+
+
+def probe_os(source: Optional[str]) -> str:
+    """读取操作系统信息"""
+    if sys.platform == "win32":
+        release, version = platform.release(), platform.version()
+        # Windows 11 的 release 仍然是 10，通过内部版本号区分
+        build = int(version.split(".")[-1]) if version.split(".")[-1].isdigit() else 0
+        if release == "10" and build >= 22000:
+            release = "11"
+        return f"Windows {release}"
+    if sys.platform == "darwin":
+        return f"macOS {platform.mac_ver()[0]}"
+    return f"{platform.system()} {platform.release()}"
+
+
+class Probe:
+    """探测项"""
+
+    __slots__ = ("name", "label", "sources", "read")
+
+    def __init__(self, name: str, label: str, read: Callable[[Optional[str]], Optional[str]],
+                 sources: Optional[Callable[[], List[str]]] = None):
+        """
+        Args:
+            name: 探测项标识
+            label: 显示文本的消息标识
+            read: 读取函数，参数为来源路径
+            sources: 返回候选来源路径的函数，为None时探测结果不依赖文件
+        """
+        self.name = name
+        self.label = label
+        self.read = read
+        self.sources = sources
+
+    def run(self) -> Tuple[Optional[str], Optional[str]]:
+        """
+        执行探测
+
+        Returns:
+            (检测到的值, 来源路径)
+        """
+        if self.sources is None:
+            return self.read(None), None
+        for source in self.sources():
+            try:
+                value = self.read(source)
+            except (OSError, ValueError, subprocess.SubprocessError):
+                continue
+            if value:
+                return value, source
+        return None, None
+
+
+def _mtime(path: Optional[str]) -> Optional[float]:
+    """文件修改时间，文件不存在时返回None"""
+    if path is None:
+        return None
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+
+class SystemProbe(QObject):
+    """
+    系统探测管理器
+
+    cached() 立即返回上次的结果（可能已过期），refresh() 只在后台重新探测缓存失效的项。
+    """
+
+    # 探测结果更新：探测项标识，值
+    probe_updated = Signal(str, str)
+
+    def __init__(self, cache_path: Optional[str] = None, ttl: float = CACHE_TTL):
+        super().__init__()
+        self.ttl = ttl
+        self._cache_path = cache_path
+        self._cache: Optional[Dict[str, dict]] = None
+        self._probes: Dict[str, Probe] = {}
+
+        self.register(Probe("chrome", "probe.chrome", probe_chrome, chrome_sources))
+        self.register(Probe("cursor", "probe.cursor", probe_cursor, cursor_sources))
+        self.register(Probe("os", "probe.os", probe_os))
+
+    @property
+    def cache_path(self) -> str:
+        """缓存文件路径"""
+        if self._cache_path is None:
+            self._cache_path = app_data_path(CACHE_FILE)
+        return self._cache_path
+
+    def register(self, probe: Probe):
+        """注册探测项"""
+        self._probes[probe.name] = probe
+
+    def probes(self) -> List[Probe]:
+        """按注册顺序返回所有探测项"""
+        return list(self._probes.values())
+
+    def _load_cache(self) -> Dict[str, dict]:
+        """读取缓存文件"""
+        if self._cache is None:
+            try:
+                with open(self.cache_path, "r", encoding="utf-8") as f:
+                    self._cache = json.load(f)
+            except (OSError, ValueError):
+                self._cache = {}
+        return self._cache
+
+    def _save_cache(self):
+        """写入缓存文件，先写临时文件再替换，避免写入中断损坏缓存"""
+        tmp_path = self.cache_path + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._cache, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            pass
+
+    def cached(self) -> Dict[str, str]:
+        """上次探测的结果，没有缓存的项为未检测到"""
+        cache = self._load_cache()
+        return {name: cache.get(name, {}).get("value") or UNKNOWN for name in self._probes}
+
+    def is_fresh(self, name: str) -> bool:
+        """缓存是否仍然有效：未过期且来源文件未被修改"""
+        entry = self._load_cache().get(name)
+        if entry is None:
+            return False
+        if time.time() - entry.get("time", 0) > self.ttl:
+            return False
+        return entry.get("mtime") == _mtime(entry.get("source"))
+
+    def refresh(self, force: bool = False) -> int:
+        """
+        在后台重新探测缓存失效的项
+
+        Args:
+            force: 忽略缓存，重新探测所有项
+
+        Returns:
+            提交的探测任务数量
+        """
+        submitted = 0
+        for probe in self._probes.values():
+            if not force and self.is_fresh(probe.name):
+                continue
+            job_manager.submit(f"system_probe.{probe.name}", self._run_probe, probe,
+                               on_result=self._on_probe_result)
+            submitted += 1
+        return submitted
+
+    @staticmethod
+    def _run_probe(token, progress, probe: Probe):
+        """执行探测（在工作线程中执行）"""
+        value, source = probe.run()
+        return probe.name, value, source, _mtime(source)
+
+    def _on_probe_result(self, result):
+        """探测完成后更新缓存"""
+        name, value, source, mtime = result
+        cache = self._load_cache()
+        cache[name] = {"value": value, "source": source, "mtime": mtime, "time": time.time()}
+        self._save_cache()
+        self.probe_updated.emit(name, value or UNKNOWN)
+
+
+# 创建全局实例
+system_probe = SystemProbe()
@@ -5,8 +5,17 @@
 主题管理器模块 - 管理应用程序的主题切换
 """
 
+import time
+
 from PySide6.QtCore import QObject, Signal
 
+from src.perf.tracer import tracer
+from src.perf.prometheus import metrics_registry
+
+# 导出到指标端点的主题切换次数和耗时
+THEME_SWITCHES = metrics_registry.counter("theme_switches_total", "主题切换次数", ("theme",))
+THEME_SWITCH_SECONDS = metrics_registry.histogram("theme_switch_seconds", "主题切换时所有槽函数的总耗时（秒）")
+
 
 class ThemeManager(QObject):
     """主题管理器类"""
@@ -34,6 +43,12 @@ class ThemeManager(QObject):
             "refresh_btn_hover": "#e0e0e0",
             "refresh_btn_pressed": "#d0d0d0",
             "refresh_btn_text": "#333",
+            "log_bg": "#f9f9f9",
+            "log_debug": "#808080",
+            "log_info": "#333333",
+            "log_warning": "#e08a00",
+            "log_error": "#e53935",
+            "log_critical": "#8e24aa",
         },
         "dark": {
             "bg_color": "#1e1e1e",
@@ -56,12 +71,20 @@ class ThemeManager(QObject):
             "refresh_btn_hover": "#252525",
             "refresh_btn_pressed": "#383838",
             "refresh_btn_text": "#e0e0e0",
+            "log_bg": "#1a1a1a",
+            "log_debug": "#8a8a8a",
+            "log_info": "#e0e0e0",
+            "log_warning": "#ffb74d",
+            "log_error": "#ff6b6b",
+            "log_critical": "#ce93d8",
         }
     }
 
     def __init__(self):
         super().__init__()
         self._current_theme = "light"  # 默认为亮色主题
+        self.switch_count = 0           # 主题切换次数
+        self.last_switch_ms = 0.0       # 上次切换时所有槽函数的总耗时（毫秒）
 
     @property
     def current_theme(self):
@@ -80,7 +103,7 @@ class ThemeManager(QObject):
             self._current_theme = "light"
 
         # 发送主题变更信号
-        self.theme_changed.emit(self._current_theme)
+        self._emit_theme_changed()
 
         return self._current_theme
 
@@ -88,12 +111,23 @@ class ThemeManager(QObject):
         """设置特定主题"""
         if theme_name in self.THEMES:
             self._current_theme = theme_name
-            self.theme_changed.emit(self._current_theme)
+            self._emit_theme_changed()
             return True
         return False
 
+    def _emit_theme_changed(self):
+        """发送主题变更信号并记录耗时"""
+        start = time.perf_counter()
+        with tracer.span("ThemeManager.theme_changed", "theme", theme=self._current_theme):
+            self.theme_changed.emit(self._current_theme)
+        elapsed = time.perf_counter() - start
+        self.last_switch_ms = elapsed * 1000.0
+        self.switch_count += 1
+        THEME_SWITCHES.inc(self._current_theme)
+        THEME_SWITCH_SECONDS.observe(elapsed)
+
     @staticmethod
-    def _lighten_color(color, factor=0.1):
+    def lighten_color(color, factor=0.1):
         """使颜色变亮"""
         if color.startswith('#'):
             color = color[1:]
@@ -104,7 +138,7 @@ class ThemeManager(QObject):
         return f"#{r:02x}{g:02x}{b:02x}"
 
     @staticmethod
-    def _darken_color(color, factor=0.1):
+    def darken_color(color, factor=0.1):
         """使颜色变暗"""
         if color.startswith('#'):
             color = color[1:]
@@ -0,0 +1,56 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+测试配置 - 无界面运行环境和等待后台信号的工具
+
+运行::
+
+    python -m pytest
+"""
+
+import os
+import sys
+import time
+import tempfile
+
+# 必须在导入Qt之前设置
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+# 探测缓存、编译的翻译目录等写入临时目录，不影响本机的数据目录
+os.environ.setdefault("CURSOR_PRO_MAX_HOME", tempfile.mkdtemp(prefix="cursor_pro_max_test_"))
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import pytest
+from PySide6.QtCore import QCoreApplication
+from PySide6.QtWidgets import QApplication
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """整个测试会话共用的QApplication"""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    return app
+
+
+@pytest.fixture
+def wait_until(qapp):
+    """
+    处理事件直到条件成立
+
+    后台任务的信号通过队列连接送到GUI线程，只有处理事件后回调才会执行。
+    """
+    def wait(predicate, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while not predicate():
+            if time.monotonic() > deadline:
+                raise AssertionError("等待超时")
+            QCoreApplication.processEvents()
+            time.sleep(0.001)
+        QCoreApplication.processEvents()
+
+    return wait
@@ -0,0 +1,173 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+翻译目录测试 - 编译和查找、语言回退、过期检查以及随代码提供的目录
+"""
+
+import os
+import json
+
+import pytest
+
+from src.app_paths import ENV_VAR
+from src.i18n import catalog as catalog_module
+from src.i18n.catalog import (
+    Catalog, Translator, compile_catalog, compile_file, LOCALES_DIR, SOURCE_LOCALE
+)
+
+
+def _write_locale(directory, locale, messages):
+    path = os.path.join(directory, f"{locale}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(messages, f, ensure_ascii=False)
+    return path
+
+
+@pytest.fixture
+def locales_dir(tmp_path, monkeypatch):
+    """临时的语言目录，编译结果写入临时数据目录"""
+    monkeypatch.setenv(ENV_VAR, str(tmp_path / "home"))
+    directory = tmp_path / "locales"
+    directory.mkdir()
+    _write_locale(directory, SOURCE_LOCALE, {
+        "nav.home": "首页",
+        "home.greeting": "你好，{name}",
+        "home.only_source": "只有中文",
+    })
+    _write_locale(directory, "en", {
+        "nav.home": "Home",
+        "home.greeting": "Hello, {name}",
+    })
+    return str(directory)
+
+
+def test_compile_and_lookup_round_trip(tmp_path):
+    messages = {f"page{number % 7}.key{number}": f"文本 {number} ✓" for number in range(1000)}
+    messages["empty"] = ""
+    path = tmp_path / "test.cat"
+    path.write_bytes(compile_catalog(messages))
+
+    catalog = Catalog(str(path))
+    try:
+        assert len(catalog) == len(messages)
+        for key, value in messages.items():
+            assert catalog.get(key) == value
+        assert catalog.get("missing") is None
+        # 第二次查找走缓存
+        assert catalog.get("page1.key1") == "文本 1 ✓"
+    finally:
+        catalog.close()
+
+
+def test_compile_file_records_source_stat(tmp_path):
+    source = _write_locale(str(tmp_path), "en", {"a": "A", "b": "B"})
+    target = str(tmp_path / "en.cat")
+
+    assert compile_file(source, target) == 2
+    stat = os.stat(source)
+    catalog = Catalog(target)
+    try:
+        assert catalog.source_stat == [stat.st_size, stat.st_mtime_ns]
+    finally:
+        catalog.close()
+
+
+def test_invalid_catalog_is_rejected(tmp_path):
+    path = tmp_path / "bad.cat"
+    path.write_bytes(b"XXXX" + bytes(64))
+    with pytest.raises(ValueError):
+        Catalog(str(path))
+
+
+def test_too_long_message_is_rejected():
+    with pytest.raises(ValueError):
+        compile_catalog({"key": "x" * 0x10000})
+
+
+def test_translate_with_fields_and_fallback(locales_dir):
+    translator = Translator("en", locales_dir)
+    assert translator.translate("nav.home") == "Home"
+    assert translator.translate("home.greeting", name="Ann") == "Hello, Ann"
+    # 当前语言缺少时回退到源语言，仍然缺少时显示消息标识
+    assert translator.translate("home.only_source") == "只有中文"
+    assert translator.translate("home.missing") == "home.missing"
+
+    translator.set_locale(SOURCE_LOCALE)
+    assert translator.translate("home.greeting", name="小明") == "你好，小明"
+
+
+def test_unknown_locale_falls_back_to_source(locales_dir):
+    translator = Translator("fr", locales_dir)
+    assert translator.translate("nav.home") == "首页"
+    assert translator.catalog("fr") is None
+
+
+def test_available_locales(locales_dir):
+    assert Translator(SOURCE_LOCALE, locales_dir).available_locales() == ["en", SOURCE_LOCALE]
+
+
+def test_catalogs_open_lazily(locales_dir):
+    translator = Translator("en", locales_dir)
+    translator.translate("nav.home")
+    assert SOURCE_LOCALE not in translator._catalogs
+    translator.translate("home.only_source")
+    assert SOURCE_LOCALE in translator._catalogs
+
+
+def test_up_to_date_catalog_is_used_without_compiling(locales_dir, monkeypatch):
+    shipped = os.path.join(locales_dir, "en.cat")
+    compile_file(os.path.join(locales_dir, "en.json"), shipped)
+
+    def fail(*args):
+        raise AssertionError("目录没有过期，不应读取源文件")
+    monkeypatch.setattr(catalog_module, "compile_file", fail)
+
+    catalog = Translator("en", locales_dir).catalog("en")
+    assert catalog.path == shipped
+
+
+def test_stale_catalog_is_compiled_to_data_dir_once(locales_dir, monkeypatch):
+    shipped = os.path.join(locales_dir, "en.cat")
+    source = os.path.join(locales_dir, "en.json")
+    compile_file(source, shipped)
+    _write_locale(locales_dir, "en", {"nav.home": "Start"})
+
+    catalog = Translator("en", locales_dir).catalog("en")
+    assert catalog.path != shipped
+    assert os.path.dirname(catalog.path) == os.environ[ENV_VAR]
+    assert catalog.get("nav.home") == "Start"
+
+    # 之后的启动直接使用数据目录中的编译结果
+    def fail(*args):
+        raise AssertionError("已经编译过，不应再次读取源文件")
+    monkeypatch.setattr(catalog_module, "compile_file", fail)
+    assert Translator("en", locales_dir).catalog("en").get("nav.home") == "Start"
+
+
+def test_compiled_catalog_without_source(locales_dir):
+    source = os.path.join(locales_dir, "en.json")
+    compile_file(source, os.path.join(locales_dir, "en.cat"))
+    os.remove(source)
+    assert Translator("en", locales_dir).translate("nav.home") == "Home"
+
+
+@pytest.mark.parametrize("locale", ["zh_CN", "en"])
+def test_shipped_catalogs_match_sources(locale):
+    with open(os.path.join(LOCALES_DIR, f"{locale}.json"), encoding="utf-8") as f:
+        messages = json.load(f)
+    catalog = Catalog(os.path.join(LOCALES_DIR, f"{locale}.cat"))
+    try:
+        assert len(catalog) == len(messages)
+        for key, value in messages.items():
+            assert catalog.get(key) == value
+    finally:
+        catalog.close()
+
+
+def test_shipped_locales_have_same_keys():
+    keys = {}
+    for locale in ("zh_CN", "en"):
+        with open(os.path.join(LOCALES_DIR, f"{locale}.json"), encoding="utf-8") as f:
+            keys[locale] = set(json.load(f))
+    assert keys["zh_CN"] == keys["en"]
@@ -0,0 +1,31 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+普查测试 - 主窗口在主题切换和页面导航循环后没有残留的QObject和信号连接
+"""
+
+import pytest
+
+from src.perf.census import run_census
+
+
+@pytest.fixture
+def main_window(qapp, tmp_path, monkeypatch):
+    # 日志目录是相对路径，在临时目录中运行
+    monkeypatch.chdir(tmp_path)
+    from src.main_app import create_main_window
+    window, sidebar, content_manager = create_main_window()
+    window.show()
+    yield window, sidebar, content_manager
+    window.close()
+    window.deleteLater()
+    qapp.processEvents()
+
+
+def test_navigation_and_theme_cycles_are_flat(main_window):
+    window, sidebar, content_manager = main_window
+    result = run_census(window, sidebar, content_manager, cycles=5)
+    assert result.cycles == 5
+    assert result.before.qobject_total > 0
+    result.assert_flat()
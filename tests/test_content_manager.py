@@ -0,0 +1,48 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+内容管理器测试 - 超出预算时回收隐藏页面，常驻页面不被回收
+"""
+
+import pytest
+
+from src.logger import Logger
+from src.content.content_manager import ContentManager
+
+
+@pytest.fixture
+def logger(tmp_path):
+    logger = Logger("TestContent", log_dir=str(tmp_path), console=False, file=False, gui=True)
+    yield logger
+    logger.shutdown()
+
+
+def _visit(manager, qapp, pages):
+    for page_id in pages:
+        manager.set_current_page(page_id)
+        qapp.processEvents()
+
+
+def test_hidden_pages_are_evicted_over_budget(qapp, logger):
+    manager = ContentManager(logger, "account", widget_budget=1)
+    _visit(manager, qapp, ["about", "account"])
+
+    assert manager.page("about") is None
+    assert manager.page("account") is not None
+    manager.deleteLater()
+
+
+def test_home_page_is_pinned(qapp, logger):
+    manager = ContentManager(logger, "home", widget_budget=1)
+    home = manager.page("home")
+    _visit(manager, qapp, ["about", "account", "about"])
+
+    # 主页持有日志存储，隐藏时也不回收
+    assert manager.page("home") is home
+    assert manager.page("account") is None
+
+    manager.pin_page("home", False)
+    _visit(manager, qapp, ["account"])
+    assert manager.page("home") is None
+    manager.deleteLater()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+直方图测试 - 百分位数精度、合并和统计摘要
+"""
+
+import random
+
+import pytest
+
+from src.perf.histogram import LatencyHistogram
+
+
+def _exact_percentile(values, percent):
+    ordered = sorted(values)
+    index = max(1, -(-len(ordered) * percent // 100)) - 1
+    return ordered[int(index)]
+
+
+def test_empty_histogram():
+    histogram = LatencyHistogram()
+    assert histogram.count == 0
+    assert histogram.percentile(50) == 0
+    assert histogram.mean == 0.0
+
+
+def test_small_values_are_exact():
+    histogram = LatencyHistogram()
+    for value in range(1, 101):
+        histogram.record(value)
+    assert histogram.percentiles() == {50: 50, 95: 95, 99: 99}
+    assert histogram.percentile(100) == 100
+    assert histogram.min == 1
+    assert histogram.max == 100
+    assert histogram.mean == pytest.approx(50.5)
+
+
+@pytest.mark.parametrize("percent", [50, 90, 95, 99, 99.9])
+def test_percentile_relative_error(percent):
+    rng = random.Random(1)
+    values = [int(rng.lognormvariate(8, 1.5)) for _ in range(20000)]
+    histogram = LatencyHistogram()
+    for value in values:
+        histogram.record(value)
+
+    exact = _exact_percentile(values, percent)
+    estimate = histogram.percentile(percent)
+    # 返回所在桶的上界，7位精度时每个2的幂区间分为64个子桶，桶宽不超过下界的1/64
+    assert exact <= estimate <= exact * (1 + 1 / 64)
+
+
+def test_percentile_never_exceeds_max():
+    histogram = LatencyHistogram()
+    histogram.record(1000)
+    histogram.record(1001)
+    assert histogram.percentile(100) == 1001
+    assert histogram.percentile(50) <= 1001
+
+
+def test_record_with_count_and_negative_values():
+    histogram = LatencyHistogram()
+    histogram.record(10, count=9)
+    histogram.record(-5)
+    assert histogram.count == 10
+    assert histogram.min == 0
+    assert histogram.percentile(10) == 0
+    assert histogram.percentile(50) == 10
+
+
+def test_merge_matches_single_histogram():
+    rng = random.Random(2)
+    values = [rng.randint(0, 5_000_000) for _ in range(5000)]
+    combined, first, second = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+    for number, value in enumerate(values):
+        combined.record(value)
+        (first if number % 2 else second).record(value)
+
+    first.merge(second)
+    assert first.count == combined.count
+    assert (first.min, first.max, first.total) == (combined.min, combined.max, combined.total)
+    assert first.percentiles((50, 95, 99, 99.9)) == combined.percentiles((50, 95, 99, 99.9))
+
+
+def test_merge_rejects_different_precision():
+    with pytest.raises(ValueError):
+        LatencyHistogram(7).merge(LatencyHistogram(5))
+
+
+def test_reset_and_summary():
+    histogram = LatencyHistogram()
+    for value in (1000, 2000, 3000):
+        histogram.record(value)
+    summary = histogram.summary()
+    assert summary["count"] == 3
+    assert summary["mean"] == pytest.approx(2.0)
+    assert summary["max"] == pytest.approx(3.0)
+
+    histogram.reset()
+    assert histogram.count == 0
+    assert list(histogram.buckets()) == []
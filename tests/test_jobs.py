@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+后台任务测试 - 按键合并提交、取消、进度节流和退出时等待
+"""
+
+import threading
+
+import pytest
+from PySide6.QtCore import QCoreApplication, QEvent, QThreadPool
+
+from src.jobs import JobManager, CancellationToken, CancelledError
+
+
+@pytest.fixture
+def manager(qapp):
+    pool = QThreadPool()
+    # 部分测试需要两个任务同时执行
+    pool.setMaxThreadCount(4)
+    manager = JobManager(pool)
+    yield manager
+    manager.shutdown(2000)
+    # 在管理器销毁前送达已发出的结束信号，否则会在之后的测试中送到已销毁的对象
+    QCoreApplication.processEvents()
+    QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+
+
+def _blocking(release):
+    """等待 release 后返回，期间响应取消"""
+    def fn(token, progress, value):
+        while not release.wait(0.005):
+            token.raise_if_cancelled()
+        return value
+    return fn
+
+
+def test_cancellation_token():
+    token = CancellationToken()
+    assert not token.cancelled
+    token.raise_if_cancelled()
+    token.cancel()
+    assert token.cancelled
+    with pytest.raises(CancelledError):
+        token.raise_if_cancelled()
+
+
+def test_submit_coalesces_by_key(manager, wait_until):
+    release = threading.Event()
+    calls = []
+    results = []
+
+    def fn(token, progress):
+        calls.append(1)
+        release.wait(5)
+        return "done"
+
+    first = manager.submit("load", fn, on_result=results.append)
+    second = manager.submit("load", fn, on_result=results.append)
+    assert second is first
+    assert manager.is_running("load")
+
+    release.set()
+    wait_until(lambda: not manager.is_running("load"))
+    assert calls == [1]
+    # 合并的提交同样收到结果
+    assert results == ["done", "done"]
+
+
+def test_resubmit_after_finish_runs_again(manager, wait_until):
+    release = threading.Event()
+    release.set()
+    results = []
+
+    manager.submit("load", _blocking(release), 1, on_result=results.append)
+    wait_until(lambda: not manager.is_running("load"))
+    manager.submit("load", _blocking(release), 2, on_result=results.append)
+    wait_until(lambda: not manager.is_running("load"))
+    assert results == [1, 2]
+
+
+def test_different_keys_run_independently(manager, wait_until):
+    release = threading.Event()
+    results = []
+
+    first = manager.submit("a", _blocking(release), "a", on_result=results.append)
+    second = manager.submit("b", _blocking(release), "b", on_result=results.append)
+    assert first is not second
+
+    release.set()
+    wait_until(lambda: len(results) == 2)
+    assert sorted(results) == ["a", "b"]
+
+
+def test_cancel_emits_cancelled_without_result(manager, wait_until):
+    release = threading.Event()
+    results, cancelled, finished = [], [], []
+
+    job = manager.submit("load", _blocking(release), 1,
+                         on_result=results.append, on_finished=lambda: finished.append(1))
+    job.signals.cancelled.connect(lambda: cancelled.append(1))
+    assert manager.cancel("load")
+    assert not manager.cancel("missing")
+
+    wait_until(lambda: finished)
+    assert cancelled == [1]
+    assert results == []
+    assert not manager.is_running("load")
+
+
+def test_error_reports_traceback(manager, wait_until):
+    errors, results = [], []
+
+    def fn(token, progress):
+        raise RuntimeError("导入失败")
+
+    manager.submit("load", fn, on_result=results.append, on_error=errors.append)
+    wait_until(lambda: errors)
+    assert "RuntimeError: 导入失败" in errors[0]
+    assert "Traceback" in errors[0]
+    assert results == []
+
+
+def test_progress_is_throttled_and_last_value_delivered(manager, wait_until):
+    values, results = [], []
+
+    def fn(token, progress):
+        for value in range(1000):
+            progress(value)
+        return "done"
+
+    manager.submit("load", fn, on_progress=values.append, on_result=results.append,
+                   progress_interval=60.0)
+    wait_until(lambda: results)
+    # 第一次立即发送，其余被跳过，最后的进度在结果之前补发
+    assert values == [0, 999]
+
+
+def test_progress_without_throttling(manager, wait_until):
+    values, results = [], []
+
+    def fn(token, progress):
+        for value in range(5):
+            progress(value)
+        return "done"
+
+    manager.submit("load", fn, on_progress=values.append, on_result=results.append,
+                   progress_interval=0.0)
+    wait_until(lambda: results)
+    assert values == [0, 1, 2, 3, 4]
+
+
+def test_shutdown_cancels_and_waits(manager, qapp):
+    release = threading.Event()
+    started = threading.Semaphore(0)
+    observed = []
+
+    def fn(token, progress):
+        started.release()
+        try:
+            while not release.wait(0.005):
+                token.raise_if_cancelled()
+        except CancelledError:
+            observed.append("cancelled")
+            raise
+
+    manager.submit("a", fn)
+    manager.submit("b", fn)
+    assert started.acquire(timeout=5) and started.acquire(timeout=5)
+    assert manager.shutdown(2000)
+    assert observed == ["cancelled", "cancelled"]
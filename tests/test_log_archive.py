@@ -0,0 +1,103 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+日志归档测试 - 导入日志文件不重复写入已归档的记录
+"""
+
+import logging
+import time
+
+import pytest
+
+from src.log_archive import LogArchive, import_log_files, LIVE_SOURCE
+
+STAMP = "2024-01-02 03:04:05"
+TIMESTAMP = time.mktime(time.strptime(STAMP, "%Y-%m-%d %H:%M:%S"))
+
+
+@pytest.fixture
+def archive(tmp_path):
+    archive = LogArchive(str(tmp_path / "archive.db"))
+    yield archive
+    archive.close()
+
+
+def _write_log(path, messages):
+    with open(path, "a", encoding="utf-8") as f:
+        for level, message in messages:
+            f.write(f"{STAMP} - {level} - {message}\n")
+
+
+def test_import_is_incremental(archive, tmp_path):
+    log_dir = tmp_path / "logs"
+    log_dir.mkdir()
+    path = log_dir / "app_20240102.log"
+    _write_log(path, [("INFO", "启动"), ("ERROR", "失败")])
+
+    assert import_log_files(None, None, archive, str(log_dir)) == 2
+    # 文件没有变化时跳过
+    assert import_log_files(None, None, archive, str(log_dir)) == 0
+
+    _write_log(path, [("INFO", "退出")])
+    assert import_log_files(None, None, archive, str(log_dir)) == 1
+    assert archive.count() == 3
+
+
+def test_import_skips_records_written_live(archive, tmp_path):
+    log_dir = tmp_path / "logs"
+    log_dir.mkdir()
+    # 崩溃前归档输出端已实时写入了两条，其中一条消息重复出现
+    archive.insert([
+        (TIMESTAMP + 0.25, logging.INFO, "INFO", "重复", LIVE_SOURCE),
+        (TIMESTAMP + 0.5, logging.INFO, "INFO", "启动", LIVE_SOURCE),
+    ])
+    _write_log(log_dir / "app_20240102.log", [("INFO", "重复"), ("INFO", "重复"), ("INFO", "启动")])
+
+    assert import_log_files(None, None, archive, str(log_dir)) == 1
+    messages = sorted(row["message"] for row in archive.query())
+    assert messages == ["启动", "重复", "重复"]
+
+
+def test_interrupted_import_is_not_duplicated(archive, tmp_path):
+    log_dir = tmp_path / "logs"
+    log_dir.mkdir()
+    path = log_dir / "app_20240102.log"
+    _write_log(path, [("INFO", f"消息 {number}") for number in range(10)])
+
+    # 上次导入插入了部分记录但没来得及记录导入位置
+    rows = [(TIMESTAMP, logging.INFO, "INFO", f"消息 {number}", path.name) for number in range(4)]
+    archive.insert(rows)
+
+    assert import_log_files(None, None, archive, str(log_dir)) == 6
+    assert archive.count() == 10
+
+
+def test_other_sources_are_not_matched(archive):
+    archive.insert([(TIMESTAMP, logging.INFO, "INFO", "启动", "app_20240101.log")])
+    row = (TIMESTAMP, logging.INFO, "INFO", "启动", "app_20240102.log")
+    assert archive.insert_missing([row], (LIVE_SOURCE, "app_20240102.log")) == 1
+    assert archive.insert_missing([], (LIVE_SOURCE,)) == 0
+
+
+def test_shared_log_file_keeps_other_process_records(tmp_path):
+    from src.logger import Logger
+    log_dir = tmp_path / "logs"
+    logger = Logger("TestArchiveShared", log_dir=str(log_dir), console=False, file=True,
+                    archive=True, shared=True)
+    logger.info("本进程 1")
+    logger.flush()
+    # 另一个没有开启归档的进程向同一个日志文件追加了一条记录
+    with open(logger.log_file, "a", encoding="utf-8") as f:
+        f.write(time.strftime("%Y-%m-%d %H:%M:%S") + " - WARNING - 其他进程\n")
+    logger.info("本进程 2")
+    logger.shutdown()
+
+    archive = LogArchive(logger.archive_path)
+    try:
+        # 关闭时没有把整个文件标记为已导入，其他进程的记录在下次导入时补上
+        assert import_log_files(None, None, archive, str(log_dir)) == 1
+        messages = sorted(row["message"] for row in archive.query())
+        assert messages == ["其他进程", "本进程 1", "本进程 2"]
+    finally:
+        archive.close()
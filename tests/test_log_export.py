@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+日志导出测试 - 文本和JSON Lines格式、过滤、压缩以及取消时不留下文件
+"""
+
+import os
+import gzip
+import json
+import time
+
+import pytest
+
+from src.jobs import CancellationToken, CancelledError
+from src.log_store import LogStore
+from src.log_export import export_records, format_from_path, FORMAT_TEXT, FORMAT_JSONL
+from src.logger import Logger
+
+# 2024-01-02 03:04:05.678 本地时间
+TIMESTAMP = time.mktime((2024, 1, 2, 3, 4, 5, 0, 0, -1)) + 0.678
+
+
+@pytest.fixture
+def store():
+    store = LogStore()
+    store.append("DEBUG", "调试", timestamp=TIMESTAMP)
+    store.append("INFO", "启动", timestamp=TIMESTAMP + 1)
+    store.append("WARNING", '磁盘 "C:" 空间不足', timestamp=TIMESTAMP + 2)
+    store.append("ERROR", "失败\n调用栈", timestamp=TIMESTAMP + 3)
+    return store
+
+
+def _export(store, path, **kwargs):
+    progress = []
+    count = export_records(CancellationToken(), progress.append, store, str(path), **kwargs)
+    return count, progress
+
+
+@pytest.mark.parametrize("path, expected", [
+    ("logs.txt", (FORMAT_TEXT, False)),
+    ("logs.log", (FORMAT_TEXT, False)),
+    ("logs.JSONL", (FORMAT_JSONL, False)),
+    ("logs.json", (FORMAT_JSONL, False)),
+    ("logs.txt.gz", (FORMAT_TEXT, True)),
+    ("logs.jsonl.gz", (FORMAT_JSONL, True)),
+])
+def test_format_from_path(path, expected):
+    assert format_from_path(path) == expected
+
+
+def test_text_export(store, tmp_path):
+    path = tmp_path / "logs.txt"
+    count, progress = _export(store, path)
+
+    assert count == 4
+    assert progress[-1] == (4, 4)
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert lines[0] == "2024-01-02 03:04:05.678 - 调试"
+    assert lines[1] == "2024-01-02 03:04:06.678 - 启动"
+    assert not os.path.exists(str(path) + ".part")
+
+
+def test_jsonl_export_with_min_level(store, tmp_path):
+    path = tmp_path / "logs.jsonl"
+    count, _ = _export(store, path, fmt=FORMAT_JSONL, min_level=Logger.LEVELS["warning"])
+
+    assert count == 2
+    rows = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert rows == [
+        {"time": "2024-01-02 03:04:07.678", "level": "WARNING", "message": '磁盘 "C:" 空间不足'},
+        {"time": "2024-01-02 03:04:08.678", "level": "ERROR", "message": "失败\n调用栈"},
+    ]
+
+
+def test_compressed_export_of_selected_indices(store, tmp_path):
+    path = tmp_path / "logs.jsonl.gz"
+    count, _ = _export(store, path, fmt=FORMAT_JSONL, compress=True, indices=[1, 3])
+
+    assert count == 2
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        messages = [json.loads(line)["message"] for line in f]
+    assert messages == ["启动", "失败\n调用栈"]
+
+
+def test_export_range_in_chunks(tmp_path):
+    store = LogStore()
+    for number in range(1000):
+        store.append("INFO", f"message {number}", timestamp=TIMESTAMP)
+    path = tmp_path / "logs.txt"
+    count, progress = _export(store, path, start=100, end=900, chunk_size=300)
+
+    assert count == 800
+    assert progress == [(300, 800), (600, 800), (800, 800)]
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert lines[0].endswith("message 100")
+    assert lines[-1].endswith("message 899")
+
+
+def test_cancel_leaves_no_file(store, tmp_path):
+    path = tmp_path / "logs.txt"
+    path.write_text("旧的导出", encoding="utf-8")
+    token = CancellationToken()
+
+    def progress(value):
+        token.cancel()
+
+    with pytest.raises(CancelledError):
+        export_records(token, progress, store, str(path), chunk_size=1)
+    # 取消时不留下临时文件，也不覆盖已有的文件
+    assert not os.path.exists(str(path) + ".part")
+    assert path.read_text(encoding="utf-8") == "旧的导出"
@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+日志输出端测试 - 卡住的输出端不阻塞退出和日志调用
+"""
+
+import time
+import logging
+import threading
+
+import pytest
+
+from src.log_sinks import (
+    LogSink, FileSink, GuiSink, FLUSH_TIMEOUT, BLOCK, DROP_NEW, DROP_OLDEST, FAST, SAFE, DURABLE
+)
+
+
+class StuckSink(LogSink):
+    """写入时一直等待 unblock 的输出端"""
+
+    def __init__(self, name="stuck", **kwargs):
+        super().__init__(name, **kwargs)
+        self.unblock = threading.Event()
+        self.batches = []
+
+    def write_batch(self, batch):
+        self.unblock.wait(10)
+        self.batches.append([text for _, text in batch])
+
+
+def _record(message, level=logging.INFO):
+    return logging.LogRecord("test", level, __file__, 0, message, None, None)
+
+
+@pytest.fixture
+def stuck():
+    sink = StuckSink()
+    yield sink
+    sink.unblock.set()
+    sink.close()
+
+
+def test_flush_without_timeout_is_bounded(stuck):
+    stuck.handle(_record("卡住"))
+    start = time.monotonic()
+    # logging.shutdown() 在退出时不带参数调用 flush()
+    assert not stuck.flush()
+    assert time.monotonic() - start < FLUSH_TIMEOUT + 1
+
+
+def test_flush_waits_for_records():
+    sink = StuckSink()
+    sink.unblock.set()
+    sink.handle(_record("a"))
+    sink.handle(_record("b"))
+    assert sink.flush()
+    assert [text.split(" - ", 1)[1] for batch in sink.batches for text in batch] == ["INFO - a", "INFO - b"]
+    sink.close()
+
+
+@pytest.mark.parametrize("durability, policy", [(FAST, DROP_OLDEST), (SAFE, DROP_OLDEST), (DURABLE, BLOCK)])
+def test_file_sink_policy_follows_durability(tmp_path, durability, policy):
+    sink = FileSink("file", str(tmp_path / "app.log"), durability=durability)
+    assert sink.policy == policy
+    sink.set_durability(FAST)
+    assert sink.policy == DROP_OLDEST
+    sink.close()
+
+
+def test_explicit_policy_is_kept(tmp_path):
+    sink = FileSink("file", str(tmp_path / "app.log"), durability=FAST, policy=DROP_NEW)
+    sink.set_durability(DURABLE)
+    assert sink.policy == DROP_NEW
+    sink.close()
+
+
+def test_full_queue_drops_instead_of_blocking(stuck):
+    stuck.policy = DROP_OLDEST
+    stuck.capacity = 3
+    start = time.monotonic()
+    for number in range(20):
+        stuck.handle(_record(f"消息 {number}"))
+    assert time.monotonic() - start < 0.5
+    # 输出端线程卡在第一批上，之后队列满时丢弃最旧的记录
+    assert stuck.received == 20
+    assert stuck.dropped > 0
+    assert stuck.queued == 3
+
+
+def test_gui_queue_depth(qapp):
+    from PySide6.QtCore import QCoreApplication
+    from src.logger import LogSignal
+
+    signal = LogSignal()
+    sink = GuiSink("gui", signal)
+    for number in range(500):
+        sink.handle(_record(f"消息 {number}"))
+    assert sink.flush()
+    # 输出端线程发出的信号排队等待GUI线程处理
+    assert signal.queue_depth == 500
+    QCoreApplication.processEvents()
+    assert signal.queue_depth == 0
+    assert (signal.sent, signal.delivered) == (500, 500)
+    sink.close()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+日志存储测试 - 序号、容量限制和分块读取
+"""
+
+from src.log_store import LogStore
+
+
+def _filled(count, max_records=0):
+    store = LogStore(max_records)
+    for number in range(count):
+        store.append("INFO", f"message {number}", timestamp=float(number))
+    return store
+
+
+def test_append_returns_increasing_indices():
+    store = LogStore()
+    assert store.append("INFO", "a") == 0
+    assert store.append("ERROR", "b") == 1
+    assert store.end_index == 2
+    assert len(store) == 2
+    start, records = store.read(0, 10)
+    assert start == 0
+    assert [record[1:] for record in records] == [("INFO", "a"), ("ERROR", "b")]
+
+
+def test_capacity_drops_oldest_in_blocks():
+    store = _filled(101, max_records=100)
+    # 超出容量时一次丢弃十分之一
+    assert store.first_index == 10
+    assert store.end_index == 101
+    assert len(store) == 91
+
+    start, records = store.read(0, 15)
+    assert start == 10
+    assert [record[2] for record in records] == [f"message {number}" for number in range(10, 15)]
+
+
+def test_read_out_of_range():
+    store = _filled(5)
+    assert store.read(5, 10) == (5, [])
+    assert store.read(3, 2)[1] == []
+
+
+def test_iter_chunks_covers_range():
+    store = _filled(2500)
+    chunks = list(store.iter_chunks(100, 2100, chunk_size=700))
+    assert [len(chunk) for chunk in chunks] == [700, 700, 600]
+    assert chunks[0][0][2] == "message 100"
+    assert chunks[-1][-1][2] == "message 2099"
+
+
+def test_iter_chunks_skips_dropped_records():
+    store = _filled(250, max_records=200)
+    messages = [record[2] for chunk in store.iter_chunks(0, chunk_size=30) for record in chunk]
+    assert messages == [f"message {number}" for number in range(store.first_index, 250)]
+
+
+def test_iter_indices_skips_dropped_records():
+    store = _filled(250, max_records=200)
+    indices = [0, 5, store.first_index, 200, 249, 250]
+    records = [record for chunk in store.iter_indices(indices, chunk_size=2) for record in chunk]
+    assert [record[2] for record in records] == [f"message {store.first_index}", "message 200", "message 249"]
+
+
+def test_clear_keeps_indices_increasing():
+    store = _filled(10)
+    store.clear()
+    assert len(store) == 0
+    assert store.first_index == 10
+    assert store.read(0, 10) == (10, [])
+    assert store.append("INFO", "after") == 10
@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+日志显示组件测试 - 显示内容不超过日志存储的容量，选中文本对应到记录
+"""
+
+import pytest
+from PySide6.QtGui import QTextCursor
+
+from src.logger import Logger
+from src.log_store import LogStore
+from src.log_widget import LogWidget
+
+
+@pytest.fixture
+def logger(tmp_path):
+    logger = Logger("TestLogWidget", log_dir=str(tmp_path), console=False, file=False, gui=True)
+    yield logger
+    logger.shutdown()
+
+
+def _select_block(widget, number):
+    """选中第 number 个文本块"""
+    block = widget.log_text.document().findBlockByNumber(number)
+    cursor = QTextCursor(block)
+    cursor.movePosition(QTextCursor.MoveOperation.EndOfBlock, QTextCursor.MoveMode.KeepAnchor)
+    widget.log_text.setTextCursor(cursor)
+
+
+def test_display_follows_store_eviction(qapp, logger):
+    store = LogStore(max_records=100)
+    widget = LogWidget(logger, store=store)
+    for number in range(1000):
+        # 每隔几条插入一条多行消息
+        message = f"INFO - 消息 {number}" + ("\n调用栈" if number % 7 == 0 else "")
+        widget.on_new_log("INFO", message)
+
+    document = widget.log_text.document()
+    assert len(widget._displayed) <= store.max_records
+    assert widget._displayed[0] >= store.first_index
+    assert document.blockCount() <= 2 * store.max_records + 1
+    assert document.firstBlock().text() == store.read(widget._displayed[0], widget._displayed[0] + 1)[1][0][2]
+    assert not document.isUndoAvailable()
+
+    # 删除旧文本后选中的文本仍然对应到正确的记录
+    _select_block(widget, document.blockCount() - 2)
+    assert list(widget._selected_indices()) == [999]
+    widget.deleteLater()
+
+
+def test_filtered_records_are_trimmed_too(qapp, logger):
+    store = LogStore(max_records=10)
+    widget = LogWidget(logger, store=store)
+    widget.level_combo.setCurrentText("WARNING")
+    widget.on_new_log("WARNING", "WARNING - 第一条")
+    for number in range(50):
+        widget.on_new_log("DEBUG", f"DEBUG - {number}")
+
+    # 唯一显示的记录已从存储中丢弃
+    assert len(widget._displayed) == 0
+    assert widget.log_text.document().toPlainText() == ""
+    widget.level_combo.setCurrentText("DEBUG")
+    widget.deleteLater()
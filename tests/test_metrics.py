@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+运行时指标测试 - Python堆占用按声明的单位采样和显示
+"""
+
+import tracemalloc
+
+import pytest
+
+from src.logger import Logger
+from src.perf.metrics import MetricsSampler, RingBuffer, python_heap, HEAP_BYTES, HEAP_BLOCKS
+
+
+@pytest.fixture
+def logger(tmp_path):
+    logger = Logger("TestMetrics", log_dir=str(tmp_path), console=False, file=False, gui=True)
+    yield logger
+    logger.shutdown()
+
+
+@pytest.fixture
+def tracing():
+    tracemalloc.start()
+    yield
+    tracemalloc.stop()
+
+
+def test_ring_buffer_wraps():
+    ring = RingBuffer(3)
+    for value in range(5):
+        ring.append(value)
+    assert ring.values() == [2.0, 3.0, 4.0]
+    assert ring.last == 4.0
+    ring.clear()
+    assert ring.values() == []
+
+
+def test_python_heap_declares_blocks_without_tracing():
+    assert not tracemalloc.is_tracing()
+    value, unit = python_heap()
+    assert unit == HEAP_BLOCKS
+    assert value > 0
+
+
+def test_python_heap_declares_bytes_with_tracing(tracing):
+    data = bytearray(1024 * 1024)
+    value, unit = python_heap()
+    assert unit == HEAP_BYTES
+    assert value >= len(data)
+
+
+def test_sampler_resets_history_when_unit_changes(logger):
+    sampler = MetricsSampler()
+    sampler.sample(logger)
+    sampler.sample(logger)
+    assert sampler.heap_unit == HEAP_BLOCKS
+    assert len(sampler.buffer("python_heap")) == 2
+
+    tracemalloc.start()
+    try:
+        sampler.sample(logger)
+    finally:
+        tracemalloc.stop()
+    assert sampler.heap_unit == HEAP_BYTES
+    assert len(sampler.buffer("python_heap")) == 1
+
+
+def test_heap_is_formatted_by_unit(qapp, monkeypatch):
+    from src.i18n.catalog import tr
+    from src.content import diagnostics_page
+    from src.perf.metrics import metrics_sampler
+
+    # 小于10MB的已跟踪字节数仍然按字节显示
+    monkeypatch.setattr(metrics_sampler, "heap_unit", HEAP_BYTES)
+    assert diagnostics_page._format_heap(5 * 1024 * 1024) == "5.0 MB"
+    monkeypatch.setattr(metrics_sampler, "heap_unit", HEAP_BLOCKS)
+    assert diagnostics_page._format_heap(20_000_000) == tr("diagnostics.blocks", count=20_000_000)
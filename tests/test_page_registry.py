@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+页面注册表测试 - 延迟导入页面模块和第三方页面入口点
+"""
+
+import importlib.metadata
+
+import pytest
+
+from src.page_registry import PageRegistry, PageInfo, ENTRY_POINT_GROUP
+
+
+class FakeEntryPoint:
+    """入口点，load() 返回指定的对象或抛出指定的异常"""
+
+    def __init__(self, name, spec):
+        self.name = name
+        self.spec = spec
+
+    def load(self):
+        if isinstance(self.spec, Exception):
+            raise self.spec
+        return self.spec
+
+
+class RecordingLogger:
+    def __init__(self):
+        self.warnings = []
+
+    def warning(self, message, *args):
+        self.warnings.append(message % args)
+
+
+@pytest.fixture
+def entry_points(monkeypatch):
+    """替换已安装包的入口点"""
+    points = []
+    monkeypatch.setattr(importlib.metadata, "entry_points", lambda: {ENTRY_POINT_GROUP: points})
+    return points
+
+
+def test_page_module_is_imported_on_first_use():
+    registry = PageRegistry()
+    info = registry.register("json", "JSON", "json", "JSONDecoder")
+    assert "json" in registry
+    assert not info.loaded
+    assert registry.create_page("json").__class__.__name__ == "JSONDecoder"
+    assert info.loaded
+    with pytest.raises(KeyError):
+        registry.create_page("missing")
+
+
+def test_lookup_does_not_scan_entry_points(monkeypatch):
+    def fail():
+        raise AssertionError("查找内置页面时不应扫描入口点")
+    monkeypatch.setattr(importlib.metadata, "entry_points", fail)
+
+    registry = PageRegistry()
+    registry.register("home", "nav.home", "src.content.content_pages", "HomePage")
+    assert registry.get("home").label == "nav.home"
+    assert "plugin" not in registry
+    assert [info.page_id for info in registry.pages()] == ["home"]
+
+
+def test_load_plugins_registers_valid_entries(entry_points):
+    entry_points.extend([
+        FakeEntryPoint("stats", {"label": "统计", "module": "plugin.stats", "factory": "StatsPage"}),
+        FakeEntryPoint("tuple", ("元组", "plugin.tuple", "TuplePage")),
+        FakeEntryPoint("info", PageInfo("custom", "自定义", "plugin.custom", "CustomPage")),
+    ])
+    registry = PageRegistry()
+    registry.register("home", "nav.home", "src.content.content_pages", "HomePage")
+
+    loaded = registry.load_plugins()
+    assert [info.page_id for info in loaded] == ["stats", "tuple", "custom"]
+    # 只扫描一次
+    assert registry.load_plugins() == []
+
+
+def test_malformed_entries_are_skipped_with_warning(entry_points):
+    entry_points.extend([
+        FakeEntryPoint("broken_import", ImportError("没有模块")),
+        FakeEntryPoint("no_factory", {"label": "缺少工厂", "module": "plugin.page"}),
+        FakeEntryPoint("bad_label", {"label": None, "module": "plugin.page", "factory": "Page"}),
+        FakeEntryPoint("short_tuple", ("标签", "plugin.page")),
+        FakeEntryPoint("class", object),
+        FakeEntryPoint("good", {"label": "正常", "module": "plugin.good", "factory": "GoodPage"}),
+    ])
+    logger = RecordingLogger()
+    registry = PageRegistry()
+
+    loaded = registry.load_plugins(logger)
+    assert [info.page_id for info in loaded] == ["good"]
+    assert len(logger.warnings) == 5
+    assert "no_factory" in logger.warnings[1] and "factory" in logger.warnings[1]
+    assert "no_factory" not in registry
@@ -0,0 +1,138 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+指标端点测试 - Prometheus文本格式输出、多线程计数和HTTP端点
+"""
+
+import math
+import threading
+import urllib.request
+
+from src.perf.prometheus import MetricsRegistry, MetricsServer, PREFIX
+
+
+def _lines(registry, name):
+    """指定指标的所有输出行"""
+    return [line for line in registry.render().splitlines() if PREFIX + name in line]
+
+
+def test_unlabeled_counter_starts_at_zero():
+    registry = MetricsRegistry()
+    registry.counter("requests_total", "请求数")
+    assert _lines(registry, "requests_total") == [
+        f"# HELP {PREFIX}requests_total 请求数",
+        f"# TYPE {PREFIX}requests_total counter",
+        f"{PREFIX}requests_total 0",
+    ]
+
+
+def test_labeled_counter():
+    registry = MetricsRegistry()
+    counter = registry.counter("logs_total", "日志数", ("level",))
+    counter.inc("INFO")
+    counter.inc("INFO", amount=2)
+    counter.inc("ERROR", amount=0.5)
+
+    samples = _lines(registry, "logs_total")[2:]
+    assert sorted(samples) == sorted([
+        f'{PREFIX}logs_total{{level="INFO"}} 3',
+        f'{PREFIX}logs_total{{level="ERROR"}} 0.5',
+    ])
+
+
+def test_same_name_returns_existing_metric():
+    registry = MetricsRegistry()
+    assert registry.counter("a", "A") is registry.counter("a", "A")
+
+
+def test_label_and_help_escaping():
+    registry = MetricsRegistry()
+    counter = registry.counter("escaped_total", "第一行\n第二行 \\ 反斜杠", ("path",))
+    counter.inc('C:\\logs\n"new"')
+
+    lines = _lines(registry, "escaped_total")
+    assert lines[0] == f"# HELP {PREFIX}escaped_total 第一行\\n第二行 \\\\ 反斜杠"
+    assert lines[2] == f'{PREFIX}escaped_total{{path="C:\\\\logs\\n\\"new\\""}} 1'
+
+
+def test_histogram_buckets_are_cumulative():
+    registry = MetricsRegistry()
+    histogram = registry.histogram("latency_seconds", "耗时", ("page",), buckets=(0.1, 1, 2.5))
+    for value in (0.05, 0.1, 0.5, 2.0, 10.0):
+        histogram.observe(value, "home")
+
+    assert _lines(registry, "latency_seconds") == [
+        f"# HELP {PREFIX}latency_seconds 耗时",
+        f"# TYPE {PREFIX}latency_seconds histogram",
+        f'{PREFIX}latency_seconds_bucket{{page="home",le="0.1"}} 2',
+        f'{PREFIX}latency_seconds_bucket{{page="home",le="1"}} 3',
+        f'{PREFIX}latency_seconds_bucket{{page="home",le="2.5"}} 4',
+        f'{PREFIX}latency_seconds_bucket{{page="home",le="+Inf"}} 5',
+        f'{PREFIX}latency_seconds_sum{{page="home"}} 12.65',
+        f'{PREFIX}latency_seconds_count{{page="home"}} 5',
+    ]
+
+
+def test_unlabeled_histogram_starts_empty():
+    registry = MetricsRegistry()
+    registry.histogram("idle_seconds", "空闲", buckets=(1,))
+    samples = _lines(registry, "idle_seconds")[2:]
+    assert samples == [
+        f'{PREFIX}idle_seconds_bucket{{le="1"}} 0',
+        f'{PREFIX}idle_seconds_bucket{{le="+Inf"}} 0',
+        f"{PREFIX}idle_seconds_sum 0",
+        f"{PREFIX}idle_seconds_count 0",
+    ]
+
+
+def test_gauge_and_collector():
+    registry = MetricsRegistry()
+    registry.gauge("startup_seconds", "启动耗时").set(1.25)
+
+    def collect():
+        return [("custom_items", "gauge", "自定义", [({"kind": "a"}, 7), ({}, math.inf)])]
+    registry.add_collector(collect)
+
+    text = registry.render()
+    assert text.endswith("\n")
+    assert f"{PREFIX}startup_seconds 1.25\n" in text
+    assert "# TYPE custom_items gauge\n" in text
+    assert 'custom_items{kind="a"} 7\n' in text
+    assert "custom_items +Inf\n" in text
+
+    registry.remove_collector(collect)
+    assert "custom_items" not in registry.render()
+
+
+def test_counter_sums_across_threads():
+    registry = MetricsRegistry()
+    counter = registry.counter("events_total", "事件数", ("kind",))
+
+    def work():
+        for _ in range(10000):
+            counter.inc("a")
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert counter.values() == {("a",): 80000}
+
+
+def test_server_serves_exposition():
+    registry = MetricsRegistry()
+    registry.counter("served_total", "抓取测试").inc()
+    server = MetricsServer(registry, port=0)
+    server.start()
+    try:
+        assert server.port != 0
+        with urllib.request.urlopen(server.url, timeout=5) as response:
+            assert response.status == 200
+            assert response.headers["Content-Type"].startswith("text/plain")
+            body = response.read().decode("utf-8")
+    finally:
+        server.stop()
+    assert f"{PREFIX}served_total 1\n" in body
+    assert not server.running
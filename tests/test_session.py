@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+会话录制与回放测试 - 按钮按对象名录制，换了界面语言也能回放，找不到按钮时回放失败
+"""
+
+import pytest
+from PySide6.QtCore import Qt
+from PySide6.QtTest import QTest
+
+from src.settings import settings, UI_LOCALE, LAST_PAGE
+from src.i18n.catalog import translator
+from src.perf.session import SessionRecorder, SessionPlayer, load_session, EVENT_CLICK
+
+
+@pytest.fixture
+def open_window(qapp, tmp_path, monkeypatch):
+    """按指定的界面语言创建并显示主窗口，测试结束时关闭"""
+    # 日志目录是相对路径，在临时目录中运行
+    monkeypatch.chdir(tmp_path)
+    windows = []
+
+    def open_window(locale):
+        from src.main_app import create_main_window
+        settings.set(UI_LOCALE, locale)
+        settings.set(LAST_PAGE, "home")
+        window, sidebar, content_manager = create_main_window()
+        window.show()
+        qapp.processEvents()
+        windows.append(window)
+        return window, sidebar, content_manager
+
+    yield open_window
+    for window in windows:
+        window.close()
+        window.deleteLater()
+    qapp.processEvents()
+    settings.reset(UI_LOCALE)
+    translator.set_locale(settings.get(UI_LOCALE))
+
+
+def test_recorded_clicks_replay_in_another_locale(open_window, tmp_path):
+    path = str(tmp_path / "session.jsonl.gz")
+    window, sidebar, content_manager = open_window("zh_CN")
+    recorder = SessionRecorder(path, window, sidebar, content_manager)
+    recorder.start()
+    home = content_manager.page("home")
+    QTest.mouseClick(home.clear_logs_button, Qt.MouseButton.LeftButton)
+    QTest.mouseClick(home.refresh_account_button, Qt.MouseButton.LeftButton)
+    recorder.stop()
+    window.close()
+
+    header, events = load_session(path)
+    clicks = [(event["button"], event["index"]) for event in events if event["type"] == EVENT_CLICK]
+    assert clicks == [("clear_logs_button", 0), ("refresh_account_button", 0)]
+
+    window, sidebar, content_manager = open_window("en")
+    assert content_manager.page("home").clear_logs_button.text() != "清空显示区域"
+    result = SessionPlayer(window, sidebar, content_manager, profile_paint=False).play(events, speed=0)
+    assert result.replayed == len(events)
+    assert result.skipped == 0
+
+
+def test_unresolved_button_fails_replay(open_window):
+    window, sidebar, content_manager = open_window("zh_CN")
+    player = SessionPlayer(window, sidebar, content_manager, profile_paint=False)
+    # 版本1的会话按显示文本录制按钮
+    events = [{"t": 0, "type": EVENT_CLICK, "page": "home", "button": "清空显示区域", "index": 0}]
+    with pytest.raises(ValueError):
+        player.play(events, speed=0)
@@ -0,0 +1,148 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+设置存储测试 - 类型检查、延迟合并写入、退出时写入和写入失败
+"""
+
+import json
+import time
+
+import pytest
+
+from src.settings import SettingsStore
+
+
+def _store(path, delay=0.05):
+    store = SettingsStore(str(path), delay=delay)
+    store.define("theme", str, "light", choices=("light", "dark"))
+    store.define("count", int, 0)
+    store.define("ratio", float, 1.0)
+    store.define("enabled", bool, False)
+    return store
+
+
+def _read(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def test_defaults_and_type_checks(tmp_path):
+    store = _store(tmp_path / "settings.json")
+    assert store.get("theme") == "light"
+    with pytest.raises(KeyError):
+        store.get("missing")
+    with pytest.raises(ValueError):
+        store.set("theme", "blue")
+    with pytest.raises(TypeError):
+        store.set("count", "1")
+    # bool 不算作 int
+    with pytest.raises(TypeError):
+        store.set("count", True)
+    # int 自动转换为 float
+    store.set("ratio", 2)
+    assert store.get("ratio") == 2.0 and isinstance(store.get("ratio"), float)
+
+
+def test_value_changed_only_on_change(tmp_path):
+    store = _store(tmp_path / "settings.json")
+    changes = []
+    store.value_changed.connect(lambda key, value: changes.append((key, value)))
+
+    assert store.set("theme", "dark")
+    assert not store.set("theme", "dark")
+    assert store.reset("theme")
+    assert changes == [("theme", "dark"), ("theme", "light")]
+    store.flush()
+
+
+def test_changes_are_debounced_into_one_write(tmp_path):
+    path = tmp_path / "settings.json"
+    store = _store(path, delay=0.2)
+
+    for count in range(1, 51):
+        store.set("count", count)
+    store.set("theme", "dark")
+    assert store.pending
+    assert store.write_count == 0
+
+    deadline = time.monotonic() + 5
+    while store.pending and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert store.write_count == 1
+    assert _read(path) == {"count": 50, "theme": "dark"}
+
+
+def test_flush_writes_immediately(tmp_path):
+    path = tmp_path / "settings.json"
+    # 延迟很长，只有 flush 才会写入
+    store = _store(path, delay=60)
+    store.set("enabled", True)
+
+    start = time.monotonic()
+    assert store.flush(timeout=5)
+    assert time.monotonic() - start < 5
+    assert not store.pending
+    assert store.write_count == 1
+    assert _read(path) == {"enabled": True}
+    # 没有修改时 flush 不写入
+    assert store.flush()
+    assert store.write_count == 1
+
+
+def test_load_drops_invalid_values_and_keeps_unknown_keys(tmp_path):
+    path = tmp_path / "settings.json"
+    path.write_text(json.dumps({"theme": "blue", "count": 3, "plugin.option": [1, 2]}), encoding="utf-8")
+
+    store = _store(path)
+    assert store.get("theme") == "light"
+    assert store.get("count") == 3
+
+    store.set("enabled", True)
+    assert store.flush()
+    assert _read(path) == {"count": 3, "plugin.option": [1, 2], "enabled": True}
+
+
+def test_define_after_load_validates_existing_value(tmp_path):
+    path = tmp_path / "settings.json"
+    path.write_text(json.dumps({"late": "x", "late_ok": 5}), encoding="utf-8")
+
+    store = _store(path)
+    store.load()
+    store.define("late", int, 1)
+    store.define("late_ok", int, 1)
+    assert store.get("late") == 1
+    assert store.get("late_ok") == 5
+
+
+def test_corrupt_file_falls_back_to_defaults(tmp_path):
+    path = tmp_path / "settings.json"
+    path.write_text("{not json", encoding="utf-8")
+
+    store = _store(path)
+    assert store.get("count") == 0
+
+
+def test_failed_write_is_reported(tmp_path, wait_until):
+    # 设置文件所在的目录不存在，写入失败
+    path = tmp_path / "missing" / "settings.json"
+    store = _store(path, delay=60)
+    errors = []
+    store.write_failed.connect(errors.append)
+
+    store.set("count", 1)
+    assert not store.flush(timeout=5)
+    assert isinstance(store.last_error, OSError)
+    # 信号在写入线程中发出，排队送到GUI线程
+    wait_until(lambda: errors)
+    assert len(errors) == 1
+    assert store.write_count == 0
+    # 没有新的修改时仍然报告未保存
+    assert not store.flush()
+
+    # 目录创建后下一次写入成功
+    path.parent.mkdir()
+    store.set("count", 2)
+    assert store.flush(timeout=5)
+    assert store.last_error is None
+    assert _read(path) == {"count": 2}